@@ -121,10 +121,10 @@
                        NonSquareMatrixError, ShapeError, SparseMatrix, Trace,
                        Transpose, ZeroMatrix, block_collapse, blockcut,
                        casoratian, det, diag, eye, hadamard_product, hessian,
-                       jordan_cell, list2numpy, matrix2numpy,
-                       matrix_multiply_elementwise, ones, randMatrix,
-                       rot_axis1, rot_axis2, rot_axis3, symarray, trace,
-                       vandermonde, wronskian, zeros)
+                       jordan_cell, lambdify_matrix, list2numpy,
+                       matrix2numpy, matrix_multiply_elementwise, ones,
+                       randMatrix, rot_axis1, rot_axis2, rot_axis3, symarray,
+                       trace, vandermonde, wronskian, zeros)
 from .geometry import (Circle, Curve, Ellipse, GeometryError, Line,
                        Point, Polygon, Ray,
                        RegularPolygon, Segment, Triangle,
@@ -272,7 +272,8 @@
     'MutableSparseMatrix', 'NonSquareMatrixError', 'ShapeError', 'SparseMatrix',
     'Trace', 'Transpose', 'ZeroMatrix', 'block_collapse', 'blockcut',
     'casoratian', 'det', 'diag', 'eye', 'hadamard_product', 'hessian',
-    'jordan_cell', 'list2numpy', 'matrix2numpy', 'matrix_multiply_elementwise',
+    'jordan_cell', 'lambdify_matrix', 'list2numpy', 'matrix2numpy',
+    'matrix_multiply_elementwise',
     'ones', 'randMatrix', 'rot_axis1', 'rot_axis2', 'rot_axis3', 'symarray',
     'trace', 'vandermonde', 'wronskian', 'zeros', 'Circle', 'Curve', 'Ellipse',
     'GeometryError', 'Line', 'Point',
@@ -14,6 +14,8 @@ class Add(AssocOp):
 
     is_Add = True
 
+    _intern = True
+
     identity = Integer(0)
 
     @classmethod
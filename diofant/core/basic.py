@@ -5,6 +5,7 @@
 from itertools import zip_longest
 
 from ..utilities import ordered
+from . import cache
 from .cache import cacheit
 from .compatibility import iterable
 from .decorators import _sympifyit
@@ -46,11 +47,29 @@ class Basic:
     is_MatMul = False
     is_Vector = False
 
+    # instances are interned (see set_interning()), if this flag is set
+    # in the class dictionary; it's not inherited, as subclasses could
+    # keep state outside of args or reinitialize existing instances
+    _intern = True
+
     def __new__(cls, *args):
+        table, key = cache.INTERNED, None
+        if table is not None and cls.__dict__.get('_intern'):
+            key = cls, args
+            try:
+                return table[key]
+            except KeyError:
+                pass
+            except TypeError:
+                key = None
+
         obj = object.__new__(cls)
         obj._hash = None  # will be set by __hash__ method.
 
         obj._args = args  # all items in args must be Basic objects
+
+        if key is not None:
+            table[key] = obj
         return obj
 
     def copy(self):
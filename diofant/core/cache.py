@@ -1,7 +1,12 @@
 """Caching facility for Diofant."""
 
+import collections
 import functools
 import os
+import sys
+import threading
+import time
+import weakref
 
 from .evaluate import global_evaluate
 
@@ -22,14 +27,215 @@ def clear_cache():
         item.cache_clear()
 
 
+def cache_stats():
+    """Return statistics for all caches.
+
+    Result is a dictionary, which maps full names of cached functions
+    to dictionaries of their statistics (see ``cache_stats()`` method
+    of cached functions in :func:`cacheit`), sorted by estimated time
+    saved (descending).  It contains only builtin types and could be
+    serialized, e.g. with :func:`json.dumps`.
+
+    Examples
+    ========
+
+    >>> from diofant.core.cache import cache_stats
+
+    >>> stats = cache_stats()
+    >>> sorted(stats['diofant.core.power.Pow.__new__'])
+    ['bypassed', 'bytes', 'currsize', 'hits', 'maxsize', 'misses',
+     'time', 'time_saved', 'unhashable']
+
+    """
+    stats = {f'{item.__module__}.{item.__qualname__}': item.cache_stats()
+             for item in CACHE}
+    return dict(sorted(stats.items(), key=lambda i: -i[1]['time_saved']))
+
+
 USE_CACHE = os.getenv('DIOFANT_USE_CACHE', 'True') == 'True'
 
 
+def _parse_size(value):
+    if value in (None, 'None', ''):
+        return
+    value = int(value)
+    if value < 0:
+        raise ValueError(f'cache size must be nonnegative, got {value}')
+    return value
+
+
+# global limit on the number of entries, held by all caches
+CACHE_SIZE = _parse_size(os.getenv('DIOFANT_CACHE_SIZE', 'None'))
+
+_CacheInfo = collections.namedtuple('CacheInfo',
+                                    ['hits', 'misses', 'maxsize', 'currsize'])
+
+# recency order of entries across all bounded caches
+_LRU = collections.OrderedDict()
+_LRU_LOCK = threading.RLock()
+
+
+class _BoundedCache:
+    """LRU cache, which entries are also subject to the global budget.
+
+    Entries of all such caches are kept in a common recency order, so
+    once the total number of entries exceeds ``CACHE_SIZE`` - least
+    recently used entry is evicted, no matter which cache holds it.
+
+    """
+
+    def __init__(self, func, maxsize):
+        self.func = func
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.hits = self.misses = 0
+
+    def __call__(self, *args, **kwargs):
+        key = functools._make_key(args, kwargs, True)
+        with _LRU_LOCK:
+            try:
+                result = self.entries[key]
+            except KeyError:
+                pass
+            else:
+                self.entries.move_to_end(key)
+                _LRU.move_to_end((self, key))
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = self.func(*args, **kwargs)
+
+        with _LRU_LOCK:
+            if key not in self.entries:
+                self.entries[key] = result
+                _LRU[(self, key)] = None
+                if self.maxsize is not None:
+                    while len(self.entries) > self.maxsize:
+                        old, _ = self.entries.popitem(last=False)
+                        del _LRU[(self, old)]
+                while len(_LRU) > CACHE_SIZE:
+                    (cache, old), _ = _LRU.popitem(last=False)
+                    del cache.entries[old]
+        return result
+
+    def cache_info(self):
+        return _CacheInfo(self.hits, self.misses, self.maxsize,
+                          len(self.entries))
+
+    def cache_clear(self):
+        with _LRU_LOCK:
+            for key in self.entries:
+                del _LRU[(self, key)]
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+
+def _make_cache(func, maxsize):
+    if CACHE_SIZE is None:
+        return functools.lru_cache(maxsize=maxsize, typed=True)(func)
+    return _BoundedCache(func, maxsize)
+
+
+def set_cache_size(size):
+    """Set global limit on the number of cached entries.
+
+    Once the total number of entries, held by all caches, exceeds the
+    ``size`` - least recently used entries are evicted.  The ``None``
+    value means no limit.  Initial value could be set by the
+    ``DIOFANT_CACHE_SIZE`` environment variable.
+
+    Content of all caches is dropped.
+
+    Examples
+    ========
+
+    >>> from diofant.core.cache import set_cache_size
+
+    >>> set_cache_size(10000)
+    >>> set_cache_size(None)
+
+    """
+    global CACHE_SIZE
+
+    size = _parse_size(size)
+    with _LRU_LOCK:
+        CACHE_SIZE = size
+        for item in CACHE:
+            item.cache_resize(item.cache_info().maxsize)
+        _LRU.clear()
+
+
+# interning table for Basic instances, see set_interning()
+INTERNED = (weakref.WeakValueDictionary()
+            if os.getenv('DIOFANT_USE_INTERN', 'False') == 'True' else None)
+
+
+def set_interning(flag):
+    """Turn on or off interning (hash-consing) of Basic instances.
+
+    If enabled, instances of :class:`~diofant.core.basic.Basic` subclasses,
+    which opt in by setting the ``_intern`` flag in the class body (e.g.
+    :class:`~diofant.core.add.Add`, :class:`~diofant.core.mul.Mul` and
+    :class:`~diofant.core.power.Pow`), are looked up in the global table,
+    keyed on the class and arguments, before creation.  Thus,
+    structurally equal expressions, built independently, are represented
+    by the same object and the table holds only weak references to them.
+    The flag isn't inherited, so constructors of subclasses, that keep
+    state outside of arguments, never reinitialize shared instances.
+    Interning is disabled by default, initial state could be changed by
+    the ``DIOFANT_USE_INTERN`` environment variable.
+
+    Examples
+    ========
+
+    >>> from diofant.core.cache import set_interning
+
+    >>> set_interning(True)
+    >>> Add(x, y, evaluate=False) is Add(x, y, evaluate=False)
+    True
+    >>> set_interning(False)
+    >>> Add(x, y, evaluate=False) is Add(x, y, evaluate=False)
+    False
+
+    """
+    global INTERNED
+
+    if flag:
+        if INTERNED is None:
+            INTERNED = weakref.WeakValueDictionary()
+    else:
+        INTERNED = None
+
+
 def cacheit(f, maxsize=None):
     """Caching decorator.
 
     The result of cached function must be *immutable*.
 
+    Each cached function has ``cache_info()`` and ``cache_clear()``
+    methods, like for :func:`functools.lru_cache`.  The ``maxsize`` of
+    the cache could be changed by the ``cache_resize()`` method (the
+    ``None`` value means unbounded cache), see also
+    :func:`set_cache_size` for the global limit.
+
+    The ``cache_stats()`` method returns a dictionary with keys:
+
+    * ``hits``, ``misses``, ``maxsize`` and ``currsize`` - as for
+      ``cache_info()``,
+    * ``unhashable`` - number of calls, for which arguments were
+      unhashable (these calls are not cached),
+    * ``bypassed`` - number of calls, that weren't cached due to the
+      disabled evaluation (``evaluate=False``),
+    * ``time`` - total time (in seconds), spent on cache misses,
+    * ``time_saved`` - estimated time, saved on cache hits, and
+    * ``bytes`` - rough estimate of memory size of cached results (it
+      uses the shallow size, as given by :func:`sys.getsizeof`, i.e.
+      objects, referenced by results, aren't counted).
+
+    Statistics are updated under a lock, so they are consistent for
+    calls from different threads.
+
     Examples
     ========
 
@@ -42,21 +248,75 @@ def cacheit(f, maxsize=None):
     x + y
     >>> f(x, y)
     x + y
+    >>> f.cache_resize(1)
+    >>> f.cache_info().maxsize
+    1
 
     """
     if USE_CACHE:
-        cfunc = functools.lru_cache(maxsize=maxsize, typed=True)(f)
+        stats = dict.fromkeys(['unhashable', 'bypassed', 'time', 'bytes'], 0)
+        stats_lock = threading.Lock()
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = f(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            size = sys.getsizeof(result)
+            with stats_lock:
+                stats['time'] += elapsed
+                stats['bytes'] += size
+            return result
+
+        cfunc = _make_cache(timed, maxsize)
 
         def wrapper(*args, **kwargs):
-            try:
-                if global_evaluate[0] and kwargs.get('evaluate', True):
+            if global_evaluate[0] and kwargs.get('evaluate', True):
+                try:
                     return cfunc(*args, **kwargs)
-            except TypeError:
-                pass
+                except TypeError:
+                    # distinguish unhashable arguments from errors in f
+                    try:
+                        hash(args)
+                        hash(tuple(kwargs.items()))
+                    except TypeError:
+                        key = 'unhashable'
+                    else:
+                        raise
+            else:
+                key = 'bypassed'
+            with stats_lock:
+                stats[key] += 1
             return f(*args, **kwargs)
 
-        wrapper.cache_info = cfunc.cache_info
-        wrapper.cache_clear = cfunc.cache_clear
+        def cache_info():
+            return cfunc.cache_info()
+
+        def cache_clear():
+            cfunc.cache_clear()
+            with stats_lock:
+                for k in stats:
+                    stats[k] = 0
+
+        def cache_resize(maxsize):
+            nonlocal cfunc
+            maxsize = _parse_size(maxsize)
+            with _LRU_LOCK:
+                cache_clear()
+                cfunc = _make_cache(timed, maxsize)
+
+        def cache_stats():
+            info = cfunc.cache_info()
+            misses = max(info.misses, 1)
+            with stats_lock:
+                result = dict(stats)
+            return {**info._asdict(), **result,
+                    'time_saved': info.hits*result['time']/misses,
+                    'bytes': info.currsize*result['bytes']//misses}
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_resize = cache_resize
+        wrapper.cache_stats = cache_stats
         functools.update_wrapper(wrapper, f)
 
         CACHE.append(wrapper)
@@ -32,7 +32,8 @@ class Expr(Basic, EvalfMixin, metaclass=ManagedProperties):
 
     def __new__(cls, *args):
         obj = Basic.__new__(cls, *args)
-        obj._assumptions = cls.default_assumptions
+        if '_assumptions' not in obj.__dict__:  # not an interned instance
+            obj._assumptions = cls.default_assumptions
         return obj
 
     @property
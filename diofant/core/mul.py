@@ -82,6 +82,8 @@ class Mul(AssocOp):
 
     is_Mul = True
 
+    _intern = True
+
     identity = S.One
 
     @classmethod
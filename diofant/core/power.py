@@ -186,6 +186,8 @@ class Pow(Expr):
 
     is_Pow = True
 
+    _intern = True
+
     @cacheit
     def __new__(cls, b, e, evaluate=None):
         if evaluate is None:
@@ -4,10 +4,11 @@
 matrix, etc.
 """
 from .dense import (GramSchmidt, MutableDenseMatrix, MutableMatrix, casoratian,
-                    diag, eye, hessian, jordan_cell, list2numpy, matrix2numpy,
-                    matrix_multiply_elementwise, ones, randMatrix, rot_axis1,
-                    rot_axis2, rot_axis3, symarray, vandermonde, wronskian,
-                    zeros)
+                    diag, eye, hessian, jordan_cell, lambdify_matrix,
+                    list2numpy, matrix2numpy, matrix_multiply_elementwise,
+                    ones, randMatrix, rot_axis1, rot_axis2, rot_axis3,
+                    symarray, vandermonde, wronskian, zeros)
+from .domainmatrix import DomainMatrix
 from .expressions import (Adjoint, BlockDiagMatrix, BlockMatrix, Determinant,
                           DiagonalMatrix, DiagonalOf, FunctionMatrix,
                           HadamardProduct, Identity, Inverse, MatAdd, MatMul,
@@ -16,6 +17,7 @@
                           hadamard_product, trace)
 from .immutable import (ImmutableDenseMatrix, ImmutableMatrix,
                         ImmutableSparseMatrix)
+from .lll import bkz, lll
 from .matrices import MatrixBase, NonSquareMatrixError, ShapeError
 from .sparse import MutableSparseMatrix, SparseMatrix
 
@@ -24,7 +26,7 @@
 
 
 __all__ = ('GramSchmidt', 'MutableDenseMatrix', 'MutableMatrix', 'casoratian',
-           'diag', 'eye', 'hessian', 'jordan_cell', 'list2numpy',
+           'diag', 'eye', 'hessian', 'jordan_cell', 'lambdify_matrix', 'list2numpy',
            'matrix2numpy', 'matrix_multiply_elementwise', 'ones', 'randMatrix',
            'rot_axis1', 'rot_axis2', 'rot_axis3', 'symarray', 'vandermonde',
            'wronskian', 'zeros', 'Adjoint', 'BlockDiagMatrix', 'BlockMatrix',
@@ -35,4 +37,4 @@
            'hadamard_product', 'trace', 'ImmutableDenseMatrix',
            'ImmutableMatrix', 'ImmutableSparseMatrix', 'MatrixBase',
            'NonSquareMatrixError', 'ShapeError', 'MutableSparseMatrix',
-           'SparseMatrix', 'Matrix')
+           'SparseMatrix', 'Matrix', 'bkz', 'lll', 'DomainMatrix')
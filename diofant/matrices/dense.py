@@ -862,7 +862,7 @@ def fill(self, value):
 
 ###########
 # Numpy Utility Functions:
-# list2numpy, matrix2numpy, symmarray, rot_axis[123]
+# list2numpy, matrix2numpy, lambdify_matrix, symmarray, rot_axis[123]
 ###########
 
 
@@ -899,6 +899,71 @@ def matrix2numpy(m, dtype=object):  # pragma: no cover
     return a
 
 
+@doctest_depends_on(modules=('numpy',))
+def lambdify_matrix(args, m, dtype=float):
+    """Return a function, that evaluates the matrix ``m`` to a NumPy array.
+
+    Common subexpressions of all entries are eliminated once, see
+    :func:`~diofant.simplify.cse_main.cse`, and the whole matrix is
+    compiled to a single function of ``args``.  Values of arguments
+    could be NumPy arrays (broadcasted against each other): for
+    arguments of shape ``s`` the result has shape ``s + m.shape``.
+
+    Examples
+    ========
+
+    >>> M = Matrix([[sin(x)**2, x*y], [0, sin(x)]])
+    >>> f = lambdify_matrix((x, y), M)
+    >>> f(0, 2).tolist()
+    [[0.0, 0.0], [0.0, 0.0]]
+    >>> f([0, 1, 2], 2).shape
+    (3, 2, 2)
+
+    See Also
+    ========
+
+    diofant.utilities.lambdify.lambdify
+    matrix2numpy
+
+    """
+    import numpy
+
+    from ..core import Dummy
+    from ..printing.lambdarepr import NumPyPrinter
+    from ..simplify import cse
+    from ..utilities.lambdify import _get_namespace
+
+    if not is_sequence(args):
+        args = args,
+    dummies = [Dummy(f'a{i}') for i in range(len(args))]
+    exprs = [sympify(e).xreplace(dict(zip(args, dummies))) for e in m]
+    replacements, reduced = cse(exprs, symbols=numbered_symbols('c', cls=Dummy))
+
+    printer = NumPyPrinter()
+    names = [printer.doprint(d) for d in dummies]
+    lines = [f"def _matrix(_out, {', '.join(names)}):"]
+    for sym, expr in replacements:
+        lines.append(f'    {printer.doprint(sym)} = {printer.doprint(expr)}')
+    for k, expr in enumerate(reduced):
+        if expr:
+            i, j = divmod(k, m.cols)
+            lines.append(f'    _out[..., {i}, {j}] = {printer.doprint(expr)}')
+    lines.append('    return _out')
+
+    namespace = dict(_get_namespace('numpy'))
+    exec('\n'.join(lines), namespace)
+    func = namespace['_matrix']
+
+    def wrapper(*vals):
+        vals = [numpy.asarray(v) for v in vals]
+        shape = ()
+        for v in vals:
+            shape = numpy.broadcast(numpy.broadcast_to(0, shape), v).shape
+        return func(numpy.zeros(shape + m.shape, dtype=dtype), *vals)
+
+    return wrapper
+
+
 @doctest_depends_on(modules=('numpy',))
 def symarray(prefix, shape, **kwargs):  # pragma: no cover
     r"""Create a numpy ndarray of symbols (as an object array).
@@ -0,0 +1,799 @@
+"""Dense matrices with elements of a domain."""
+
+import functools
+import itertools
+import math
+import operator
+import random
+
+from ..domains import QQ, ZZ
+from ..external import import_module
+from ..ntheory import prevprime
+from ..polys.constructor import construct_domain
+from ..polys.galoistools import GFMatrix
+from ..polys.polyconfig import process_pool, query
+from ..polys.polyerrors import PolynomialError
+from .dense import _iszero as _dense_iszero
+from .matrices import MatrixBase, NonSquareMatrixError, ShapeError, _iszero
+
+
+class DomainMatrix:
+    r"""
+    Dense matrix with elements of the given domain.
+
+    Unlike :class:`~diofant.matrices.dense.MutableDenseMatrix`, elements
+    are raw domain elements (e.g. ground type integers for
+    :class:`~diofant.domains.IntegerRing`), no simplification or zero
+    testing of expressions is involved.  Over integers and rationals,
+    the elimination is fraction-free.
+
+    Parameters
+    ==========
+
+    rows : list
+        List of rows, which are lists of elements of ``domain``.
+    shape : tuple
+        Number of rows and columns.
+    domain : Domain
+        Domain of matrix elements.
+
+    Examples
+    ========
+
+    >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+    >>> A = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    >>> A
+    DomainMatrix([[1, 2], [3, 4]], (2, 2), ZZ)
+    >>> A.det()
+    -2
+    >>> A.inv().to_Matrix()
+    Matrix([
+    [ -2,    1],
+    [3/2, -1/2]])
+    >>> A.charpoly()
+    [1, -5, -2]
+
+    """
+
+    def __init__(self, rows, shape, domain):
+        if len(rows) != shape[0] or any(len(row) != shape[1] for row in rows):
+            raise ShapeError('rows do not match the shape')
+
+        self.rows = rows
+        self.shape = shape
+        self.domain = domain
+
+    @classmethod
+    def from_Matrix(cls, M, domain=None, **options):
+        """Convert :class:`~diofant.matrices.matrices.MatrixBase` instance.
+
+        If ``domain`` is not specified, it's constructed from matrix
+        entries, see :func:`~diofant.polys.constructor.construct_domain`.
+
+        Examples
+        ========
+
+        >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+        >>> DomainMatrix.from_Matrix(Matrix([[1, x], [2, 3]])).domain
+        ZZ[x]
+
+        """
+        m, n = M.shape
+        if domain is None:
+            domain, elems = construct_domain(list(M), **options)
+        else:
+            elems = list(map(domain.convert, M))
+        return cls([elems[i*n:i*n + n] for i in range(m)], (m, n), domain)
+
+    def to_Matrix(self):
+        """Convert to :class:`~diofant.matrices.dense.MutableDenseMatrix`."""
+        from . import Matrix
+
+        to_expr = self.domain.to_expr
+        return Matrix(*self.shape, [to_expr(e) for row in self.rows for e in row])
+
+    def convert_to(self, domain):
+        """Return the matrix with elements, converted to ``domain``."""
+        if domain == self.domain:
+            return self.copy()
+        convert = functools.partial(domain.convert, base=self.domain)
+        return self.__class__([list(map(convert, row)) for row in self.rows],
+                              self.shape, domain)
+
+    def to_field(self):
+        """Return the matrix over the field of fractions of the domain."""
+        return self.convert_to(self.domain.field)
+
+    @classmethod
+    def zeros(cls, shape, domain):
+        """Return zero matrix of given shape."""
+        m, n = shape
+        return cls([[domain.zero]*n for _ in range(m)], shape, domain)
+
+    @classmethod
+    def eye(cls, n, domain):
+        """Return identity matrix of size ``n``."""
+        M = cls.zeros((n, n), domain)
+        for i in range(n):
+            M.rows[i][i] = domain.one
+        return M
+
+    def copy(self):
+        return self.__class__([row[:] for row in self.rows], self.shape,
+                              self.domain)
+
+    @property
+    def is_square(self):
+        return self.shape[0] == self.shape[1]
+
+    def __repr__(self):
+        rows = [[str(e) for e in row] for row in self.rows]
+        rows = '[' + ', '.join('[' + ', '.join(row) + ']' for row in rows) + ']'
+        return f'{self.__class__.__name__}({rows}, {self.shape}, {self.domain})'
+
+    def __eq__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        return (self.shape == other.shape and self.domain == other.domain and
+                self.rows == other.rows)
+
+    def __getitem__(self, key):
+        i, j = key
+        return self.rows[i][j]
+
+    def _unify(self, other):
+        if self.domain == other.domain:
+            return self, other
+        domain = self.domain.unify(other.domain)
+        return self.convert_to(domain), other.convert_to(domain)
+
+    def __add__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ShapeError('Matrix size mismatch.')
+        A, B = self._unify(other)
+        return A.__class__([list(map(operator.add, a, b))
+                            for a, b in zip(A.rows, B.rows)], A.shape, A.domain)
+
+    def __neg__(self):
+        return self.__class__([list(map(operator.neg, row)) for row in self.rows],
+                              self.shape, self.domain)
+
+    def __sub__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        return self + (-other)
+
+    def __mul__(self, other):
+        if not isinstance(other, DomainMatrix):
+            c = self.domain.convert(other)
+            return self.__class__([[e*c for e in row] for row in self.rows],
+                                  self.shape, self.domain)
+        if self.shape[1] != other.shape[0]:
+            raise ShapeError('Matrix size mismatch.')
+        A, B = self._unify(other)
+        domain = A.domain
+        (m, _), n = A.shape, B.shape[1]
+        cutoff = query('STRASSEN_CUTOFF') if domain.is_Exact else math.inf
+        if domain.is_IntegerRing and max((abs(int(e)) for M in (A, B)
+                                          for row in M.rows for e in row),
+                                         default=0).bit_length() < 64:
+            # the classical product of word-size integers is faster
+            cutoff = math.inf
+        workers = query('MATRIX_WORKERS')
+        if workers > 1 and m >= 2*workers:
+            # compute blocks of rows in parallel
+            step = -(-m//workers)
+            blocks = [A.rows[i:i + step] for i in range(0, m, step)]
+            with process_pool(workers) as pool:
+                blocks = pool.map(_matmul, blocks,
+                                  *map(itertools.repeat, (B.rows, n,
+                                                          domain.zero, cutoff)))
+                rows = [row for block in blocks for row in block]
+        else:
+            rows = _matmul(A.rows, B.rows, n, domain.zero, cutoff)
+        return A.__class__(rows, (m, n), domain)
+
+    def __rmul__(self, other):
+        return self*other
+
+    def __pow__(self, n):
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        if n < 0:
+            return self.inv()**-n
+        result, M = self.eye(self.shape[0], self.domain), self
+        while n:
+            if n & 1:
+                result *= M
+            n >>= 1
+            if n:
+                M *= M
+        return result
+
+    def transpose(self):
+        """Return transposed matrix."""
+        return self.__class__([list(col) for col in zip(*self.rows)],
+                              self.shape[::-1], self.domain)
+
+    T = property(transpose)
+
+    def hstack(self, *others):
+        """Return horizontally stacked matrices."""
+        A = self
+        for B in others:
+            if A.shape[0] != B.shape[0]:
+                raise ShapeError('Matrix size mismatch.')
+            A, B = A._unify(B)
+            A = A.__class__([a + b for a, b in zip(A.rows, B.rows)],
+                            (A.shape[0], A.shape[1] + B.shape[1]), A.domain)
+        return A
+
+    def _clear_denoms(self):
+        # return integer matrix with rows, multiplied by common
+        # denominators of their elements and the list of denominators
+        rows, denoms = [], []
+        for row in self.rows:
+            d = functools.reduce(ZZ.lcm, (ZZ.convert(e.denominator)
+                                          for e in row), ZZ.one)
+            rows.append([ZZ.convert(e.numerator)*(d//ZZ.convert(e.denominator))
+                         for e in row])
+            denoms.append(d)
+        return self.__class__(rows, self.shape, ZZ), denoms
+
+    def _rref_ff(self):
+        # fraction-free Gauss-Jordan elimination over integral domain,
+        # returns rows (with all pivots equal to the denominator),
+        # the denominator and pivots
+        domain = self.domain
+        exquo = domain.exquo
+        M = [row[:] for row in self.rows]
+        m, n = self.shape
+        prev = domain.one
+        pivots = []
+        r = 0
+        for j in range(n):
+            if r == m:
+                break
+            for i in range(r, m):
+                if M[i][j]:
+                    break
+            else:
+                continue
+            M[r], M[i] = M[i], M[r]
+            pr, piv = M[r], M[r][j]
+            for i in range(m):
+                if i != r:
+                    row, a = M[i], M[i][j]
+                    if a:
+                        M[i] = [exquo(piv*x - a*y, prev) for x, y in zip(row, pr)]
+                    elif piv != prev:
+                        M[i] = [exquo(piv*x, prev) for x in row]
+            prev = piv
+            pivots.append(j)
+            r += 1
+        return M, prev, pivots
+
+    def _rref_field(self):
+        domain = self.domain
+        M = [row[:] for row in self.rows]
+        m, n = self.shape
+        pivots = []
+        r = 0
+        for j in range(n):
+            if r == m:
+                break
+            for i in range(r, m):
+                if M[i][j]:
+                    break
+            else:
+                continue
+            M[r], M[i] = M[i], M[r]
+            inv = domain.one/M[r][j]
+            pr = M[r] = [e*inv for e in M[r]]
+            for i in range(m):
+                a = M[i][j]
+                if i != r and a:
+                    M[i] = [x - a*y for x, y in zip(M[i], pr)]
+            pivots.append(j)
+            r += 1
+        return M, pivots
+
+    def rref(self):
+        """Return reduced row echelon form and the list of pivots.
+
+        The result is over the field of fractions of the domain.  Over
+        integers and rationals, the fraction-free Gauss-Jordan
+        elimination is used.
+
+        Examples
+        ========
+
+        >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+        >>> A = DomainMatrix.from_Matrix(Matrix([[1, 2, 3], [2, 4, 7]]))
+        >>> A.rref()
+        (DomainMatrix([[1, 2, 0], [0, 0, 1]], (2, 3), QQ), [0, 2])
+
+        References
+        ==========
+
+        * :cite:`Nakos1997fractionfree`
+
+        """
+        domain = self.domain
+        if domain.is_IntegerRing or domain.is_RationalField:
+            A = self._clear_denoms()[0] if domain.is_RationalField else self
+            M, den, pivots = A._rref_ff()
+            field = domain.field
+            den = field.convert(den, ZZ)
+            M = [[field.convert(e, ZZ)/den for e in row] for row in M]
+        else:
+            A = self if domain.is_Field else self.to_field()
+            M, pivots = A._rref_field()
+            field = A.domain
+        return self.__class__(M, self.shape, field), pivots
+
+    def rank(self):
+        """Return the rank of the matrix.
+
+        For large enough integer and rational matrices, ranks of
+        modular images are computed for a set of primes, which product
+        exceeds the Hadamard bound for minors.
+
+        """
+        domain = self.domain
+        if domain.is_RationalField:
+            return self._clear_denoms()[0].rank()
+        if (domain.is_IntegerRing and
+                min(self.shape) >= query('MODULAR_LINALG_CUTOFF')):
+            return self._rank_modular()
+        if domain.is_Field:
+            return len(self._rref_field()[1])
+        return len(self._rref_ff()[2])
+
+    def _rank_modular(self):
+        rows, full = self.rows, min(self.shape)
+        bound = _hadamard_bound(rows)
+        rank, m = 0, 1
+        for p in _primes():
+            if m > bound or rank == full:
+                break
+            rank = max(rank, _reduce(rows, p).rank())
+            m *= p
+        return rank
+
+    def nullspace(self):
+        """Return matrix, which rows form a basis of the nullspace.
+
+        Examples
+        ========
+
+        >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+        >>> A = DomainMatrix.from_Matrix(Matrix([[1, 2, 3], [2, 4, 7]]))
+        >>> A.nullspace()
+        DomainMatrix([[-2, 1, 0]], (1, 3), QQ)
+
+        """
+        R, pivots = self.rref()
+        field = R.domain
+        n = self.shape[1]
+        free = [j for j in range(n) if j not in pivots]
+        basis = []
+        for j in free:
+            v = [field.zero]*n
+            v[j] = field.one
+            for row, k in zip(R.rows, pivots):
+                v[k] = -row[j]
+            basis.append(v)
+        return self.__class__(basis, (len(basis), n), field)
+
+    def _det_modular(self):
+        rows, n = self.rows, self.shape[0]
+
+        # the denominator of a solution of A*x = b divides det(A), thus
+        # only few primes are usually necessary to recover the cofactor
+        b = [[ZZ(random.randint(-n, n))] for _ in range(n)]
+        x = self.hstack(self.__class__(b, (n, 1), ZZ))._solve_dixon(n)
+        if x is None:
+            return ZZ.zero
+        d = functools.reduce(ZZ.lcm, (ZZ.convert(e.denominator)
+                                      for row in x.rows for e in row), ZZ.one)
+
+        bound = 2*_hadamard_bound(rows)//d
+        det, m = 0, 1
+        for p in _primes():
+            if m > bound:
+                break
+            if not d % p:
+                continue
+            c = _reduce(rows, p).det()*pow(int(d % p), p - 2, p) % p
+            det += m*((c - det)*pow(m, p - 2, p) % p)
+            m *= p
+        return ZZ(det - m if det > m//2 else det)*d
+
+    def det(self):
+        """Return the determinant.
+
+        Over integral domains, the fraction-free Bareiss' algorithm
+        is used.  Rational matrices are converted to integer ones.  For
+        large enough integer matrices, a divisor of the determinant
+        is found as the denominator of a solution of the linear system,
+        see :meth:`solve`.  The cofactor is recovered from modular
+        images by the Chinese remainder theorem, with the number of
+        primes, given by the Hadamard bound.
+
+        Examples
+        ========
+
+        >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+        >>> A = DomainMatrix.from_Matrix(Matrix([[x, 1], [1, x]]))
+        >>> A.det()
+        x**2 - 1
+
+        References
+        ==========
+
+        * :cite:`Bareiss1968sylvester`
+        * :cite:`Abbott1999fast`
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+
+        domain = self.domain
+        n = self.shape[0]
+
+        if domain.is_RationalField:
+            A, denoms = self._clear_denoms()
+            d = functools.reduce(operator.mul, denoms, ZZ.one)
+            return domain.convert(A.det(), ZZ)/domain.convert(d, ZZ)
+
+        if domain.is_IntegerRing and n >= query('MODULAR_DET_CUTOFF'):
+            return self._det_modular()
+
+        M = [row[:] for row in self.rows]
+        sign = 1
+
+        if domain.is_Field:
+            det = domain.one
+            for k in range(n):
+                for i in range(k, n):
+                    if M[i][k]:
+                        break
+                else:
+                    return domain.zero
+                if i != k:
+                    M[i], M[k] = M[k], M[i]
+                    sign = -sign
+                pr = M[k]
+                det *= pr[k]
+                inv = domain.one/pr[k]
+                for i in range(k + 1, n):
+                    c = M[i][k]*inv
+                    if c:
+                        M[i] = [x - c*y for x, y in zip(M[i], pr)]
+            return det if sign > 0 else -det
+
+        exquo = domain.exquo
+        prev = domain.one
+        for k in range(n - 1):
+            for i in range(k, n):
+                if M[i][k]:
+                    break
+            else:
+                return domain.zero
+            if i != k:
+                M[i], M[k] = M[k], M[i]
+                sign = -sign
+            pr, piv = M[k], M[k][k]
+            for i in range(k + 1, n):
+                a = M[i][k]
+                M[i] = [exquo(piv*x - a*y, prev)
+                        for x, y in zip(M[i][k + 1:], pr[k + 1:])]
+                M[i][:0] = [domain.zero]*(k + 1)
+            prev = piv
+        det = M[n - 1][n - 1] if n else domain.one
+        return det if sign > 0 else -det
+
+    def charpoly(self):
+        """Return coefficients of the characteristic polynomial.
+
+        Coefficients of ``det(x*I - self)`` are listed in the order of
+        decreasing degree.  The division-free Berkowitz algorithm is
+        used.
+
+        Examples
+        ========
+
+        >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+        >>> DomainMatrix.from_Matrix(Matrix([[1, 3], [2, 0]])).charpoly()
+        [1, -1, -6]
+
+        References
+        ==========
+
+        * :cite:`Berkowitz1984computing`
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+
+        domain = self.domain
+
+        if domain.is_RationalField:
+            d = functools.reduce(ZZ.lcm, (ZZ.convert(e.denominator)
+                                          for row in self.rows for e in row),
+                                 ZZ.one)
+            A = self*d
+            A = A.__class__([[ZZ.convert(e.numerator) for e in row]
+                             for row in A.rows], A.shape, ZZ)
+            d, cp = domain.convert(d, ZZ), []
+            for i, c in enumerate(A.charpoly()):
+                cp.append(domain.convert(c, ZZ)/d**i)
+            return cp
+
+        zero = domain.zero
+        M, n = self.rows, self.shape[0]
+
+        cp = [domain.one]
+        for k in range(n):
+            A = [row[:k] for row in M[:k]]
+            R = M[k][:k]
+            C = [row[k] for row in M[:k]]
+            t = [domain.one, -M[k][k]]
+            for _ in range(k):
+                t.append(-sum(map(operator.mul, R, C), zero))
+                C = [sum(map(operator.mul, row, C), zero) for row in A]
+            cp = [sum((t[i - j]*cp[j]
+                       for j in range(max(i - k - 1, 0), min(i, k) + 1)), zero)
+                  for i in range(k + 2)]
+        return cp
+
+    def inv(self):
+        """Return the inverse matrix over the field of fractions.
+
+        Raises
+        ======
+
+        ValueError
+            If the determinant of the matrix is zero.
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+
+        n = self.shape[0]
+        R, pivots = self.hstack(self.eye(n, self.domain)).rref()
+        if pivots[:n] != list(range(n)):
+            raise ValueError('Matrix det == 0; not invertible.')
+        return self.__class__([row[n:] for row in R.rows], self.shape, R.domain)
+
+    def _solve_dixon(self, n):
+        # solve A*x = b for augmented integer matrix [A|b] with the
+        # Dixon's p-adic lifting, return None if A is singular
+        A = [row[:n] for row in self.rows]
+        R = [row[n:] for row in self.rows]
+        k = self.shape[1] - n
+
+        for p in _primes():
+            C = _reduce(A, p).inv()
+            if C is not None:
+                break
+            if self.__class__(A, (n, n), ZZ).rank() < n:
+                return
+
+        # bounds for numerators and the denominator of the solution
+        # (by Cramer's rule)
+        D = _hadamard_bound(A)
+        N = functools.reduce(operator.mul, (ZZ.sqrt(sum(e*e for e in col)) + 1
+                                            for col in zip(*A)), ZZ.one)
+        N *= max((ZZ.sqrt(sum(e*e for e in col)) + 1 for col in zip(*R)),
+                 default=ZZ.one)
+
+        X = [[0]*k for _ in range(n)]
+        pk = 1
+        while pk <= 2*N*D:
+            Y = (C*_reduce(R, p)).rows
+            cols = list(zip(*Y))
+            R = [[(r - sum(map(operator.mul, row, col)))//p
+                  for r, col in zip(rrow, cols)] for rrow, row in zip(R, A)]
+            X = [[x + pk*y for x, y in zip(xrow, yrow)]
+                 for xrow, yrow in zip(X, Y)]
+            pk *= p
+
+        # components have a common denominator, so most of them are
+        # recovered without the rational reconstruction
+        d, rows = ZZ.one, []
+        for row in X:
+            rows.append([])
+            for x in row:
+                c = x*d % pk
+                if c > pk//2:
+                    c -= pk
+                if abs(c) > N:
+                    c = _rational_reconstruction(c, pk, N)
+                    d *= c.denominator
+                    c = c.numerator
+                rows[-1].append(QQ(c, d))
+        return self.__class__(rows, (n, k), QQ)
+
+    def solve(self, b):
+        """Solve linear system ``self*x = b``.
+
+        Returns unique solution over the field of fractions.  For
+        large enough square integer and rational systems, the Dixon's
+        `p`-adic lifting is used.
+
+        Raises
+        ======
+
+        ValueError
+            If the system has no solution or it's not unique.
+
+        Examples
+        ========
+
+        >>> from diofant.matrices.domainmatrix import DomainMatrix
+
+        >>> A = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+        >>> b = DomainMatrix.from_Matrix(Matrix([1, 1]))
+        >>> A.solve(b)
+        DomainMatrix([[-1], [1]], (2, 1), QQ)
+
+        References
+        ==========
+
+        * :cite:`Dixon1982exact`
+
+        """
+        m, n = self.shape
+        if b.shape[0] != m:
+            raise ShapeError('Matrix size mismatch.')
+        M = self.hstack(b)
+        domain = M.domain
+        if ((domain.is_IntegerRing or domain.is_RationalField) and
+                m == n >= query('MODULAR_LINALG_CUTOFF')):
+            A = M._clear_denoms()[0] if domain.is_RationalField else M
+            x = A._solve_dixon(n)
+            if x is not None:
+                return x
+        R, pivots = M.rref()
+        if pivots and pivots[-1] >= n:
+            raise ValueError('Linear system has no solution.')
+        if len(pivots) < n:
+            raise ValueError('Linear system has infinitely many solutions.')
+        return self.__class__([row[n:] for row in R.rows[:n]],
+                              (n, b.shape[1]), R.domain)
+
+
+def _matmul(A, B, n, zero, cutoff):
+    """Multiply matrices, given by lists of rows, ``B`` has ``n`` columns.
+
+    Strassen's algorithm is used, if all dimensions are at least
+    ``cutoff`` (and at least two), odd ones are padded by zeros.
+
+    """
+    m, k = len(A), len(B)
+    if min(m, k, n) < max(cutoff, 2):
+        cols = list(zip(*B)) if B else [()]*n
+        return [[sum(map(operator.mul, row, col), zero) for col in cols]
+                for row in A]
+
+    m2, k2, n2 = (m + 1)//2, (k + 1)//2, (n + 1)//2
+    A = ([row + [zero]*(2*k2 - k) for row in A] +
+         [[zero]*(2*k2) for _ in range(2*m2 - m)])
+    B = ([row + [zero]*(2*n2 - n) for row in B] +
+         [[zero]*(2*n2) for _ in range(2*k2 - k)])
+
+    def add(X, Y):
+        return [list(map(operator.add, x, y)) for x, y in zip(X, Y)]
+
+    def sub(X, Y):
+        return [list(map(operator.sub, x, y)) for x, y in zip(X, Y)]
+
+    def mul(X, Y):
+        return _matmul(X, Y, n2, zero, cutoff)
+
+    A11, A12 = [row[:k2] for row in A[:m2]], [row[k2:] for row in A[:m2]]
+    A21, A22 = [row[:k2] for row in A[m2:]], [row[k2:] for row in A[m2:]]
+    B11, B12 = [row[:n2] for row in B[:k2]], [row[n2:] for row in B[:k2]]
+    B21, B22 = [row[:n2] for row in B[k2:]], [row[n2:] for row in B[k2:]]
+
+    M1 = mul(add(A11, A22), add(B11, B22))
+    M2 = mul(add(A21, A22), B11)
+    M3 = mul(A11, sub(B12, B22))
+    M4 = mul(A22, sub(B21, B11))
+    M5 = mul(add(A11, A12), B22)
+    M6 = mul(sub(A21, A11), add(B11, B12))
+    M7 = mul(sub(A12, A22), add(B21, B22))
+
+    C11 = add(sub(add(M1, M4), M5), M7)
+    C12 = add(M3, M5)
+    C21 = add(M2, M4)
+    C22 = add(sub(add(M1, M3), M2), M6)
+
+    rows = ([x + y for x, y in zip(C11, C12)] +
+            [x + y for x, y in zip(C21, C22)])
+    return [row[:n] for row in rows[:m]]
+
+
+def _rational_domain_matrix(M, iszerofunc=None):
+    """Return :class:`DomainMatrix` over ZZ or QQ, if entries of ``M`` are rationals.
+
+    If ``iszerofunc`` is given, it must be one of default zero tests
+    (these are exact for rationals).
+
+    """
+    if iszerofunc not in (None, _iszero, _dense_iszero):
+        return
+    if isinstance(M, MatrixBase) and all(getattr(e, 'is_Rational', False)
+                                         for e in M):
+        domain = ZZ if all(e.is_Integer for e in M) else QQ
+        return DomainMatrix.from_Matrix(M, domain)
+
+
+def _polynomial_domain_matrices(A, B):
+    """Return :class:`DomainMatrix`'es over a polynomial ring for ``A`` and ``B``.
+
+    Entries must be polynomials with rational coefficients, else
+    ``None`` is returned.
+
+    """
+    if not (isinstance(A, MatrixBase) and isinstance(B, MatrixBase)):
+        return
+    try:
+        domain, elems = construct_domain(list(A) + list(B))
+    except PolynomialError:  # e.g. noncommutative entries
+        return
+    if not domain.is_PolynomialRing or domain.domain not in (ZZ, QQ):
+        return
+    a, (m, k), n = len(A), A.shape, B.cols
+    return (DomainMatrix([elems[i*k:i*k + k] for i in range(m)], A.shape, domain),
+            DomainMatrix([elems[a + i*n:a + i*n + n] for i in range(k)], B.shape, domain))
+
+
+def _primes():
+    """Generate word-size primes in decreasing order."""
+    p = 2**31 if query('GF_USE_NUMPY') and import_module('numpy') else 2**61
+    while True:
+        p = prevprime(p)
+        yield p
+
+
+def _reduce(rows, p):
+    return GFMatrix([[int(e % p) for e in row] for row in rows], p)
+
+
+def _hadamard_bound(rows):
+    """Return a bound for absolute values of minors of integer matrix."""
+    bounds = []
+    for vecs in (rows, zip(*rows)):
+        bounds.append(functools.reduce(operator.mul,
+                                       (ZZ.sqrt(sum(e*e for e in v)) + 1
+                                        for v in vecs), ZZ.one))
+    return min(bounds)
+
+
+def _rational_reconstruction(c, m, N):
+    """Return ``a/b``, such that ``a = b*c mod m`` and ``|a| <= N``.
+
+    It's unique, if such fraction with ``0 < b <= D`` exists and
+    ``m > 2*N*D``.
+
+    """
+    r0, r1 = m, c % m
+    s0, s1 = 0, 1
+    while r1 > N:
+        q = r0//r1
+        r0, r1 = r1, r0 - q*r1
+        s0, s1 = s1, s0 - q*s1
+    if s1 < 0:
+        r1, s1 = -r1, -s1
+    return QQ(r1, s1)
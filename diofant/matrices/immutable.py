@@ -146,6 +146,7 @@ class ImmutableSparseMatrix(Basic, SparseMatrixBase):
     """
 
     _class_priority = 9
+    _cache_compressed = True
 
     @classmethod
     def _new(cls, *args, **kwargs):
@@ -0,0 +1,376 @@
+"""Lattice basis reduction."""
+
+import itertools
+
+import mpmath
+
+from ..core.numbers import igcdex
+from ..domains import QQ, ZZ
+from .matrices import MatrixBase
+
+
+def lll(basis, delta=QQ(3, 4)):
+    r"""
+    Return LLL-reduced basis of the integer lattice.
+
+    The basis is first reduced using floating-point Gram-Schmidt
+    orthogonalization (with exact basis vectors), then the result is
+    certified by the integral LLL algorithm, which uses only exact
+    integer arithmetic.  Integers are represented by the ground type
+    of :class:`~diofant.domains.IntegerRing`, e.g. the ``gmpy2``'s
+    ones, if available.
+
+    Parameters
+    ==========
+
+    basis : Matrix or list
+        Rows of integers, must be linearly independent.
+    delta : Rational, optional
+        Parameter of the Lovász condition, `1/4 < \delta \le 1`.
+
+    Examples
+    ========
+
+    >>> lll([[1, 1, 1], [-1, 0, 2], [3, 5, 6]])
+    [[0, 1, 0], [1, 0, 1], [-1, 0, 2]]
+    >>> lll(Matrix([[1, 1, 1], [-1, 0, 2], [3, 5, 6]]))
+    Matrix([
+    [ 0, 1, 0],
+    [ 1, 0, 1],
+    [-1, 0, 2]])
+
+    See Also
+    ========
+
+    bkz
+
+    References
+    ==========
+
+    * :cite:`Cohen1996course`, algorithm 2.6.7
+    * :cite:`Lenstra1982factor`
+    * :cite:`Schnorr1994lattice`
+
+    """
+    if isinstance(basis, MatrixBase):
+        return basis.__class__(lll(basis.tolist(), delta))
+
+    return [list(map(int, v)) for v in _lll(basis, delta)[0]]
+
+
+def bkz(basis, block_size=10, delta=QQ(99, 100)):
+    r"""
+    Return BKZ-reduced basis of the integer lattice.
+
+    Block Korkine-Zolotarev reduction gives shorter vectors, than
+    :func:`lll`, at cost of the enumeration of shortest vectors in
+    projected sublattices of dimension ``block_size``.
+
+    Parameters
+    ==========
+
+    basis : Matrix or list
+        Rows of integers, must be linearly independent.
+    block_size : int, optional
+        Size of blocks, for ``block_size=2`` the result is just LLL-reduced.
+    delta : Rational, optional
+        Parameter of the Lovász condition, `1/4 < \delta \le 1`.
+
+    Examples
+    ========
+
+    >>> B = [[-2, 1, 0, 0, 1], [-2, 0, 1, 0, 0],
+    ...      [0, 1, 1, 1, 1], [1, 1, 1, 0, 1], [3, 1, 1, 1, -2]]
+    >>> bkz(B, block_size=5)[0]
+    [1, 0, 0, -1, 0]
+
+    See Also
+    ========
+
+    lll
+
+    References
+    ==========
+
+    * :cite:`Schnorr1994lattice`
+
+    """
+    if isinstance(basis, MatrixBase):
+        return basis.__class__(bkz(basis.tolist(), block_size, delta))
+
+    b, d, lam = _lll(basis, delta)
+    n = len(b)
+
+    z, k = 0, -1
+
+    while z < n - 1:
+        k = (k + 1) % (n - 1)
+        h = min(k + block_size, n) - 1
+
+        B = [int(d[i + 1])/int(d[i]) for i in range(n)]
+        mu = [[int(lam[i + 1][j + 1])/int(d[j + 1]) for j in range(i)]
+              for i in range(n)]
+
+        u = _enumerate(mu, B, k, h, float(delta)*B[k])
+
+        if u is None:
+            z += 1
+        else:
+            z = 0
+            _insert(b, u, k)
+            b, d, lam = _lll(b, delta)
+
+    return [list(map(int, v)) for v in b]
+
+
+def _enumerate(mu, B, k, h, radius):
+    """
+    Find the shortest nonzero vector in the projected lattice.
+
+    Vectors are integer combinations of basis vectors with indices in
+    the range ``k..h``, projected on the orthogonal complement to the first
+    ``k`` vectors.  Returns coefficients of a vector, which norm squared is
+    less than ``radius`` or ``None``.
+
+    """
+    u = [0]*(h + 1)
+    best = [radius, None]
+
+    def candidates(c):
+        # integers in the order of increasing distance to c
+        x = round(c)
+        s = 1 if c >= x else -1
+        yield x
+        for i in itertools.count(1):  # pragma: no branch
+            yield x + s*i
+            yield x - s*i
+
+    def search(i, partial, top):
+        c = -sum(u[j]*mu[j][i] for j in range(i + 1, h + 1))
+        for x in candidates(c):
+            length = partial + (x - c)**2*B[i]
+            if length >= best[0]:
+                break
+            if top and x < 0:
+                continue
+            u[i] = x
+            if i > k:
+                search(i - 1, length, top and not x)
+            elif any(u[k:]):
+                best[:] = length, u[k:]
+        u[i] = 0
+
+    search(h, 0.0, True)
+
+    return best[1]
+
+
+def _insert(b, u, k):
+    """Replace ``b[k]`` with ``sum(u[i]*b[k + i])`` by unimodular transformations."""
+    acc = u[-1]
+    for i in range(k + len(u) - 2, k - 1, -1):
+        x, y = u[i - k], acc
+        if not y:
+            acc = x
+        elif not x:
+            b[i], b[i + 1] = b[i + 1], b[i]
+        else:
+            s, t, g = igcdex(x, y)
+            x, y = x//g, y//g
+            b[i], b[i + 1] = ([x*p + y*q for p, q in zip(b[i], b[i + 1])],
+                              [s*q - t*p for p, q in zip(b[i], b[i + 1])])
+            acc = g
+    if acc < 0:
+        b[k] = [-c for c in b[k]]
+
+
+def integer_relation(x, tol=None, maxcoeff=1000):
+    r"""
+    Find an integer relation for real numbers ``x``, using the LLL algorithm.
+
+    Returns a list of integers `a_i`, such that `|a_i| \le` ``maxcoeff``
+    and `|\sum a_i x_i| \le` ``tol`` (by default, `2^{-3p/4}` for the
+    current mpmath's working precision `p`) or ``None``, if no such
+    relation was found.  The first nonzero `a_i` is positive.
+
+    Examples
+    ========
+
+    >>> from diofant.matrices.lll import integer_relation
+
+    >>> integer_relation([mpmath.sqrt(2), mpmath.mpf(1), mpmath.sqrt(8)])
+    [2, 0, -1]
+
+    See Also
+    ========
+
+    mpmath.pslq
+
+    """
+    n = len(x)
+    x = list(map(mpmath.mpf, x))
+
+    prec = mpmath.mp.prec
+    if tol is None:
+        tol = mpmath.ldexp(1, -prec*3//4)
+    tol = mpmath.mpf(tol)
+
+    C = mpmath.ldexp(1, prec*7//8)
+
+    basis = [[int(i == j) for j in range(n)] + [int(mpmath.nint(C*x[i]))]
+             for i in range(n)]
+
+    for v in _lll(basis)[0]:
+        a = list(map(int, v[:n]))
+        if any(a) and max(map(abs, a)) <= maxcoeff:
+            if abs(mpmath.fsum(c*t for c, t in zip(a, x))) <= tol:
+                if next(c for c in a if c) < 0:
+                    a = [-c for c in a]
+                return a
+
+
+def _lll(basis, delta=QQ(3, 4)):
+    r"""
+    Integral LLL algorithm.
+
+    Returns reduced basis, the list of Gram determinants `d_i` of
+    the first `i` basis vectors (i.e. squared norms of the Gram-Schmidt
+    orthogonalized vectors are `d_i/d_{i - 1}`) and the matrix of
+    `\lambda_{i, j} = d_j \mu_{i, j}`, where `\mu_{i, j}` are
+    Gram-Schmidt coefficients (indices are 1-based).
+
+    """
+    num, den = delta.numerator, delta.denominator
+
+    b = [None] + _lll_fp([list(map(ZZ, v)) for v in basis], delta)
+    n = len(basis)
+
+    d = [ZZ.one]*(n + 1)
+    lam = [[ZZ.zero]*(n + 1) for _ in range(n + 1)]
+
+    if not n:
+        return [], d, lam
+
+    def dot(u, v):
+        return sum((x*y for x, y in zip(u, v)), ZZ.zero)
+
+    d[1] = dot(b[1], b[1])
+
+    if not d[1]:
+        raise ValueError('basis vectors must be linearly independent')
+
+    def red(k, l):
+        if 2*abs(lam[k][l]) > d[l]:
+            q = (2*lam[k][l] + d[l])//(2*d[l])
+            b[k] = [x - q*y for x, y in zip(b[k], b[l])]
+            lam[k][l] -= q*d[l]
+            for i in range(1, l):
+                lam[k][i] -= q*lam[l][i]
+
+    def swap(k):
+        b[k], b[k - 1] = b[k - 1], b[k]
+        for j in range(1, k - 1):
+            lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+        m = lam[k][k - 1]
+        B = (d[k - 2]*d[k] + m**2)//d[k - 1]
+        for i in range(k + 1, kmax + 1):
+            t = lam[i][k]
+            lam[i][k] = (d[k]*lam[i][k - 1] - m*t)//d[k - 1]
+            lam[i][k - 1] = (B*t + m*lam[i][k])//d[k]
+        d[k - 1] = B
+
+    k, kmax = 2, 1
+
+    while k <= n:
+        if k > kmax:
+            kmax = k
+            for j in range(1, k + 1):
+                u = dot(b[k], b[j])
+                for i in range(1, j):
+                    u = (d[i]*u - lam[k][i]*lam[j][i])//d[i - 1]
+                if j < k:
+                    lam[k][j] = u
+                else:
+                    if not u:
+                        raise ValueError('basis vectors must be linearly independent')
+                    d[k] = u
+
+        while True:
+            red(k, k - 1)
+            if den*d[k]*d[k - 2] < num*d[k - 1]**2 - den*lam[k][k - 1]**2:
+                swap(k)
+                k = max(2, k - 1)
+            else:
+                break
+
+        for l in range(k - 2, 0, -1):
+            red(k, l)
+        k += 1
+
+    return b[1:], d, lam
+
+
+def _lll_fp(b, delta):
+    """
+    LLL algorithm with floating-point Gram-Schmidt orthogonalization.
+
+    Basis vectors are exact, dot products are computed exactly too, but
+    stored as floats.  The result is not guaranteed to be reduced, if
+    the precision is insufficient.
+
+    References
+    ==========
+
+    * :cite:`Schnorr1994lattice`
+
+    """
+    n = len(b)
+
+    if n < 2 or int(max(abs(c) for v in b for c in v)).bit_length() > 500:
+        return b
+
+    delta = float(delta)
+
+    def dot(u, v):
+        return float(sum((x*y for x, y in zip(u, v)), ZZ.zero))
+
+    mu = [[0.0]*n for _ in range(n)]
+    r = [[0.0]*n for _ in range(n)]
+    B = [dot(b[0], b[0])] + [0.0]*(n - 1)
+
+    if not B[0]:
+        return b
+
+    k, steps = 1, 0
+
+    while k < n and steps < 100*n**2:
+        steps += 1
+
+        for _ in range(3):
+            for j in range(k):
+                r[k][j] = dot(b[k], b[j]) - sum(mu[j][i]*r[k][i] for i in range(j))
+                mu[k][j] = r[k][j]/B[j]
+            B[k] = dot(b[k], b[k]) - sum(mu[k][j]*r[k][j] for j in range(k))
+
+            reduced = False
+            for j in range(k - 1, -1, -1):
+                if abs(mu[k][j]) > 0.51:
+                    q = round(mu[k][j])
+                    b[k] = [x - q*y for x, y in zip(b[k], b[j])]
+                    for i in range(j):
+                        mu[k][i] -= q*mu[j][i]
+                    mu[k][j] -= q
+                    reduced = True
+            if not reduced:
+                break
+
+        if B[k] <= 0:
+            break
+
+        if delta*B[k - 1] > B[k] + mu[k][k - 1]**2*B[k - 1]:
+            b[k], b[k - 1] = b[k - 1], b[k]
+            k = max(k - 1, 1)
+        else:
+            k += 1
+
+    return b
@@ -8,6 +8,7 @@
 from ..core.logic import fuzzy_and
 from ..functions import Max, Min, exp, factorial, sqrt
 from ..polys import PurePoly, cancel, gcd, roots
+from ..polys.polyconfig import query
 from ..printing.defaults import DefaultPrinting
 from ..simplify import nsimplify, signsimp
 from ..simplify import simplify as _simplify
@@ -469,6 +470,13 @@ def __mul__(self, other):
         ShapeError: Matrices size mismatch.
         >>>
 
+        Products of large enough matrices with rational or polynomial
+        entries are computed with
+        :class:`~diofant.matrices.domainmatrix.DomainMatrix` (see the
+        ``MATRIX_MUL_DOMAIN_CUTOFF`` and ``MATRIX_MUL_POLY_CUTOFF``
+        configuration options), entries of the product of polynomial
+        matrices are expanded.
+
         See Also
         ========
 
@@ -482,6 +490,18 @@ def __mul__(self, other):
                 raise ShapeError('Matrices size mismatch.')
             if A.cols == 0:
                 return classof(A, B)._new(A.rows, B.cols, lambda i, j: 0)
+            if isinstance(B, MatrixBase):
+                from .domainmatrix import (_polynomial_domain_matrices,
+                                           _rational_domain_matrix)
+                size = min(A.rows, A.cols, B.cols)
+                if size >= query('MATRIX_MUL_DOMAIN_CUTOFF'):
+                    a, b = _rational_domain_matrix(A), _rational_domain_matrix(B)
+                    if a is not None and b is not None:
+                        return classof(A, B)._new((a*b).to_Matrix())
+                if size >= query('MATRIX_MUL_POLY_CUTOFF'):
+                    ab = _polynomial_domain_matrices(A, B)
+                    if ab is not None:
+                        return classof(A, B)._new((ab[0]*ab[1]).to_Matrix())
             try:
                 blst = B.T.tolist()
             except AttributeError:
@@ -1209,9 +1229,18 @@ def LUsolve(self, rhs, iszerofunc=_iszero):
         LUdecomposition
 
         """
+        from .domainmatrix import _rational_domain_matrix
+
         if rhs.rows != self.rows:
             raise ShapeError('`self` and `rhs` must have the same number of rows.')
 
+        A, b = _rational_domain_matrix(self), _rational_domain_matrix(rhs)
+        if A is not None and b is not None and A.is_square:
+            try:
+                return rhs.__class__(A.solve(b).to_Matrix())
+            except ValueError:
+                pass
+
         A, perm = self.LUdecomposition_Simple(iszerofunc=_iszero)
         n = self.rows
         b = rhs.permuteFwd(perm).as_mutable()
@@ -2456,6 +2485,12 @@ def det_bareiss(self):
         if not self:
             return Integer(1)
 
+        from .domainmatrix import _rational_domain_matrix
+
+        A = _rational_domain_matrix(self)
+        if A is not None:
+            return A.domain.to_expr(A.det())
+
         M, n = self.copy().as_mutable(), self.rows
 
         if n == 1:
@@ -2584,10 +2619,15 @@ def inverse_GE(self, iszerofunc=_iszero):
 
         """
         from . import Matrix
+        from .domainmatrix import _rational_domain_matrix
 
         if not self.is_square:
             raise NonSquareMatrixError('A Matrix must be square to invert.')
 
+        A = _rational_domain_matrix(self, iszerofunc)
+        if A is not None:
+            return self._new(A.inv().to_Matrix())
+
         big = Matrix.hstack(self.as_mutable(), Matrix.eye(self.rows))
         red = big.rref(iszerofunc=iszerofunc, simplify=True)[0]
         if any(iszerofunc(red[j, j]) for j in range(red.rows)):
@@ -2633,6 +2673,13 @@ def rref(self, iszerofunc=_iszero, simplify=False):
         [0, 1]]), [0, 1])
 
         """
+        from .domainmatrix import _rational_domain_matrix
+
+        A = _rational_domain_matrix(self, iszerofunc)
+        if A is not None:
+            R, pivots = A.rref()
+            return self._new(R.to_Matrix()), pivots
+
         simpfunc = simplify if isinstance(
             simplify, FunctionType) else _simplify
         # pivot: index of next row to contain a pivot
@@ -2878,6 +2925,14 @@ def berkowitz_charpoly(self, x=Dummy('lambda'), simplify=_simplify):
         berkowitz
 
         """
+        from .domainmatrix import _rational_domain_matrix
+
+        if self.is_square:
+            A = _rational_domain_matrix(self)
+            if A is not None:
+                return PurePoly(list(map(A.domain.to_expr,
+                                         reversed(A.charpoly()))), x)
+
         return PurePoly(list(map(simplify, reversed(self.berkowitz()[-1]))), x)
 
     charpoly = berkowitz_charpoly
@@ -1,5 +1,6 @@
 import collections
 import copy
+import operator
 
 from ..core import Dict, Expr, Integer
 from ..core.compatibility import as_int, is_sequence
@@ -11,7 +12,16 @@
 
 
 class SparseMatrixBase(MatrixBase):
-    """A sparse matrix base class."""
+    """A sparse matrix base class.
+
+    Nonzero elements are stored in the ``_smat`` dictionary, mapping
+    pairs of indices to values.  Compressed sparse row (CSR) and column
+    (CSC) forms are computed on demand, see :meth:`_csr` and :meth:`_csc`.
+
+    """
+
+    # whether compressed forms could be cached, i.e. ``_smat`` is fixed
+    _cache_compressed = False
 
     def __init__(self, *args):
         from . import Matrix
@@ -147,6 +157,71 @@ def tolist(self):
         I, J = self.shape
         return [[self[i, j] for j in range(J)] for i in range(I)]
 
+    def _compressed(self, axis):
+        try:
+            return self._compressed_cache[axis]
+        except (AttributeError, KeyError):
+            pass
+        n = self.shape[axis]
+        lines = [[] for _ in range(n)]
+        for key, value in self._smat.items():
+            lines[key[axis]].append((key[1 - axis], value))
+        indptr, indices, data = [0], [], []
+        for line in lines:
+            line.sort(key=operator.itemgetter(0))
+            indices.extend(k for k, _ in line)
+            data.extend(v for _, v in line)
+            indptr.append(len(indices))
+        rv = indptr, indices, data
+        if self._cache_compressed:
+            if not hasattr(self, '_compressed_cache'):
+                self._compressed_cache = {}
+            self._compressed_cache[axis] = rv
+        return rv
+
+    def _csr(self):
+        """Return the compressed sparse row form of the matrix.
+
+        This is a tuple ``(indptr, indices, data)`` of lists:
+        nonzero elements of the ``i``-th row are stored in
+        ``data[indptr[i]:indptr[i + 1]]``, their column indices (in the
+        increasing order) are in ``indices[indptr[i]:indptr[i + 1]]``.
+        The result is cached for immutable matrices.
+
+        Examples
+        ========
+
+        >>> SparseMatrix([[1, 0, 2], [0, 0, 0], [0, 3, 0]])._csr()
+        ([0, 2, 2, 3], [0, 2, 1], [1, 2, 3])
+
+        See Also
+        ========
+
+        _csc
+
+        """
+        return self._compressed(0)
+
+    def _csc(self):
+        """Return the compressed sparse column form of the matrix.
+
+        Same as :meth:`_csr` for the transposed matrix.
+
+        Examples
+        ========
+
+        >>> SparseMatrix([[1, 0, 2], [0, 0, 0], [0, 3, 0]])._csc()
+        ([0, 1, 2, 3], [0, 2, 0], [1, 3, 2])
+
+        """
+        return self._compressed(1)
+
+    def _row_dicts(self):
+        # list of rows as dictionaries, mapping column indices to values
+        indptr, indices, data = self._csr()
+        return [dict(zip(indices[a:b], data[a:b]))
+                for a, b in zip(indptr, indptr[1:])]
+
     def row_list(self):
         """Returns a row-sorted list of non-zero elements of the matrix.
 
@@ -168,8 +243,9 @@ def row_list(self):
         col_list
 
         """
-        return [tuple(k + (self[k],)) for k in
-                sorted(self._smat, key=lambda k: list(k))]
+        indptr, indices, data = self._csr()
+        return [(i, indices[k], data[k]) for i in range(self.rows)
+                for k in range(indptr[i], indptr[i + 1])]
 
     RL = property(row_list, None, None, 'Alternate faster representation')
 
@@ -193,7 +269,9 @@ def col_list(self):
         row_list
 
         """
-        return [tuple(k + (self[k],)) for k in sorted(self._smat, key=lambda k: list(reversed(k)))]
+        indptr, indices, data = self._csc()
+        return [(indices[k], j, data[k]) for j in range(self.cols)
+                for k in range(indptr[j], indptr[j + 1])]
 
     CL = property(col_list, None, None, 'Alternate faster representation')
 
@@ -284,17 +362,19 @@ def multiply(self, other):
         """
         A = self
         B = other
-        # sort B's row_list into list of rows
-        Blist = [[] for i in range(B.rows)]
-        for i, j, v in B.row_list():
-            Blist[i].append((j, v))
-        Cdict = collections.defaultdict(int)
-        for k, j, Akj in A.row_list():
-            for n, Bjn in Blist[j]:
-                temp = Akj*Bjn
-                Cdict[k, n] += temp
+        Aptr, Aind, Adata = A._csr()
+        Bptr, Bind, Bdata = B._csr()
+        smat = {}
+        for i in range(A.rows):
+            row = {}
+            for k in range(Aptr[i], Aptr[i + 1]):
+                j, Aij = Aind[k], Adata[k]
+                for m in range(Bptr[j], Bptr[j + 1]):
+                    n = Bind[m]
+                    row[n] = row.get(n, 0) + Aij*Bdata[m]
+            smat.update(((i, n), v) for n, v in row.items() if v)
         rv = self.zeros(A.rows, B.cols)
-        rv._smat = {k: v for k, v in Cdict.items() if v}
+        rv._smat = smat
         return rv
 
     def scalar_multiply(self, scalar):
@@ -630,10 +710,9 @@ def liupc(self):
         # Algorithm 2.4, p 17 of reference
 
         # get the indices of the elements that are non-zero on or below diag
-        R = [[] for r in range(self.rows)]
-        for r, c, _ in self.row_list():
-            if c <= r:
-                R[r].append(c)
+        indptr, indices, _ = self._csr()
+        R = [[c for c in indices[indptr[r]:indptr[r + 1]] if c <= r]
+             for r in range(self.rows)]
 
         inf = len(R)  # nothing will be this large
         parent = [inf]*self.rows
@@ -683,72 +762,70 @@ def row_structure_symbolic_cholesky(self):
     def _cholesky_sparse(self):
         """Algorithm for numeric Cholesky factorization of a sparse matrix."""
         Crowstruc = self.row_structure_symbolic_cholesky()
-        C = self.zeros(self.rows)
-        for i in range(len(Crowstruc)):
-            for j in Crowstruc[i]:
+        A = self._row_dicts()
+        C = [{} for _ in range(self.rows)]
+        for i, struc in enumerate(Crowstruc):
+            Ci = C[i]
+            for j in struc:
                 if i != j:
-                    C[i, j] = self[i, j]
-                    summ = 0
-                    for p1 in Crowstruc[i]:  # pragma: no branch
-                        if p1 < j:
-                            for p2 in Crowstruc[j]:  # pragma: no branch
-                                if p2 < j:
-                                    if p1 == p2:
-                                        summ += C[i, p1]*C[j, p1]
-                                else:
-                                    break
+                    Cj = C[j]
+                    summ = Integer(0)
+                    for k in struc:  # pragma: no branch
+                        if k < j:
+                            if k in Cj:
+                                summ += Ci.get(k, 0)*Cj[k]
                         else:
                             break
-                    C[i, j] -= summ
-                    C[i, j] /= C[j, j]
+                    Ci[j] = (A[i].get(j, 0) - summ)/Cj[j]
                 else:
-                    C[j, j] = self[j, j]
-                    summ = 0
-                    for k in Crowstruc[j]:  # pragma: no branch
+                    summ = Integer(0)
+                    for k in struc:  # pragma: no branch
                         if k < j:
-                            summ += C[j, k]**2
+                            summ += Ci.get(k, 0)**2
                         else:
                             break
-                    C[j, j] -= summ
-                    C[j, j] = sqrt(C[j, j])
+                    Ci[j] = sqrt(A[j].get(j, 0) - summ)
 
-        return C
+        return self._new(self.rows, self.rows, {(i, j): v
+                                                for i, row in enumerate(C)
+                                                for j, v in row.items()})
 
     def _LDL_sparse(self):
         """Algorithm for numeric LDL factization, exploiting sparse structure.
         """
         Lrowstruc = self.row_structure_symbolic_cholesky()
-        L = self.eye(self.rows)
-        D = self.zeros(self.rows, self.cols)
+        A = self._row_dicts()
+        L = [{} for _ in range(self.rows)]
+        D = [Integer(0)]*self.rows
 
-        for i in range(len(Lrowstruc)):
-            for j in Lrowstruc[i]:
+        for i, struc in enumerate(Lrowstruc):
+            Li = L[i]
+            for j in struc:
                 if i != j:
-                    L[i, j] = self[i, j]
-                    summ = 0
-                    for p1 in Lrowstruc[i]:  # pragma: no branch
-                        if p1 < j:
-                            for p2 in Lrowstruc[j]:  # pragma: no branch
-                                if p2 < j:
-                                    if p1 == p2:
-                                        summ += L[i, p1]*L[j, p1]*D[p1, p1]
-                                else:
-                                    break
+                    Lj = L[j]
+                    summ = Integer(0)
+                    for k in struc:  # pragma: no branch
+                        if k < j:
+                            if k in Lj:
+                                summ += Li.get(k, 0)*Lj[k]*D[k]
                         else:
                             break
-                    L[i, j] -= summ
-                    L[i, j] /= D[j, j]
+                    Li[j] = (A[i].get(j, 0) - summ)/D[j]
                 else:
-                    D[i, i] = self[i, i]
-                    summ = 0
-                    for k in Lrowstruc[i]:  # pragma: no branch
+                    summ = Integer(0)
+                    for k in struc:  # pragma: no branch
                         if k < i:
-                            summ += L[i, k]**2*D[k, k]
+                            summ += Li.get(k, 0)**2*D[k]
                         else:
                             break
-                    D[i, i] -= summ
+                    D[i] = A[i].get(i, 0) - summ
 
-        return L, D
+        n = self.rows
+        Lsmat = {(i, i): Integer(1) for i in range(n)}
+        Lsmat.update(((i, j), v) for i, row in enumerate(L)
+                     for j, v in row.items())
+        return (self._new(n, n, Lsmat),
+                self._new(n, self.cols, {(i, i): d for i, d in enumerate(D)}))
 
     def _lower_triangular_solve(self, rhs):
         """Fast algorithm for solving a lower-triangular system,
@@ -809,6 +886,28 @@ def _LDL_solve(self, rhs):
         Y = D._diagonal_solve(Z)
         return L.T._upper_triangular_solve(Y)
 
+    def _LU_solve(self, rhs):
+        from ..polys.constructor import construct_domain
+        from ..polys.solvers import sparse_rref
+
+        n = self.cols
+        if rhs.rows != self.rows:
+            raise ShapeError('`self` and `rhs` must have the same number of rows.')
+        B = self._new(rhs)
+        keys = list(self._smat) + [(i, j + n) for i, j in B._smat]
+        domain, elems = construct_domain(list(self._smat.values()) +
+                                         list(B._smat.values()), field=True)
+        rows = [{} for _ in range(self.rows)]
+        for (i, j), v in zip(keys, elems):
+            rows[i][j] = v
+        echelon, pivots = sparse_rref(rows, domain)
+        if pivots[:n] != list(range(n)):
+            raise ValueError('Matrix det == 0; not invertible.')
+        to_expr = domain.to_expr
+        return self._new(n, B.cols, {(i, j - n): to_expr(v)
+                                     for i, row in enumerate(echelon)
+                                     for j, v in row.items() if j >= n})
+
     def cholesky(self):
         """
         Returns the Cholesky decomposition L of a matrix A
@@ -939,6 +1038,21 @@ def solve_least_squares(self, rhs, method='LDL'):
     def solve(self, rhs, method='LDL'):
         """Return solution to self*soln = rhs using given inversion method.
 
+        For ``method='LU'``, the system is solved directly with the
+        sparse Gauss-Jordan elimination over the domain of matrix
+        entries (see :func:`~diofant.polys.solvers.sparse_rref`), the
+        matrix is not inverted.
+
+        Examples
+        ========
+
+        >>> A = SparseMatrix([[0, 2, 0], [1, 0, 0], [0, 0, 3]])
+        >>> A.solve(Matrix([1, 2, 3]), method='LU')
+        Matrix([
+        [  2],
+        [1/2],
+        [  1]])
+
         See Also
         ========
 
@@ -951,13 +1065,16 @@ def solve(self, rhs, method='LDL'):
             else:
                 raise ValueError('For over-determined system, M, having '
                                  'more rows than columns, try M.solve_least_squares(rhs).')
+        elif method == 'LU':
+            return self._LU_solve(rhs)
         else:
             return self.inv(method=method)*rhs
 
     def _eval_inverse(self, **kwargs):
         """Return the matrix inverse using Cholesky or LDL (default)
         decomposition as selected with the ``method`` keyword: 'CH' or 'LDL',
-        respectively.
+        respectively.  For ``method='LU'``, the sparse Gauss-Jordan
+        elimination is used.
 
         Examples
         ========
@@ -982,6 +1099,9 @@ def _eval_inverse(self, **kwargs):
         [0, 0, 1]])
 
         """
+        method = kwargs.get('method', 'LDL')
+        if method == 'LU':
+            return self._new(self._LU_solve(self.eye(self.rows)))
         sym = self.is_symmetric()
         M = self.as_mutable()
         I = M.eye(M.rows)
@@ -990,13 +1110,12 @@ def _eval_inverse(self, **kwargs):
             r1 = M[0, :]
             M = t*M
             I = t*I
-        method = kwargs.get('method', 'LDL')
         if method in 'LDL':
             solve = M._LDL_solve
         elif method == 'CH':
             solve = M._cholesky_solve
         else:
-            raise NotImplementedError(f'Method may be "CH" or "LDL", not {method}.')
+            raise NotImplementedError(f'Method may be "CH", "LDL" or "LU", not {method}.')
         rv = M.hstack(*[solve(I[:, i]) for i in range(I.cols)])
         if not sym:
             scale = (r1*rv[:, 0])[0, 0]
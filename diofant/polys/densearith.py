@@ -0,0 +1,678 @@
+"""Arithmetics for dense univariate polynomials.
+
+Polynomials are represented by lists of coefficients (elements of the
+ground domain) in ascending order, without trailing zeros, i.e. the
+zero polynomial is the empty list.
+
+"""
+
+import math
+
+from ..domains.finitefield import FiniteRing
+from .polyconfig import query
+
+
+def dense_strip(f):
+    """Remove trailing zeros (leading coefficients) inplace."""
+    while f and not f[-1]:
+        f.pop()
+    return f
+
+
+def dense_degree(f):
+    """Return degree of ``f``, the degree of zero polynomial is ``-1``."""
+    return len(f) - 1
+
+
+def dense_add(f, g):
+    """Add dense polynomials."""
+    if len(f) < len(g):
+        f, g = g, f
+    h = f[:]
+    for i, c in enumerate(g):
+        h[i] += c
+    return dense_strip(h)
+
+
+def dense_sub(f, g):
+    """Subtract dense polynomials."""
+    h = f[:]
+    h.extend(g[len(f):])
+    for i, c in enumerate(g[:len(f)]):
+        h[i] -= c
+    for i in range(len(f), len(h)):
+        h[i] = -h[i]
+    return dense_strip(h)
+
+
+def dense_shift_up(f, n):
+    """Multiply ``f`` by ``x**n``."""
+    if not f:
+        return f
+    return [f[0] - f[0]]*n + f
+
+
+def _mul_classical(f, g, domain):
+    if len(f) < len(g):
+        f, g = g, f
+    h = [domain.zero]*(len(f) + len(g) - 1)
+    for j, c in enumerate(g):
+        if c:
+            for i, a in enumerate(f, j):
+                h[i] += a*c
+    return h
+
+
+def _mul_karatsuba(f, g, domain, cutoff):
+    n, m = len(f), len(g)
+    if min(n, m) <= cutoff:
+        return _mul_classical(f, g, domain)
+
+    k = max(n, m)//2
+    f0, f1 = f[:k], f[k:]
+    g0, g1 = g[:k], g[k:]
+
+    lo = _mul_karatsuba(f0, g0, domain, cutoff) if f0 and g0 else []
+    hi = _mul_karatsuba(f1, g1, domain, cutoff) if f1 and g1 else []
+    fs, gs = _add_raw(f0, f1), _add_raw(g0, g1)
+    mid = _mul_karatsuba(fs, gs, domain, cutoff)
+
+    h = [domain.zero]*(n + m - 1)
+    for i, c in enumerate(lo):
+        h[i] += c
+        mid[i] -= c
+    for i, c in enumerate(hi):
+        h[i + 2*k] += c
+        mid[i] -= c
+    for i, c in enumerate(mid):
+        h[i + k] += c
+    return h
+
+
+def _add_raw(f, g):
+    if len(f) < len(g):
+        f, g = g, f
+    h = f[:]
+    for i, c in enumerate(g):
+        h[i] += c
+    return h
+
+
+def is_kronecker_domain(domain):
+    """Test if coefficients of ``domain`` could be packed to integers."""
+    return domain.is_IntegerRing or (isinstance(domain, FiniteRing) and
+                                     domain.order == domain.characteristic)
+
+
+def kronecker_mul(f, g):
+    """Multiply lists of integer coefficients by Kronecker substitution.
+
+    Polynomials are evaluated at a power of two, large enough to hold
+    any coefficient of the product, the resulting integers are
+    multiplied and the product is unpacked back.  Zero slots are
+    allowed in ``f`` and ``g``, the result has length
+    ``len(f) + len(g) - 1``.
+
+    Examples
+    ========
+
+    >>> kronecker_mul([1, 1], [-1, 1])
+    [-1, 0, 1]
+
+    """
+    if not f or not g:
+        return []
+    bound = min(len(f), len(g))*max(map(abs, f))*max(map(abs, g))
+    k = bound.bit_length()//8 + 1
+
+    def pack(f):
+        pos, neg = bytearray(len(f)*k), bytearray(len(f)*k)
+        for i, c in enumerate(f):
+            if c > 0:
+                pos[i*k:i*k + k] = c.to_bytes(k, 'little')
+            elif c:
+                neg[i*k:i*k + k] = (-c).to_bytes(k, 'little')
+        return int.from_bytes(pos, 'little') - int.from_bytes(neg, 'little')
+
+    n = len(f) + len(g) - 1
+    half = 1 << (8*k - 1)
+    offset = int.from_bytes(half.to_bytes(k, 'little')*n, 'little')
+    h = memoryview((pack(f)*pack(g) + offset).to_bytes(n*k, 'little'))
+    return [int.from_bytes(h[i:i + k], 'little') - half
+            for i in range(0, n*k, k)]
+
+
+def _use_kronecker(f, g):
+    if not query('USE_KRONECKER'):
+        return False
+    n = (len(f) - f.count(0))*(len(g) - g.count(0))
+    return n >= query('KRONECKER_CUTOFF') and len(f) + len(g) - 1 <= n
+
+
+def dense_mul(f, g, domain):
+    """Multiply dense polynomials.
+
+    For integers and prime finite fields, uses the Kronecker
+    substitution (see :func:`kronecker_mul`) if the ``USE_KRONECKER``
+    config value is set, the product of numbers of nonzero terms is at
+    least ``KRONECKER_CUTOFF`` config value and it's not less than the
+    length of the result (i.e. polynomials aren't too sparse).  Else,
+    uses Karatsuba's algorithm for
+    polynomials of degree above ``KARATSUBA_CUTOFF`` config value,
+    see :cite:`Hoeven02`.
+
+    Examples
+    ========
+
+    >>> dense_mul([ZZ(1), ZZ(1)], [ZZ(-1), ZZ(1)], ZZ)
+    [-1, 0, 1]
+
+    """
+    if not f or not g:
+        return []
+    if _use_kronecker(f, g) and is_kronecker_domain(domain):
+        dtype = domain.dtype
+        h = kronecker_mul(list(map(int, f)), list(map(int, g)))
+        return dense_strip([dtype(c) for c in h])
+    cutoff = query('KARATSUBA_CUTOFF')
+    return dense_strip(_mul_karatsuba(f, g, domain, cutoff))
+
+
+def dense_mul_ground(f, c):
+    """Multiply dense polynomial by ground element."""
+    if not c:
+        return []
+    return dense_strip([a*c for a in f])
+
+
+def dense_trunc(f, n):
+    """Return ``f mod x**n``."""
+    return dense_strip(f[:n])
+
+
+def dense_reverse(f, n):
+    """Return ``x**n*f(1/x)`` for ``n >= deg(f)``."""
+    return dense_strip((f + [f[0] - f[0]]*(n + 1 - len(f)))[::-1]) if f else []
+
+
+def dense_inv_series(f, n, domain):
+    """Compute inverse of ``f`` modulo ``x**n``, using Newton iteration.
+
+    The constant term of ``f`` must be invertible.
+
+    References
+    ==========
+
+    * :cite:`Gathen1999modern`, algorithm 9.3
+
+    """
+    g = [domain.quo(domain.one, f[0])]
+    k = 1
+    while k < n:
+        k = min(2*k, n)
+        e = dense_trunc(dense_mul(dense_trunc(f, k), g, domain), k)
+        e = dense_sub([domain.one], e)
+        g = dense_trunc(dense_add(g, dense_mul(g, e, domain)), k)
+    return g
+
+
+def _divmod_classical(f, g, domain):
+    df, dg = len(f) - 1, len(g) - 1
+    if df < dg:
+        return [], f[:]
+    r = f[:]
+    q = [domain.zero]*(df - dg + 1)
+    lc = g[-1]
+    if domain.is_Field:
+        inv = domain.quo(domain.one, lc)
+        for i in range(df - dg, -1, -1):
+            c = r[i + dg]
+            if c:
+                c *= inv
+                q[i] = c
+                for j, b in enumerate(g[:-1], i):
+                    r[j] -= c*b
+            r[i + dg] = domain.zero
+        del r[dg:]
+    else:
+        rem = []
+        for i in range(df - dg, -1, -1):
+            c = r[i + dg]
+            if c and not c % lc:
+                c = domain.quo(c, lc)
+                q[i] = c
+                for j, b in enumerate(g[:-1], i):
+                    r[j] -= c*b
+            else:
+                rem.append((i + dg, c))
+            r[i + dg] = domain.zero
+        for i, c in rem:
+            r[i] = c
+    return dense_strip(q), dense_strip(r)
+
+
+def dense_divmod(f, g, domain):
+    """Divide dense polynomials, returns quotient and remainder.
+
+    Over fields, for polynomials of degree above ``NEWTON_DIVISION_CUTOFF``
+    config value the division is reduced to multiplication by inverse
+    of the reversed divisor (computed by the Newton iteration), else
+    the classical algorithm is used.  Over rings, terms with leading
+    coefficients not divisible by the leading coefficient of ``g``
+    are moved to the remainder.
+
+    Examples
+    ========
+
+    >>> dense_divmod([QQ(1), QQ(0), QQ(1)], [QQ(1), QQ(1)], QQ)
+    ([-1, 1], [2])
+
+    """
+    if not g:
+        raise ZeroDivisionError('polynomial division')
+    df, dg = len(f) - 1, len(g) - 1
+    if df < dg:
+        return [], f[:]
+    if not domain.is_Field or df - dg < query('NEWTON_DIVISION_CUTOFF'):
+        return _divmod_classical(f, g, domain)
+    n = df - dg + 1
+    rf, rg = f[::-1], dense_reverse(g, dg)
+    q = dense_mul(dense_trunc(rf, n), dense_inv_series(rg, n, domain), domain)
+    q = dense_reverse(dense_trunc(q, n), n - 1)
+    r = dense_sub(f, dense_mul(q, g, domain))
+    return q, r
+
+
+def dense_monic(f, domain):
+    """Divide ``f`` by its leading coefficient."""
+    if not f:
+        return f
+    return dense_mul_ground(f, domain.quo(domain.one, f[-1]))
+
+
+def _shift_classical(f, a):
+    f = f[:]
+    n = len(f)
+    for i in range(n - 1):
+        if a == 1:
+            for j in range(n - 2, i - 1, -1):
+                f[j] += f[j + 1]
+        else:
+            for j in range(n - 2, i - 1, -1):
+                f[j] += a*f[j + 1]
+    return f
+
+
+def _shift_rational(f, a, domain):
+    # For f = F/d and a = p/q, the Taylor shift by p of G with
+    # coefficients F[i]*q**(n - i) is G(y) = q**n*F((y + p)/q).
+    n = len(f) - 1
+    ring = domain.ring
+    d = ring.one
+    for c in f:
+        d = ring.lcm(d, c.denominator)
+    p, q = a.numerator, a.denominator
+    g = [c.numerator*(d//c.denominator)*q**(n - i) for i, c in enumerate(f)]
+    g = _shift_classical(g, p)
+    d *= q**n
+    return [domain(c*q**k, d) for k, c in enumerate(g)]
+
+
+def _shift_convolution(f, a, domain):
+    # The k-th coefficient of f(x + a) is sum(f[k + j]*(k + j)!*a**j/j!)/k!,
+    # i.e. a coefficient of product of reversed f[i]*i! and a**j/j!.
+    n = len(f) - 1
+    fact = [domain.one]
+    for i in range(1, n + 1):
+        fact.append(fact[-1]*i)
+    ifact = [domain.one]*(n + 1)
+    ifact[n] = domain.one/fact[n]
+    for i in range(n, 0, -1):
+        ifact[i - 1] = ifact[i]*i
+    g = [c*fact[i] for i, c in enumerate(f)][::-1]
+    e, c = [], domain.one
+    for j in range(n + 1):
+        e.append(c*ifact[j])
+        c *= a
+    g = dense_mul(g, e, domain)
+    g += [domain.zero]*(n + 1 - len(g))
+    return [ifact[k]*g[n - k] for k in range(n + 1)]
+
+
+def dense_shift(f, a, domain):
+    """Return ``f(x + a)``, i.e. the Taylor shift of ``f`` by ``a``.
+
+    Over finite rings, for polynomials of degree above
+    ``TAYLOR_SHIFT_CUTOFF`` config value, reduces the shift to one
+    multiplication (convolution method), if the degree is less than
+    the characteristic of the field.  Else, uses divide-and-conquer
+    algorithm, that splits ``f = f0 + x**k*f1`` and reduces the shift
+    to multiplication by ``(x + a)**k``.  Over rationals, shifts the
+    polynomial with integer coefficients (denominators are cleared).
+    Else (e.g. coefficients grow), the Horner's scheme is used, with
+    additions only for ``a = 1``.
+
+    References
+    ==========
+
+    * :cite:`Gathen1997taylor`
+
+    Examples
+    ========
+
+    >>> dense_shift([ZZ(1), ZZ(2), ZZ(1)], ZZ(-1), ZZ)
+    [0, 0, 1]
+
+    """
+    cutoff = query('TAYLOR_SHIFT_CUTOFF')
+    if not a or len(f) <= 1:
+        return f[:]
+    if domain.is_RationalField:
+        return _shift_rational(f, a, domain)
+    if not isinstance(domain, FiniteRing) or len(f) <= cutoff:
+        return _shift_classical(f, a)
+    if domain.is_Field and len(f) <= domain.characteristic:
+        return _shift_convolution(f, a, domain)
+
+    powers = [[a, domain.one]]
+    while 1 << len(powers) < len(f):
+        powers.append(dense_mul(powers[-1], powers[-1], domain))
+
+    def shift(f, i):
+        if i < 0 or len(f) <= cutoff:
+            return _shift_classical(f, a)
+        k = 1 << i
+        f0, f1 = dense_strip(f[:k]), f[k:]
+        return dense_add(shift(f0, i - 1),
+                         dense_mul(shift(f1, i - 1), powers[i], domain))
+
+    return shift(f, len(powers) - 1)
+
+
+def _compose_horner(f, g, domain):
+    r = []
+    for c in reversed(f):
+        r = dense_add(dense_mul(r, g, domain), [c] if c else [])
+    return r
+
+
+def dense_compose(f, g, domain):
+    """Return ``f(g)``, i.e. the functional composition.
+
+    For polynomials of degree above ``COMPOSE_CUTOFF`` config value,
+    uses divide-and-conquer algorithm: ``f = f0 + x**k*f1`` is
+    composed as ``f0(g) + g**k*f1(g)`` with precomputed powers
+    ``g**k``, ``k = 2**i``, so the cost is dominated by few
+    multiplications of large polynomials.  Else, the Horner's scheme
+    is used.
+
+    References
+    ==========
+
+    * :cite:`Gathen1999modern`
+
+    Examples
+    ========
+
+    >>> dense_compose([ZZ(1), ZZ(0), ZZ(1)], [ZZ(1), ZZ(1)], ZZ)
+    [2, 2, 1]
+
+    """
+    cutoff = query('COMPOSE_CUTOFF')
+    if len(f) <= cutoff or len(g) <= 1:
+        return _compose_horner(f, g, domain)
+
+    powers = [g]
+    while 1 << len(powers) < len(f):
+        powers.append(dense_mul(powers[-1], powers[-1], domain))
+
+    def compose(f, i):
+        if i < 0 or len(f) <= cutoff:
+            return _compose_horner(f, g, domain)
+        k = 1 << i
+        f0, f1 = dense_strip(f[:k]), f[k:]
+        return dense_add(compose(f0, i - 1),
+                         dense_mul(compose(f1, i - 1), powers[i], domain))
+
+    return compose(f, len(powers) - 1)
+
+
+def dense_composer(h, f, domain):
+    """Return a function, that computes ``g(h)`` modulo ``f`` over a field.
+
+    Uses the Brent-Kung algorithm: for ``m = ceil(sqrt(deg(f)))``
+    powers ``h**i mod f`` with ``i < m`` are computed once, then blocks
+    of ``m`` coefficients of ``g`` give linear combinations of these
+    powers, which are combined by Horner scheme in ``h**m``.  Thus,
+    only about ``deg(g)/m`` modular multiplications are required, see
+    also :func:`~diofant.polys.galoistools.gf_composer`.
+
+    References
+    ==========
+
+    * :cite:`Shoup1995factor`, section 2.2
+
+    Examples
+    ========
+
+    >>> compose = dense_composer([QQ(1), QQ(1)], [QQ(1), QQ(0), QQ(1)], QQ)
+    >>> compose([QQ(0), QQ(0), QQ(1)])
+    [0, 2]
+
+    """
+    def rem(g):
+        return dense_divmod(g, f, domain)[1]
+
+    n = len(f) - 1
+    m = max(math.ceil(math.sqrt(n)), 1)
+
+    H = [rem([domain.one]), rem(h)]
+    for _ in range(1, m):
+        H.append(rem(dense_mul(H[-1], H[1], domain)))
+    H, hm = H[:m], H[m]
+
+    def compose(g):
+        r = []
+        for i in reversed(range(0, len(g), m)):
+            c = [domain.zero]*n
+            for a, p in zip(g[i:i + m], H):
+                if a:
+                    for j, b in enumerate(p):
+                        c[j] += a*b
+            r = dense_add(rem(dense_mul(r, hm, domain)), dense_strip(c))
+        return r
+
+    return compose
+
+
+def dense_compose_mod(g, h, f, domain):
+    """Compute ``g(h)`` modulo ``f`` over a field, see :func:`dense_composer`.
+
+    Examples
+    ========
+
+    >>> dense_compose_mod([QQ(0), QQ(0), QQ(1)], [QQ(1), QQ(1)],
+    ...                   [QQ(1), QQ(0), QQ(1)], QQ)
+    [0, 2]
+
+    """
+    return dense_composer(h, f, domain)(g)
+
+
+def dense_interpolate(xs, ys, domain):
+    """Return polynomial of degree less than ``len(xs)``, that takes values ``ys`` at ``xs``.
+
+    Uses the Lagrange interpolation over a field: the polynomial
+    ``M = prod(x - xs[i])`` is divided by every ``x - xs[i]``, thus
+    only one inversion per point is required.
+
+    Examples
+    ========
+
+    >>> dense_interpolate([QQ(0), QQ(1), QQ(2)], [QQ(1), QQ(2), QQ(5)], QQ)
+    [1, 0, 1]
+
+    """
+    k = len(xs)
+    M = [domain.one]
+    for a in xs:
+        M = [domain.zero] + M
+        for j in range(len(M) - 1):
+            M[j] -= a*M[j + 1]
+    f = [domain.zero]*k
+    for a, b in zip(xs, ys):
+        if not b:
+            continue
+        q, c = [domain.zero]*k, domain.zero
+        for j in range(k, 0, -1):
+            c = M[j] + c*a
+            q[j - 1] = c
+        w = domain.zero
+        for c in reversed(q):
+            w = w*a + c
+        b /= w
+        for j, c in enumerate(q):
+            f[j] += b*c
+    return dense_strip(f)
+
+
+def _matmul(A, B, domain):
+    (a11, a12), (a21, a22) = A
+    (b11, b12), (b21, b22) = B
+    mul = dense_mul
+    return ((dense_add(mul(a11, b11, domain), mul(a12, b21, domain)),
+             dense_add(mul(a11, b12, domain), mul(a12, b22, domain))),
+            (dense_add(mul(a21, b11, domain), mul(a22, b21, domain)),
+             dense_add(mul(a21, b12, domain), mul(a22, b22, domain))))
+
+
+def _matvec(A, a, b, domain):
+    (a11, a12), (a21, a22) = A
+    mul = dense_mul
+    return (dense_add(mul(a11, a, domain), mul(a12, b, domain)),
+            dense_add(mul(a21, a, domain), mul(a22, b, domain)))
+
+
+def dense_half_gcd(a, b, domain, quotients=None):
+    """Half-GCD of dense polynomials over a field.
+
+    For ``deg(a) > deg(b)`` returns 2x2 matrix ``M``, product of
+    Euclidean steps, such that ``(c, d) = M*(a, b)`` are consecutive
+    remainders of the Euclidean algorithm with
+    ``deg(c) >= ceil(deg(a)/2) > deg(d)``.  If the list ``quotients``
+    is given, quotients of these steps are appended to it.
+
+    References
+    ==========
+
+    * :cite:`Gathen1999modern`, section 11.1
+
+    """
+    one, zero = [domain.one], []
+    identity = ((one, zero), (zero, one))
+
+    n = len(a) - 1
+    m = (n + 1)//2
+    if len(b) - 1 < m:
+        return identity
+
+    R = dense_half_gcd(a[m:], b[m:], domain, quotients)
+    c, d = _matvec(R, a, b, domain)
+    if len(d) - 1 < m:
+        return R
+
+    q, r = dense_divmod(c, d, domain)
+    if quotients is not None:
+        quotients.append(q)
+    R = _matmul(((zero, one), (one, dense_sub(zero, q))), R, domain)
+    c, d = d, r
+    if len(d) - 1 < m:
+        return R
+
+    k = max(2*m - (len(c) - 1), 0)
+    S = dense_half_gcd(c[k:], d[k:], domain, quotients)
+    return _matmul(S, R, domain)
+
+
+def _euclid(f, g, domain, quotients=None):
+    # Return the last non-zero remainder of the Euclidean algorithm
+    # for deg(f) >= deg(g), optionally collecting all quotients.
+    cutoff = query('HALF_GCD_CUTOFF')
+    while g:
+        if len(g) > cutoff and len(f) > len(g):
+            M = dense_half_gcd(f, g, domain, quotients)
+            f, g = _matvec(M, f, g, domain)
+            if not g:
+                break
+        q, r = dense_divmod(f, g, domain)
+        if quotients is not None:
+            quotients.append(q)
+        f, g = g, r
+    return f
+
+
+def dense_gcd(f, g, domain):
+    """Monic GCD of dense polynomials over a field.
+
+    Uses the half-GCD algorithm for polynomials of degree above
+    ``HALF_GCD_CUTOFF`` config value, else the Euclidean algorithm.
+
+    Examples
+    ========
+
+    >>> F = FF(7)
+    >>> dense_gcd([F(6), F(0), F(1)], [F(1), F(1)], F)
+    [1 mod 7, 1 mod 7]
+
+    """
+    if len(f) < len(g):
+        f, g = g, f
+    return dense_monic(_euclid(f, g, domain), domain)
+
+
+def dense_resultant(f, g, domain):
+    """Resultant of dense polynomials over a field.
+
+    Degrees and leading coefficients of all remainders of the
+    Euclidean algorithm are recovered from the sequence of quotients
+    (computed with the half-GCD algorithm for polynomials of degree
+    above ``HALF_GCD_CUTOFF`` config value), then the resultant is
+    the product of their powers.
+
+    References
+    ==========
+
+    * :cite:`Gathen1999modern`, section 11.2
+
+    Examples
+    ========
+
+    >>> dense_resultant([QQ(1), QQ(0), QQ(1)], [QQ(-1), QQ(0), QQ(1)], QQ)
+    4
+
+    """
+    if not f or not g:
+        return domain.zero
+
+    n, m = len(f) - 1, len(g) - 1
+    if n < m:
+        r = dense_resultant(g, f, domain)
+        return -r if n*m % 2 else r
+
+    quotients = []
+    _euclid(f, g, domain, quotients)
+
+    degs, lcs = [n], [f[-1]]
+    for q in quotients:
+        degs.append(degs[-1] - len(q) + 1)
+        lcs.append(lcs[-1]/q[-1])
+    if degs[-1]:
+        return domain.zero
+
+    r = domain.one
+    degs.append(0)
+    for i in range(1, len(lcs)):
+        r *= lcs[i]**(degs[i - 1] - degs[i + 1])
+        if degs[i - 1]*degs[i] % 2:
+            r = -r
+    return r
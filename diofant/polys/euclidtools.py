@@ -2,8 +2,13 @@
 
 import operator
 
+from ..core.power import integer_nthroot
 from ..ntheory import nextprime
 from ..ntheory.modular import crt, symmetric_residue
+from .densearith import (dense_gcd, dense_interpolate, dense_resultant,
+                         dense_strip)
+from .galoistools import (gf_gcd, gf_interpolate, gf_modulus, gf_resultant,
+                          gf_resultant_bivariate)
 from .polyconfig import query
 from .polyerrors import DomainError, HeuristicGCDFailed, HomomorphismFailed
 
@@ -88,6 +93,8 @@ def _gcd(self, f, g):
 
             return tuple(map(operator.methodcaller('set_domain', domain),
                              ring.cofactors(f, g)))
+        elif domain.is_FiniteField and self.is_univariate:
+            return self._gf_gcd(f, g)
         elif domain.is_Field:
             return self._ff_prs_gcd(f, g)
         else:
@@ -270,6 +277,44 @@ def _rr_prs_gcd(self, f, g):
 
         return h, f // h, g // h
 
+    def _gf_gcd(self, f, g):
+        """Computes polynomial GCD in `GF(p)[x]`, using dense arithmetics."""
+        domain = self.domain
+        p = gf_modulus(domain)
+        if p is not None:
+            h = gf_gcd([int(c) for c in f._to_dense()],
+                       [int(c) for c in g._to_dense()], p)
+            h = self._from_dense(list(map(domain.dtype, h)))
+        else:
+            h = self._from_dense(dense_gcd(f._to_dense(), g._to_dense(),
+                                           domain))
+        return h, f // h, g // h
+
+    def _gf_resultant(self, f, g):
+        """
+        Computes resultant in `GF(q)[x]`, using dense arithmetics.
+
+        Over prime fields of word-size order, the Euclidean algorithm
+        with raw integers is used for polynomials of degree up to
+        ``HALF_GCD_CUTOFF`` config value, else the half-GCD algorithm
+        (see :func:`~diofant.polys.densearith.dense_resultant`).
+
+        Examples
+        ========
+
+        >>> R, x = ring('x', FF(7))
+
+        >>> R._gf_resultant(x**2 + 1, x**2 - 1)
+        4 mod 7
+
+        """
+        domain = self.domain
+        p = gf_modulus(domain)
+        if p is not None and max(f.degree(), g.degree()) <= query('HALF_GCD_CUTOFF'):
+            return domain(gf_resultant([int(c) for c in f._to_dense()],
+                                       [int(c) for c in g._to_dense()], p))
+        return dense_resultant(f._to_dense(), g._to_dense(), domain)
+
     def _ff_prs_gcd(self, f, g):
         """Computes polynomial GCD using subresultants over a field."""
         ring = self
@@ -405,23 +450,29 @@ def _collins_resultant(self, f, g):
 
             ring = ring.clone(domain=domain.ring)
             r = ring._collins_resultant(f, g)
-            r = r.set_domain(domain)
+            c = domain.convert(cf**m * cg**n, domain.ring)
+
+            if ring.is_univariate:
+                return domain.convert(r, domain.ring)/c
 
-            c = cf**n * cg**m
-            c = domain.convert(c, domain.ring)
+            r = r.set_domain(domain)
 
             return r.quo_ground(c)
 
         assert domain.is_IntegerRing
 
-        A = f.max_norm()
-        B = g.max_norm()
-
         a, b = f.LC, g.LC
 
-        B = domain(2)*domain.factorial(domain(n + m))*A**m*B**n
+        # Hadamard's bound for coefficients of the Sylvester's determinant.
+        if ring.is_univariate:
+            B = integer_nthroot(sum(c**2 for c in f.values())**m *
+                                sum(c**2 for c in g.values())**n, 2)[0] + 1
+        else:
+            B = f.l1_norm()**m*g.l1_norm()**n
+
+        B *= 2
         new_ring = ring.drop(0)
-        r, p, P = new_ring.zero, domain.one, domain.one
+        r, p, P = new_ring.zero, domain(2**62), domain.one
 
         while P <= B:
             while True:
@@ -437,21 +488,18 @@ def _collins_resultant(self, f, g):
             except HomomorphismFailed:
                 continue
 
-            if P == domain.one:
-                r = R
-            else:
-                def _crt(r, R):
-                    return domain(crt([P, p], map(domain.convert, [r, R]),
-                                  check=False, symmetric=True)[0])
+            def _crt(r, R):
+                return domain(crt([P, p], map(domain.convert, [r, R]),
+                              check=False, symmetric=True)[0])
 
-                if new_ring.is_PolynomialRing:
-                    r_new = new_ring.zero
+            if new_ring.is_PolynomialRing:
+                r_new = new_ring.zero
 
-                    for monom in set(r.keys()) | set(R.keys()):
-                        r_new[monom] = _crt(r.get(monom, 0), R.get(monom, 0))
-                    r = r_new
-                else:
-                    r = _crt(r, R)
+                for monom in set(r.keys()) | set(R.keys()):
+                    r_new[monom] = _crt(r.get(monom, 0), R.get(monom, 0))
+                r = r_new
+            else:
+                r = _crt(r, R)
 
             P *= p
 
@@ -461,6 +509,9 @@ def _modular_resultant(self, f, g):
         """
         Compute resultant of `f` and `g` in `GF(p)[X]`.
 
+        Multivariate resultants are interpolated from values at
+        enough points, where the degrees of `f` and `g` are preserved.
+
         References
         ==========
 
@@ -473,7 +524,7 @@ def _modular_resultant(self, f, g):
         assert domain.is_FiniteField
 
         if ring.is_univariate:
-            return ring._primitive_prs(f, g)[0]
+            return ring._gf_resultant(f, g)
 
         n = f.degree()
         m = g.degree()
@@ -484,11 +535,22 @@ def _modular_resultant(self, f, g):
         B = n*M + m*N
 
         new_ring = ring.drop(0)
-        r = new_ring.zero
-        D = ring.eject(1).domain.one
+        p = gf_modulus(domain)
+
+        if p is not None and ring.ngens == 2 and p > B + N + M:
+            F, G = [[[0]*(max(N, M) + 1) for _ in range(h.degree() + 1)]
+                    for h in (f, g)]
+            for h, H in ((f, F), (g, G)):
+                for (i, j), c in h.items():
+                    H[i][j] = int(c)
+            r = gf_resultant_bivariate([dense_strip(c) for c in F],
+                                       [dense_strip(c) for c in G], p)
+            return new_ring._from_dense(list(map(domain.dtype, r)))
+
+        points, values = [], []
         domain_elts = iter(range(domain.order))
 
-        while D.degree() <= B:
+        while len(points) <= B:
             while True:
                 try:
                     a = next(domain_elts)
@@ -503,19 +565,25 @@ def _modular_resultant(self, f, g):
                     if G.degree() == m:
                         break
 
-            R = ring.drop(1)._modular_resultant(F, G)
-            e = r.eval(x=0, a=a)
+            points.append(domain(a))
+            values.append(ring.drop(1)._modular_resultant(F, G))
 
-            if new_ring.is_univariate:
-                R = new_ring.ground_new(R)
-                e = new_ring.ground_new(e)
-            else:
-                R = R.set_ring(new_ring)
-                e = e.set_ring(new_ring)
+        def interpolate(values):
+            if p is not None:
+                coeffs = gf_interpolate([int(_) for _ in points],
+                                        [int(_) for _ in values], p)
+                return list(map(domain.dtype, coeffs))
+            return dense_interpolate(points, values, domain)
+
+        if new_ring.is_univariate:
+            return new_ring._from_dense(interpolate(values))
+
+        r = new_ring.zero
 
-            d = D * D.eval(x=0, a=a)**-1
-            d = d.set_ring(new_ring)
-            r += d*(R - e)
-            D *= D.ring.gens[0] - a
+        for monom in set().union(*values):
+            coeffs = interpolate([v.get(monom, domain.zero) for v in values])
+            for k, c in enumerate(coeffs):
+                if c:
+                    r[(k,) + monom] = c
 
         return r
@@ -1,18 +1,71 @@
 """Polynomial factorization routines in characteristic zero."""
 
 import functools
+import itertools
 import math
 import operator
 
+from ..core.power import integer_nthroot
+from ..domains import QQ
 from ..ntheory import factorint, isprime, nextprime
 from ..ntheory.modular import symmetric_residue
 from ..utilities import subsets
-from .polyconfig import query
+from .densearith import dense_mul, dense_strip
+from .galoistools import gf_berlekamp, gf_ddf_shoup, gf_modulus, gf_trace_map
+from .polyconfig import process_pool, query
 from .polyerrors import (CoercionFailed, DomainError, EvaluationFailed,
                          ExtraneousFactors)
 from .polyutils import _sort_factors
 
 
+def _zz_factor_mod_p(f, p):
+    """Return monic factors of ``f`` modulo ``p`` or ``None``, if ``f`` isn't square-free modulo ``p``."""
+    domain = f.ring.domain
+    F = f.set_domain(domain.finite_field(p))
+
+    if not F.is_squarefree:
+        return
+
+    return [_.set_domain(domain) for _, k in F.monic().factor_list()[1]]
+
+
+def _dense_trunc_ground(f, p):
+    """Reduce integer coefficients of dense ``f`` to symmetric residues modulo ``p``."""
+    return dense_strip([symmetric_residue(c % p, p) for c in f])
+
+
+def _dense_primitive(f, domain):
+    """Divide dense ``f`` over integers by the content."""
+    c = functools.reduce(domain.gcd, f, domain.zero)
+    if f[-1] < 0:
+        c = -c
+    return [a // c for a in f]
+
+
+def _modular_images(func, f, primes, pool=None):
+    """Generate pairs ``(p, func(f, p))`` for given primes.
+
+    If ``pool`` is given, images are computed by batches (of the size
+    of the pool), but generated in the order of primes.
+
+    """
+    primes = iter(primes)
+    size = 1 if pool is None else query('MODULAR_WORKERS')
+
+    while True:
+        batch = list(itertools.islice(primes, size))
+        if not batch:
+            return
+
+        if pool is None:
+            images = [func(f, p) for p in batch]
+        else:
+            images = [pool.submit(func, f, p) for p in batch]
+            images = [image.result() for image in images]
+
+        yield from zip(batch, images)
+
+
 class _Factor:
     """Mixin class for factorization routines."""
 
@@ -183,29 +236,31 @@ def _zz_zassenhaus(self, f):
         # choose a prime number `p` such that `f` be square free in Z_p
         # if there are many factors in Z_p, choose among a few different `p`
         # the one with fewer factors
-        for p in range(3, bound + 1):  # pragma: no branch
-            if not isprime(p) or b % p == 0:
-                continue
-
-            p = domain.convert(p)
-            p_domain = domain.finite_field(p)
-
-            F = f.set_domain(p_domain)
+        primes = (domain.convert(p) for p in range(3, bound + 1)
+                  if isprime(p) and b % p)
 
-            if not F.is_squarefree:
-                continue
-
-            F = F.monic()
-            fsqfx = [_ for _, k in F.factor_list()[1]]
+        with process_pool() as pool:
+            for p, fsqfx in _modular_images(_zz_factor_mod_p, f, primes, pool):
+                if fsqfx is None:
+                    continue
 
-            a.append((p, [_.set_domain(domain) for _ in fsqfx]))
-            if len(fsqfx) < 15 or len(a) > 4:
-                break
+                a.append((p, fsqfx))
+                if len(fsqfx) < 15 or len(a) > 4:
+                    break
         p, fsqf = min(a, key=lambda x: len(x[1]))
 
+        if (query('ZZ_FACTOR_METHOD') == 'van_hoeij' and
+                len(fsqf) > query('VAN_HOEIJ_CUTOFF')):
+            factors = self._zz_van_hoeij(f, p, fsqf)
+            if factors is not None:
+                return factors
+
         l = math.ceil(math.log(2*B + 1, p))
         g = self._zz_hensel_lift(p, f, fsqf, l)
 
+        # recombination is done with dense lists of integer coefficients
+        g = [h._to_dense() for h in g]
+
         sorted_T = range(len(g))
         T = set(sorted_T)
         factors, s = [], 1
@@ -220,45 +275,45 @@ def _zz_zassenhaus(self, f):
                 if b == 1:
                     q = 1
                     for i in S:
-                        q = q*g[i].coeff(1)
+                        q = q*g[i][0]
                     q = q % pl
                     qs = symmetric_residue(q, pl)
                     if qs and fc % qs != 0:
                         continue
                 else:
-                    G = self.ground_new(b)
+                    G = [b]
                     for i in S:
-                        G *= g[i]
-                    G = G.trunc_ground(pl)
-                    _, G = G.primitive()
-                    q = G.coeff(1)
+                        G = dense_mul(G, g[i], domain)
+                    G = _dense_trunc_ground(G, pl)
+                    G = _dense_primitive(G, domain)
+                    q = G[0]
                     if q and fc % q != 0:
                         continue
 
-                H = self.ground_new(b)
+                H = [b]
                 S = set(S)
                 T_S = T - S
 
                 if b == 1:
-                    G = self.ground_new(b)
+                    G = [b]
                     for i in S:
-                        G *= g[i]
-                    G = G.trunc_ground(pl)
+                        G = dense_mul(G, g[i], domain)
+                    G = _dense_trunc_ground(G, pl)
 
                 for i in T_S:
-                    H *= g[i]
+                    H = dense_mul(H, g[i], domain)
 
-                H = H.trunc_ground(pl)
+                H = _dense_trunc_ground(H, pl)
 
-                G_norm = G.l1_norm()
-                H_norm = H.l1_norm()
+                G_norm = sum(map(abs, G))
+                H_norm = sum(map(abs, H))
 
                 if G_norm*H_norm <= B:
                     T = T_S
                     sorted_T = [i for i in sorted_T if i not in S]
 
-                    G = G.primitive()[1]
-                    f = H.primitive()[1]
+                    G = self._from_dense(_dense_primitive(G, domain))
+                    f = self._from_dense(_dense_primitive(H, domain))
 
                     factors.append(G)
                     b = f.LC
@@ -269,6 +324,160 @@ def _zz_zassenhaus(self, f):
 
         return factors + [f]
 
+    def _zz_van_hoeij(self, f, p, fsqf):
+        """
+        Factor primitive square-free polynomial in `Z[x]`, using the lattice
+        reduction for recombination of modular factors.
+
+        Given monic factors ``fsqf`` of ``f`` modulo ``p``, returns the
+        list of irreducible factors of ``f`` or ``None`` (if several
+        attempts to increase the precision were not successful).
+
+        Polynomial is transformed to be monic.  A true factor is a product
+        of some lifted modular factors, the sum of their power sums of
+        roots (traces) is bounded, i.e. the 0-1 vector of such factor is
+        short in the lattice, spanned by the vectors of traces and
+        the modulus.  Traces are added one by one, after each step
+        vectors, that are too long, are discarded.  Once the basis is
+        reduced to 0-1 vectors of a partition of the modular factors,
+        candidates are verified by the trial division.  Vectors are
+        discarded only if their Gram-Schmidt norms exceed the bound on
+        norms of vectors of true factors, thus a single remaining vector
+        (which must be the vector of the product of all modular factors)
+        certifies, that ``f`` is irreducible.
+
+        References
+        ==========
+
+        * :cite:`vanHoeij2002knapsack`
+        * :cite:`Belabas2004relative`
+
+        """
+        from ..matrices.lll import _lll
+
+        domain = self.domain
+
+        n = f.degree()
+        b = f.LC
+        r = len(fsqf)
+
+        def monic(g):
+            d = g.degree()
+            return self.from_dict({(k,): c*b**(d - k - 1) if k < d else domain.one
+                                   for (k,), c in g.items()})
+
+        F = monic(f)
+        fsqf = [monic(g*b).trunc_ground(p) for g in fsqf]
+
+        # Fujiwara's bound for roots of F
+        R = 1
+        for k in range(1, n + 1):
+            c = abs(F.coeff((n - k,)))
+            if c:
+                t, exact = integer_nthroot(int(c), k)
+                R = max(R, t + (not exact))
+        R *= 2
+
+        # upper bounds for traces
+        e = [None] + [(n*R**j).bit_length() for j in range(1, n + 1)]
+
+        def norm_bound(N):
+            return r + N*(r + 2)**2
+
+        extra = r//2 + norm_bound(n).bit_length() + 10
+        bits = max(int(self._zz_mignotte_bound(F)).bit_length() + 1,
+                   e[min(5, n)] + extra)
+
+        for _ in range(5):
+            l = bits//int(p).bit_length() + 1
+            P = p**l
+            G = self._zz_hensel_lift(p, F, fsqf, l)
+
+            # traces of G[i], using Newton's identities
+            traces = []
+            for g in G:
+                d, s = g.degree(), [None]
+                c = [g.coeff((d - k,)) if k <= d else 0 for k in range(n + 1)]
+                for k in range(1, n + 1):
+                    s.append(-(k*c[k] + sum(c[i]*s[k - i]
+                                            for i in range(1, k))) % P)
+                traces.append(s)
+
+            basis = [[int(i == j) for j in range(r)] for i in range(r)]
+
+            for N in range(1, n + 1):
+                if P.bit_length() - e[N] < extra:
+                    break
+
+                # drop the lower bits
+                def cut(c):
+                    return (2*c + (1 << e[N])) >> (e[N] + 1)
+
+                column = [cut(symmetric_residue(s[N], P)) for s in traces]
+                for v in basis:
+                    v.append(sum(a*c for a, c in zip(v, column)))
+                basis.append([0]*(r + N - 1) + [cut(P)])
+
+                basis, d, _ = _lll(basis)
+
+                M = norm_bound(N)
+                while d[len(basis)] > M*d[len(basis) - 1]:
+                    basis.pop()
+
+                if len(basis) == 1:
+                    # vectors of all true factors are in the span of the
+                    # remaining vector, so it must be the vector of ``F``
+                    # itself and ``F`` is irreducible, else bounds were
+                    # violated and we fall back to the subset search
+                    if set(basis[0][:r]) in ({1}, {-1}):
+                        return [f]
+                    return
+
+                factors = self._zz_van_hoeij_factors(F, G, P, basis, r)
+
+                if factors is not None:
+                    return [self.from_dict({(k,): c*b**k for (k,), c in h.items()}).primitive()[1]
+                            for h in factors]
+
+            bits *= 2
+
+    def _zz_van_hoeij_factors(self, F, G, P, basis, r):
+        """Return factors of ``F``, if the basis gives partition of ``G``."""
+        rows = [[QQ(c) for c in v[:r]] for v in basis]
+
+        # reduced row echelon form
+        i = 0
+        for j in range(r):
+            k = next((k for k in range(i, len(rows)) if rows[k][j]), None)
+            if k is None:
+                continue
+            rows[i], rows[k] = rows[k], rows[i]
+            rows[i] = [c/rows[i][j] for c in rows[i]]
+            for k, row in enumerate(rows):
+                if k != i and row[j]:
+                    rows[k] = [a - row[j]*c for a, c in zip(row, rows[i])]
+            i += 1
+
+        if (any(c not in (0, 1) for row in rows for c in row) or
+                [sum(col) for col in zip(*rows)] != [1]*r):
+            return
+
+        factors = []
+
+        for row in rows:
+            h = self.one
+            for g, c in zip(G, row):
+                if c:
+                    h = (h*g).trunc_ground(P)
+            q, rem = divmod(F, h)
+            if rem:
+                return
+            F = q
+            factors.append(h)
+
+        if F == 1:
+            return factors
+
     def _zz_factor_sqf(self, f):
         """Factor square-free (non-primitive) polynomials in `Z[x]`."""
         domain = self.domain
@@ -525,12 +734,13 @@ def _gf_irreducible_p_ben_or(self, f):
         f = f.monic()
 
         H = h = pow(x, q, f)
+        compose = self._composer(H, f)
 
         for i in range(n//2):
             g = h - x
 
             if self.gcd(f, g) == 1:
-                h = h.compose(x, H) % f
+                h = compose(h)
             else:
                 return False
 
@@ -560,6 +770,7 @@ def _gf_irreducible_p_rabin(self, f):
         indices = {n//d for d in factorint(n)}
 
         H = h = pow(x, q, f)
+        compose = self._composer(H, f)
 
         for i in range(1, n):
             if i in indices:
@@ -568,7 +779,7 @@ def _gf_irreducible_p_rabin(self, f):
                 if self.gcd(f, g) != 1:
                     return False
 
-            h = h.compose(x, H) % f
+            h = compose(h)
 
         return h == x
 
@@ -1178,6 +1389,9 @@ def _gf_berlekamp(self, f):
         """
         Factor a square-free polynomial over finite fields of small order.
 
+        Over prime fields of word-size order, computations are done
+        with raw integers, see :func:`~diofant.polys.galoistools.gf_berlekamp`.
+
         Examples
         ========
 
@@ -1198,6 +1412,13 @@ def _gf_berlekamp(self, f):
         assert self.is_univariate
 
         domain = self.domain
+        p = gf_modulus(domain)
+
+        if p is not None:
+            factors = gf_berlekamp([int(c) for c in f._to_dense()], p)
+            factors = [self._from_dense(list(map(domain.dtype, g)))
+                       for g in factors]
+            return _sort_factors(factors, multiple=False)
 
         Q = self._gf_Qmatrix(f)
         Q = RawMatrix(Q) - RawMatrix.eye(len(Q))
@@ -1370,6 +1591,8 @@ def _gf_ddf_shoup(self, f):
 
         This algorithm is an improved version of Zassenhaus algorithm for
         large ``deg(f)`` and order ``q`` (especially for ``deg(f) ~ lg(q)``).
+        Over prime fields of word-size order, computations are done
+        with raw integers, see :func:`~diofant.polys.galoistools.gf_ddf_shoup`.
 
         Examples
         ========
@@ -1392,6 +1615,11 @@ def _gf_ddf_shoup(self, f):
 
         """
         domain = self.domain
+        p = gf_modulus(domain)
+
+        if p is not None:
+            return [(self._from_dense(list(map(domain.dtype, g))), e)
+                    for g, e in gf_ddf_shoup([int(c) for c in f._to_dense()], p)]
 
         n, q = f.degree(), domain.order
         k = math.ceil(math.sqrt(n//2))
@@ -1401,16 +1629,18 @@ def _gf_ddf_shoup(self, f):
 
         # U[i] = x**(q**i)
         U = [x, h] + [self.zero]*(k - 1)
+        compose = self._composer(h, f)
 
         for i in range(2, k + 1):
-            U[i] = U[i - 1].compose(x, h) % f
+            U[i] = compose(U[i - 1])
 
         h, U = U[k], U[:k]
         # V[i] = x**(q**(k*(i+1)))
         V = [h] + [self.zero]*(k - 1)
+        compose = self._composer(h, f)
 
         for i in range(1, k):
-            V[i] = V[i - 1].compose(x, h) % f
+            V[i] = compose(V[i - 1])
 
         factors = []
 
@@ -1454,7 +1684,9 @@ def _gf_trace_map(self, a, b, c, n, f):
         In factorization context, ``b = x**q mod f`` and ``c = x mod f``.
         This way we can efficiently compute trace polynomials in equal
         degree factorization routine, much faster than with other methods,
-        like iterated Frobenius algorithm, for large degrees.
+        like iterated Frobenius algorithm, for large degrees.  Over prime
+        fields of word-size order, compositions are computed by
+        :func:`~diofant.polys.galoistools.gf_composer`.
 
         Examples
         ========
@@ -1473,7 +1705,15 @@ def _gf_trace_map(self, a, b, c, n, f):
         * :cite:`Gathen1992ComputingFM`, algorithm 5.2
 
         """
-        u = a.compose(0, b) % f
+        domain = self.domain
+        p = gf_modulus(domain)
+
+        if p is not None:
+            a, b, c, f = ([int(_) for _ in g._to_dense()] for g in (a, b, c, f))
+            return tuple(self._from_dense(list(map(domain.dtype, g)))
+                         for g in gf_trace_map(a, b, c, n, f, p))
+
+        u = a.compose_mod(b, f)
         v = b
 
         if n & 1:
@@ -1486,16 +1726,18 @@ def _gf_trace_map(self, a, b, c, n, f):
         n >>= 1
 
         while n:
-            u += u.compose(0, v) % f
-            v = v.compose(0, v) % f
+            compose = self._composer(v, f)
+            u += compose(u)
+            v = compose(v)
 
             if n & 1:
-                U += u.compose(0, V) % f
-                V = v.compose(0, V) % f
+                compose = self._composer(V, f)
+                U += compose(u)
+                V = compose(v)
 
             n >>= 1
 
-        return a.compose(0, V) % f, U
+        return a.compose_mod(V, f), U
 
     def _gf_edf_shoup(self, f, n):
         """
@@ -0,0 +1,890 @@
+"""Arithmetics for dense univariate polynomials over prime finite fields.
+
+Polynomials are represented by lists of Python integers in the range
+``0 <= c < p`` in ascending order, without trailing zeros, i.e. the zero
+polynomial is the empty list.  Unlike elements of
+:class:`~diofant.domains.FiniteField`, raw integers are not reduced on
+every arithmetic operation: products are accumulated and reduced only
+once per coefficient (delayed reduction).
+
+"""
+
+import array
+import math
+import operator
+import random
+import sys
+
+from ..domains import ZZ
+from ..external import import_module
+from .densearith import dense_strip
+from .polyconfig import query
+
+
+# primes below this bound are considered to be word-size ones
+WORD_SIZE = 2**63
+
+
+def gf_modulus(domain):
+    """Return the characteristic of ``domain`` if the kernel is applicable.
+
+    The kernel is used for prime fields of word-size order, if the
+    ``USE_GF_KERNEL`` config value is set.  Else, returns ``None``.
+
+    Examples
+    ========
+
+    >>> gf_modulus(FF(7))
+    7
+    >>> gf_modulus(FF(4)) is None
+    True
+
+    """
+    if (query('USE_GF_KERNEL') and domain.is_FiniteField and
+            domain.order == domain.characteristic and domain.order < WORD_SIZE):
+        return int(domain.characteristic)
+
+
+def gf_add(f, g, p):
+    """Add dense polynomials over ``GF(p)``."""
+    if len(f) < len(g):
+        f, g = g, f
+    h = f[:]
+    for i, c in enumerate(g):
+        h[i] = (h[i] + c) % p
+    return dense_strip(h)
+
+
+def gf_sub(f, g, p):
+    """Subtract dense polynomials over ``GF(p)``."""
+    if len(f) < len(g):
+        f = f + [0]*(len(g) - len(f))
+    h = f[:]
+    for i, c in enumerate(g):
+        h[i] = (h[i] - c) % p
+    return dense_strip(h)
+
+
+def gf_mul(f, g, p):
+    """Multiply dense polynomials over ``GF(p)``.
+
+    Uses the Kronecker substitution, if the ``USE_KRONECKER`` config
+    value is set and the product of numbers of nonzero terms is at
+    least ``GF_KRONECKER_CUTOFF`` config value (and not less than the
+    length of the result), else the classical algorithm with delayed
+    reduction.
+
+    Examples
+    ========
+
+    >>> gf_mul([3, 1], [4, 1], 5)
+    [2, 2, 1]
+
+    """
+    if not f or not g:
+        return []
+    n = (len(f) - f.count(0))*(len(g) - g.count(0))
+    if (query('USE_KRONECKER') and n >= query('GF_KRONECKER_CUTOFF') and
+            len(f) + len(g) - 1 <= n):
+        h = _kronecker_mul(f, g, p)
+    else:
+        if len(f) < len(g):
+            f, g = g, f
+        h = [0]*(len(f) + len(g) - 1)
+        for j, c in enumerate(g):
+            if c:
+                for i, a in enumerate(f, j):
+                    h[i] += a*c
+    return dense_strip([c % p for c in h])
+
+
+def _kronecker_mul(f, g, p):
+    # coefficients are nonnegative, so no sign handling is needed,
+    # for small p polynomials are packed to integers via machine words
+    # and the product is computed with ground types (e.g. gmpy2's)
+    n = len(f) + len(g) - 1
+    k = (min(len(f), len(g))*(p - 1)**2).bit_length()//8 + 1
+    if k <= 8:
+        a, b = (ZZ.dtype(int.from_bytes(array.array('Q', _).tobytes(),
+                                        sys.byteorder)) for _ in (f, g))
+        h = int(a*b).to_bytes(8*n, sys.byteorder)
+        return array.array('Q', h).tolist()
+    a, b = (b''.join([c.to_bytes(k, 'little') for c in _]) for _ in (f, g))
+    a, b = (ZZ.dtype(int.from_bytes(_, 'little')) for _ in (a, b))
+    h = int(a*b).to_bytes(n*k, 'little')
+    return [int.from_bytes(h[i:i + k], 'little') for i in range(0, n*k, k)]
+
+
+def gf_divmod(f, g, p):
+    """Divide dense polynomials over ``GF(p)``, returns quotient and remainder.
+
+    Coefficients of the remainder are reduced only once they become
+    leading ones.
+
+    Examples
+    ========
+
+    >>> gf_divmod([1, 0, 1], [1, 1], 7)
+    ([6, 1], [2])
+
+    """
+    if not g:
+        raise ZeroDivisionError('polynomial division')
+    df, dg = len(f) - 1, len(g) - 1
+    if df < dg:
+        return [], f[:]
+    r = f[:]
+    q = [0]*(df - dg + 1)
+    inv = pow(g[-1], p - 2, p)
+    g = g[:-1]
+    for i in range(df - dg, -1, -1):
+        c = r[i + dg] % p*inv % p
+        if c:
+            q[i] = c
+            r[i:i + dg] = [a - c*b for a, b in zip(r[i:i + dg], g)]
+    return dense_strip(q), dense_strip([c % p for c in r[:dg]])
+
+
+def gf_rem(f, g, p):
+    """Return remainder of the division of ``f`` by ``g`` over ``GF(p)``."""
+    return gf_divmod(f, g, p)[1]
+
+
+def gf_quo(f, g, p):
+    """Return quotient of the division of ``f`` by ``g`` over ``GF(p)``."""
+    return gf_divmod(f, g, p)[0]
+
+
+def gf_inv_series(f, n, p):
+    """Compute inverse of ``f`` modulo ``x**n`` over ``GF(p)``, using Newton iteration.
+
+    The constant term of ``f`` must be nonzero.
+
+    Examples
+    ========
+
+    >>> gf_inv_series([1, 1], 4, 7)
+    [1, 6, 1, 6]
+
+    """
+    g = [pow(f[0], p - 2, p)]
+    k = 1
+    while k < n:
+        k = min(2*k, n)
+        e = gf_mul(f[:k], g, p)[:k]
+        e = gf_sub([1], e, p)
+        g = dense_strip(gf_add(g, gf_mul(g, e, p), p)[:k])
+    return g
+
+
+def gf_reducer(g, p):
+    """Return a function, that computes remainders modulo ``g`` over ``GF(p)``.
+
+    Remainders of polynomials of degree less than ``2*deg(g)`` are
+    computed by two multiplications, using the inverse of reversed
+    ``g`` (precomputed once by :func:`gf_inv_series`), if the degree
+    of ``g`` is above the ``GF_NEWTON_DIVISION_CUTOFF`` config value.
+    Else, the classical division is used.
+
+    Examples
+    ========
+
+    >>> rem = gf_reducer([1, 0, 1], 3)
+    >>> rem([0, 0, 0, 1])
+    [0, 2]
+
+    """
+    dg = len(g) - 1
+    if dg < query('GF_NEWTON_DIVISION_CUTOFF'):
+        return lambda f: gf_rem(f, g, p)
+    inv = gf_inv_series(g[::-1], dg, p)
+
+    def rem(f):
+        n = len(f) - dg
+        if n <= 0:
+            return f
+        if n > dg:
+            return gf_rem(f, g, p)
+        q = gf_mul(f[:dg - 1:-1], inv[:n], p)[:n]
+        q = (q + [0]*(n - len(q)))[::-1]
+        return gf_sub(f[:dg], gf_mul(q, g, p)[:dg], p)
+
+    return rem
+
+
+def gf_monic(f, p):
+    """Divide ``f`` by its leading coefficient."""
+    if not f or f[-1] == 1:
+        return f
+    inv = pow(f[-1], p - 2, p)
+    return [c*inv % p for c in f]
+
+
+def gf_gcd(f, g, p):
+    """Monic GCD of dense polynomials over ``GF(p)``.
+
+    Examples
+    ========
+
+    >>> gf_gcd([6, 0, 1], [1, 1], 7)
+    [1, 1]
+
+    """
+    while g:
+        f, g = g, gf_rem(f, g, p)
+    return gf_monic(f, p)
+
+
+def gf_resultant(f, g, p):
+    """Resultant of dense polynomials over ``GF(p)``.
+
+    Examples
+    ========
+
+    >>> gf_resultant([1, 0, 1], [6, 0, 1], 7)
+    4
+
+    """
+    if not f or not g:
+        return 0
+    n, m = len(f) - 1, len(g) - 1
+    if n < m:
+        r = gf_resultant(g, f, p)
+        return -r % p if n*m % 2 else r
+    r = 1
+    while m:
+        h = gf_rem(f, g, p)
+        if not h:
+            return 0
+        k = len(h) - 1
+        r = r*pow(g[-1], n - k, p) % p
+        if n*m % 2:
+            r = -r
+        f, g, n, m = g, h, m, k
+    return r*pow(g[-1], n, p) % p
+
+
+def gf_interpolate(xs, ys, p):
+    """Return polynomial over ``GF(p)``, that takes values ``ys`` at ``xs``.
+
+    See :func:`~diofant.polys.densearith.dense_interpolate`.
+
+    Examples
+    ========
+
+    >>> gf_interpolate([0, 1, 2], [1, 2, 5], 7)
+    [1, 0, 1]
+
+    """
+    k = len(xs)
+    M = [1]
+    for a in xs:
+        M = [0] + M
+        for j in range(len(M) - 1):
+            M[j] = (M[j] - a*M[j + 1]) % p
+    f = [0]*k
+    for a, b in zip(xs, ys):
+        if not b:
+            continue
+        q, c = [0]*k, 0
+        for j in range(k, 0, -1):
+            c = (M[j] + c*a) % p
+            q[j - 1] = c
+        w = 0
+        for c in reversed(q):
+            w = (w*a + c) % p
+        b = b*pow(w, p - 2, p) % p
+        f = [(u + b*c) % p for u, c in zip(f, q)]
+    return dense_strip(f)
+
+
+def gf_resultant_bivariate(f, g, p):
+    """Resultant of bivariate polynomials over ``GF(p)``.
+
+    Polynomials are given as dense lists (in the eliminated variable)
+    of dense lists of coefficients in the second variable.  The
+    result is interpolated from resultants at ``0, 1, 2, ...``, thus
+    ``p`` must exceed the sum of partial degrees of ``f`` and ``g``
+    in the second variable and the degree bound of the result.
+
+    Examples
+    ========
+
+    >>> gf_resultant_bivariate([[0, 1], [1]], [[1], [0, 1]], 7)
+    [1, 0, 6]
+
+    """
+    if not f or not g:
+        return []
+    n, m = len(f) - 1, len(g) - 1
+    N = max(len(c) for c in f) - 1
+    M = max(len(c) for c in g) - 1
+    B = n*M + m*N
+
+    def evaluate(h, a):
+        r = []
+        for c in h:
+            v = 0
+            for b in reversed(c):
+                v = (v*a + b) % p
+            r.append(v)
+        return r
+
+    xs, ys = [], []
+    a = 0
+    while len(xs) <= B:
+        F = evaluate(f, a)
+        if F[-1]:
+            G = evaluate(g, a)
+            if G[-1]:
+                xs.append(a)
+                ys.append(gf_resultant(F, G, p))
+        a += 1
+    return gf_interpolate(xs, ys, p)
+
+
+def gf_powmod(f, n, g, p):
+    """Compute ``f**n`` modulo ``g`` over ``GF(p)``, using repeated squaring.
+
+    Examples
+    ========
+
+    >>> gf_powmod([0, 1], 5, [1, 0, 1], 3)
+    [0, 1]
+
+    """
+    rem = gf_reducer(g, p)
+    h = [1]
+    f = gf_rem(f, g, p)
+    while n:
+        if n & 1:
+            h = rem(gf_mul(h, f, p))
+        n >>= 1
+        if n:
+            f = rem(gf_mul(f, f, p))
+    return h
+
+
+def gf_composer(h, f, p):
+    """Return a function, that computes ``g(h)`` modulo ``f`` over ``GF(p)``.
+
+    Uses the Brent-Kung algorithm: for ``m = ceil(sqrt(deg(f)))``
+    powers ``h**i mod f`` with ``i < m`` are computed once and form
+    rows of the matrix ``A``, then blocks of ``m`` coefficients of
+    ``g`` form rows of the matrix ``B`` and polynomials, that are rows
+    of ``B*A``, are combined by Horner scheme in ``h**m``.
+
+    Examples
+    ========
+
+    >>> compose = gf_composer([1, 1], [1, 0, 1], 3)
+    >>> compose([0, 0, 1])
+    [0, 2]
+
+    References
+    ==========
+
+    * :cite:`Shoup1995factor`, section 2.2
+
+    """
+    rem = gf_reducer(f, p)
+    n = len(f) - 1
+    m = max(math.ceil(math.sqrt(n)), 1)
+
+    H = [[1], rem(h)]
+    for _ in range(1, m):
+        H.append(rem(gf_mul(H[-1], H[1], p)))
+    A = GFMatrix([c + [0]*(n - len(c)) for c in H[:m]], p)
+    hm = H[m]
+
+    def compose(g):
+        if not g:
+            return []
+        B = GFMatrix([g[i:i + m] + [0]*(i + m - len(g))
+                      for i in range(0, len(g), m)], p)
+        r = []
+        for c in reversed((B*A).rows):
+            r = gf_add(rem(gf_mul(r, hm, p)), dense_strip(c), p)
+        return r
+
+    return compose
+
+
+def gf_compose_mod(g, h, f, p):
+    """Compute ``g(h)`` modulo ``f`` over ``GF(p)``, see :func:`gf_composer`.
+
+    Examples
+    ========
+
+    >>> gf_compose_mod([0, 0, 1], [1, 1], [1, 0, 1], 3)
+    [0, 2]
+
+    """
+    return gf_composer(h, f, p)(g)
+
+
+def gf_trace_map(a, b, c, n, f, p):
+    """Compute polynomial trace map in ``GF(p)[x]/(f)``.
+
+    See :meth:`~diofant.polys.factortools._Factor._gf_trace_map`.
+
+    Examples
+    ========
+
+    >>> gf_trace_map([2, 1], [4, 4], [1, 1], 4, [4, 2, 3], 5)
+    ([3, 1], [3, 1])
+
+    References
+    ==========
+
+    * :cite:`Gathen1992ComputingFM`, algorithm 5.2
+
+    """
+    u = gf_compose_mod(a, b, f, p)
+    v = b
+
+    if n & 1:
+        U = gf_add(a, u, p)
+        V = b
+    else:
+        U = a
+        V = c
+
+    n >>= 1
+
+    while n:
+        compose = gf_composer(v, f, p)
+        u = gf_add(u, compose(u), p)
+        v = compose(v)
+
+        if n & 1:
+            compose = gf_composer(V, f, p)
+            U = gf_add(U, compose(u), p)
+            V = compose(v)
+
+        n >>= 1
+
+    return gf_compose_mod(a, V, f, p), U
+
+
+class GFMatrix:
+    """Dense matrix over ``GF(p)`` for ``p`` of word-size.
+
+    The matrix is stored row-major, as a list of rows, which are lists
+    of integers in the range ``0 <= c < p``.  Products of matrices use
+    delayed reduction: dot products are accumulated and reduced once.
+    Row operations of the Gauss-Jordan elimination are vectorized:
+    with NumPy (if it's available, ``p < 2**31`` and the ``GF_USE_NUMPY``
+    config value is set) or by packing rows into Python integers,
+    which slots are wide enough to hold unreduced entries.
+
+    Examples
+    ========
+
+    >>> A = GFMatrix([[1, 2], [3, 1]], 5)
+    >>> A*A
+    GFMatrix([[2, 4], [1, 2]], 5)
+    >>> (A - GFMatrix.eye(2, 5)).nullspace()
+    []
+    >>> GFMatrix([[1, 2], [2, 4]], 5).nullspace()
+    [[3, 1]]
+
+    """
+
+    def __init__(self, rows, p):
+        self.rows = rows
+        self.p = p
+
+    @classmethod
+    def eye(cls, n, p):
+        """Return identity matrix of size ``n``."""
+        return cls([[int(i == j) for j in range(n)] for i in range(n)], p)
+
+    @property
+    def shape(self):
+        return len(self.rows), len(self.rows[0]) if self.rows else 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.rows}, {self.p})'
+
+    def __eq__(self, other):
+        return (isinstance(other, GFMatrix) and self.p == other.p and
+                self.rows == other.rows)
+
+    @property
+    def T(self):
+        """Return transposed matrix."""
+        return self.__class__([list(col) for col in zip(*self.rows)], self.p)
+
+    def __sub__(self, other):
+        p = self.p
+        return self.__class__([[(a - b) % p for a, b in zip(r, s)]
+                               for r, s in zip(self.rows, other.rows)], p)
+
+    def __mul__(self, other):
+        p = self.p
+        np = _numpy(p)
+        if np is not None and self.rows and other.rows:
+            A = np.array(self.rows, dtype=np.int64)
+            B = np.array(other.rows, dtype=np.int64)
+            C = np.zeros((A.shape[0], B.shape[1]), dtype=np.int64)
+            # number of products, that could be summed without overflow
+            t = max((2**63 - p)//(p - 1)**2, 1)
+            for i in range(0, A.shape[1], t):
+                C = (C + A[:, i:i + t] @ B[i:i + t]) % p
+            return self.__class__(C.tolist(), p)
+        cols = list(zip(*other.rows))
+        mul = operator.mul
+        return self.__class__([[sum(map(mul, row, col)) % p for col in cols]
+                               for row in self.rows], p)
+
+    def rref(self):
+        """Return the reduced row echelon form and the list of pivots."""
+        return self._rref()[:2]
+
+    def _rref(self):
+        # also return the product of pivots, with the sign of
+        # the row permutation
+        p = self.p
+        np = _numpy(p)
+        m, n = self.shape
+        pivots = []
+        r, det = 0, 1
+        if np is not None:
+            M = np.array(self.rows, dtype=np.int64).reshape(m, n)
+            for j in range(n):
+                nz = np.nonzero(M[r:, j])[0]
+                if not len(nz):
+                    continue
+                i = r + int(nz[0])
+                if i != r:
+                    M[[r, i]] = M[[i, r]]
+                    det = -det
+                det = det*int(M[r, j]) % p
+                M[r] = M[r]*pow(int(M[r, j]), p - 2, p) % p
+                col = M[:, j].copy()
+                col[r] = 0
+                M = (M - np.outer(col, M[r])) % p
+                pivots.append(j)
+                r += 1
+                if r == m:
+                    break
+            return self.__class__(M[:r].tolist(), p), pivots, det % p
+        # pack rows to integers, entries after at most n additions
+        # of products of reduced integers still fit into slots
+        k = (p + n*(p - 1)**2).bit_length()//8 + 1
+        bits, mask = 8*k, (1 << 8*k) - 1
+
+        def pack(v):
+            return int.from_bytes(b''.join(c.to_bytes(k, 'little')
+                                           for c in v), 'little')
+
+        def unpack(x):
+            b = x.to_bytes(n*k, 'little')
+            return [int.from_bytes(b[i:i + k], 'little') % p
+                    for i in range(0, n*k, k)]
+
+        R = [pack(row) for row in self.rows]
+        for j in range(n):
+            shift = j*bits
+            for i in range(r, m):
+                if (R[i] >> shift & mask) % p:
+                    break
+            else:
+                continue
+            if i != r:
+                R[r], R[i] = R[i], R[r]
+                det = -det
+            v = unpack(R[r])
+            det = det*v[j] % p
+            inv = pow(v[j], p - 2, p)
+            R[r] = pack([c*inv % p for c in v])
+            for i in range(m):
+                if i != r:
+                    c = (R[i] >> shift & mask) % p
+                    if c:
+                        R[i] += (p - c)*R[r]
+            pivots.append(j)
+            r += 1
+            if r == m:
+                break
+        return self.__class__([unpack(x) for x in R[:r]], p), pivots, det % p
+
+    def rank(self):
+        """Return the rank of the matrix."""
+        return len(self.rref()[1])
+
+    def det(self):
+        """Return the determinant of a square matrix.
+
+        Examples
+        ========
+
+        >>> GFMatrix([[1, 2], [3, 1]], 5).det()
+        0
+        >>> GFMatrix([[1, 2], [3, 4]], 5).det()
+        3
+
+        """
+        _, pivots, det = self._rref()
+        return det if len(pivots) == len(self.rows) else 0
+
+    def inv(self):
+        """Return the inverse of a square matrix or ``None``, if it's singular."""
+        n = len(self.rows)
+        M = self.__class__([row + [int(i == j) for j in range(n)]
+                            for i, row in enumerate(self.rows)], self.p)
+        M, pivots, _ = M._rref()
+        if pivots[:n] != list(range(n)):
+            return
+        return self.__class__([row[n:] for row in M.rows], self.p)
+
+    def nullspace(self):
+        """Return basis of the (right) nullspace.
+
+        Basis vectors are enumerated by free variables in the
+        increasing order, the corresponding entry of the vector is one.
+
+        """
+        p = self.p
+        n = self.shape[1]
+        M, pivots = self.rref()
+        basis = []
+        for j in sorted(set(range(n)) - set(pivots)):
+            v = [0]*n
+            v[j] = 1
+            for row, k in zip(M.rows, pivots):
+                v[k] = -row[j] % p
+            basis.append(v)
+        return basis
+
+
+def _numpy(p):
+    if query('GF_USE_NUMPY') and p < 2**31:
+        return import_module('numpy')
+
+
+def gf_berlekamp_massey(s, p):
+    """Return the minimal polynomial of a linearly recurrent sequence.
+
+    The result ``f`` is monic of the least degree, such that
+    ``sum(f[k]*s[i + k] for k in range(len(f))) == 0 mod p`` for all
+    subsequences of ``s``.
+
+    Examples
+    ========
+
+    >>> gf_berlekamp_massey([1, 1, 2, 3, 5, 1, 6, 0], 7)
+    [6, 6, 1]
+
+    References
+    ==========
+
+    * :cite:`Massey1969shift`
+
+    """
+    C, B = [1], [1]
+    L, m, b = 0, 1, 1
+    for n, d in enumerate(s):
+        d = (d + sum(C[i]*s[n - i] for i in range(1, L + 1))) % p
+        if not d:
+            m += 1
+            continue
+        c = d*pow(b, p - 2, p) % p
+        T = C[:]
+        C += [0]*(len(B) + m - len(C))
+        for i, e in enumerate(B):
+            C[i + m] = (C[i + m] - c*e) % p
+        if 2*L <= n:
+            L, B, b, m = n + 1 - L, T, d, 1
+        else:
+            m += 1
+    C += [0]*(L + 1 - len(C))
+    return C[L::-1]
+
+
+def gf_wiedemann(rows, b, p, tries=3):
+    """Solve ``A*x = b`` over ``GF(p)`` with the Wiedemann's algorithm.
+
+    The square matrix ``A`` is given by the list of sparse ``rows``,
+    which are dictionaries, mapping column indices to nonzero entries.
+    Only matrix-vector products are computed, so there is no fill-in.
+    The algorithm is randomized: ``None`` is returned, if no solution
+    was found after given number of ``tries`` (e.g. if ``A`` is singular).
+
+    Examples
+    ========
+
+    >>> gf_wiedemann([{0: 1, 1: 2}, {1: 3}], [1, 2], 7)
+    [2, 3]
+    >>> gf_wiedemann([{0: 1}, {0: 2}], [1, 1], 7) is None
+    True
+
+    References
+    ==========
+
+    * :cite:`Wiedemann1986solving`
+
+    """
+    def matvec(x):
+        return [sum(c*x[j] for j, c in row.items()) % p for row in rows]
+
+    n = len(rows)
+    for _ in range(tries):
+        u = [random.randrange(p) for _ in range(n)]
+        s, v = [], b
+        for _ in range(2*n):
+            s.append(sum(map(operator.mul, u, v)) % p)
+            v = matvec(v)
+        f = gf_berlekamp_massey(s, p)
+        if not f[0]:
+            continue
+        # x = -(f[1]*b + f[2]*A*b + ... + f[L]*A**(L-1)*b)/f[0]
+        x = [0]*n
+        for c in reversed(f[1:]):
+            x = [(y + c*e) % p for y, e in zip(matvec(x), b)]
+        c = -pow(f[0], p - 2, p)
+        x = [c*e % p for e in x]
+        if matvec(x) == [e % p for e in b]:
+            return x
+
+
+def gf_Qmatrix(f, p):
+    """Calculate Berlekamp's ``Q`` matrix of ``f`` over ``GF(p)``.
+
+    Rows of the matrix are coefficients of ``x**(i*p) mod f``.
+
+    Examples
+    ========
+
+    >>> gf_Qmatrix([3, 4, 1], 5)
+    GFMatrix([[1, 0], [0, 1]], 5)
+    >>> gf_Qmatrix([1, 0, 0, 0, 1], 5).rows
+    [[1, 0, 0, 0], [0, 4, 0, 0], [0, 0, 1, 0], [0, 0, 0, 4]]
+
+    """
+    n = len(f) - 1
+    f = gf_monic(f, p)
+    r = [1]
+    Q = [[1] + [0]*(n - 1)]
+    if n > 1:
+        h = gf_powmod([0, 1], p, f, p)
+        rem = gf_reducer(f, p)
+        for _ in range(1, n):
+            r = rem(gf_mul(r, h, p))
+            Q.append(r + [0]*(n - len(r)))
+    return GFMatrix(Q, p)
+
+
+def gf_berlekamp(f, p):
+    """Factor a monic square-free polynomial over ``GF(p)``.
+
+    The nullspace of the transposed ``Q - I`` is computed with
+    :class:`GFMatrix`.
+
+    Examples
+    ========
+
+    >>> gf_berlekamp([1, 0, 0, 0, 1], 5)
+    [[2, 0, 1], [3, 0, 1]]
+
+    References
+    ==========
+
+    * :cite:`Geddes1992algorithms`, algorithm 8.4
+    * :cite:`Knuth1985seminumerical`, section 4.6.2
+
+    """
+    Q = gf_Qmatrix(f, p)
+    Q -= GFMatrix.eye(len(Q.rows), p)
+    V = [dense_strip(v) for v in Q.T.nullspace()]
+
+    factors = [f]
+
+    for v in V[1:]:
+        for f in list(factors):
+            for s in range(p):
+                h = gf_sub(v, [s], p)
+                g = gf_gcd(f, h, p)
+
+                if g != [1] and g != f:
+                    factors.remove(f)
+
+                    f = gf_quo(f, g, p)
+                    factors.extend([f, g])
+
+                if len(factors) == len(V):
+                    return sorted(factors, key=lambda f: (len(f), f))
+
+    return sorted(factors, key=lambda f: (len(f), f))
+
+
+def gf_ddf_shoup(f, p):
+    """Distinct degree factorization of a monic square-free ``f`` over ``GF(p)``.
+
+    Returns a list of pairs ``(f_i, e_i)``, see
+    :meth:`~diofant.polys.factortools._Factor._gf_ddf_shoup`.  Iterated
+    Frobenius maps (baby and giant steps) are computed by the modular
+    composition, see :func:`gf_composer`.
+
+    Examples
+    ========
+
+    >>> gf_ddf_shoup([0, 2, 0, 1, 1, 2, 1], 3)
+    [([0, 1, 1], 1), ([2, 1, 0, 1, 1], 2)]
+
+    References
+    ==========
+
+    * :cite:`Kaltofen1998subquadratic`, algorithm D
+    * :cite:`Shoup1995factor`
+    * :cite:`Gathen1992frobenious`
+
+    """
+    n = len(f) - 1
+    k = math.ceil(math.sqrt(n//2))
+    x = [0, 1]
+
+    h = gf_powmod(x, p, f, p)
+
+    # U[i] = x**(p**i)
+    U = [x, h]
+    compose = gf_composer(h, f, p)
+
+    for i in range(2, k + 1):
+        U.append(compose(U[i - 1]))
+
+    h, U = U[k], U[:k]
+    # V[i] = x**(p**(k*(i+1)))
+    V = [h]
+    compose = gf_composer(h, f, p)
+
+    for i in range(1, k):
+        V.append(compose(V[i - 1]))
+
+    factors = []
+
+    rem = gf_reducer(f, p)
+
+    for i, v in enumerate(V):
+        h, j = [1], k - 1
+
+        for u in U:
+            h = rem(gf_mul(h, gf_sub(v, u, p), p))
+
+        g = gf_gcd(f, h, p)
+        f = gf_quo(f, g, p)
+
+        for u in reversed(U):
+            F = gf_gcd(g, gf_sub(v, u, p), p)
+
+            if F != [1]:
+                factors.append((F, k*(i + 1) - j))
+
+            g = gf_quo(g, F, p)
+            j -= 1
+
+    if f != [1]:
+        factors.append((f, len(f) - 1))
+
+    return factors
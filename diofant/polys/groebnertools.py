@@ -1,8 +1,16 @@
 """Gröbner bases algorithms."""
 
+import functools
+import heapq
+import operator
+
 from ..core import Dummy
+from ..core.numbers import igcd, ilcm
+from ..domains import FF, QQ
+from ..ntheory import nextprime
+from .galoistools import gf_modulus
 from .monomials import Monomial
-from .orderings import lex
+from .orderings import WeightedOrder, grevlex, grlex, lex
 from .polyconfig import query
 
 
@@ -13,7 +21,9 @@ def groebner(seq, ring, method=None):
     Wrapper around the (default) improved Buchberger and the other algorithms
     for computing Gröbner bases. The choice of algorithm can be changed via
     ``method`` argument or :func:`~diofant.polys.polyconfig.setup`,
-    where ``method`` can be either ``buchberger`` or ``f5b``.
+    where ``method`` can be either ``buchberger``, ``f5b`` or ``f4``.
+    For the rational field, the ``f4`` method uses the multi-modular
+    algorithm, see :func:`f4_modular`.
 
     """
     if method is None:
@@ -22,12 +32,13 @@ def groebner(seq, ring, method=None):
     _groebner_methods = {
         'buchberger': buchberger,
         'f5b': f5b,
+        'f4': f4,
     }
 
     try:
         _groebner = _groebner_methods[method]
     except KeyError:
-        raise ValueError(f"'{method}' is not a valid Gröbner bases algorithm (valid are 'buchberger' and 'f5b')")
+        raise ValueError(f"'{method}' is not a valid Gröbner bases algorithm (valid are 'buchberger', 'f5b' and 'f4')")
 
     domain, orig = ring.domain, None
 
@@ -35,6 +46,9 @@ def groebner(seq, ring, method=None):
         orig, ring = ring, ring.clone(domain=domain.field)
         seq = [s.set_ring(ring) for s in seq]
 
+    if _groebner is f4 and ring.domain.is_RationalField:
+        _groebner = f4_modular
+
     G = _groebner(seq, ring)
 
     if orig is not None:
@@ -100,79 +114,10 @@ def normal(g, J):
             if h not in I:
                 I[h] = len(f)
                 f.append(h)
+                M.append(h.LM)
 
             return h.LM, I[h]
 
-    def update(G, B, ih):
-        # update G using the set of critical pairs B and h
-        # [BW] page 230
-        h = f[ih]
-        mh = h.LM
-
-        # filter new pairs (h, g), g in G
-        C = G.copy()
-        D = set()
-
-        while C:
-            # select a pair (h, g) by popping an element from C
-            ig = C.pop()
-            g = f[ig]
-            mg = g.LM
-            LCMhg = mh.lcm(mg)
-
-            def lcm_divides(ip):
-                # LCM(LM(h), LM(p)) divides LCM(LM(h), LM(g))
-                m = mh.lcm(f[ip].LM)
-                return m.divides(LCMhg)
-
-            # HT(h) and HT(g) disjoint: mh*mg == LCMhg
-            if mh*mg == LCMhg or (
-                not any(lcm_divides(ipx) for ipx in C) and
-                    not any(lcm_divides(pr[1]) for pr in D)):
-                D.add((ih, ig))
-
-        E = set()
-
-        while D:
-            # select h, g from D (h the same as above)
-            ih, ig = D.pop()
-            mg = f[ig].LM
-            LCMhg = mh.lcm(mg)
-
-            if not mh*mg == LCMhg:
-                E.add((ih, ig))
-
-        # filter old pairs
-        B_new = set()
-
-        while B:
-            # select g1, g2 from B (-> CP)
-            ig1, ig2 = B.pop()
-            mg1 = f[ig1].LM
-            mg2 = f[ig2].LM
-            LCM12 = mg1.lcm(mg2)
-
-            # if HT(h) does not divide lcm(HT(g1), HT(g2))
-            if not mh.divides(LCM12) or mg1.lcm(mh) == LCM12 or mg2.lcm(mh) == LCM12:
-                B_new.add((ig1, ig2))
-
-        B_new |= E
-
-        # filter polynomials
-        G_new = set()
-
-        while G:
-            ig = G.pop()
-            mg = f[ig].LM
-
-            if not mh.divides(mg):
-                G_new.add(ig)
-
-        G_new.add(ih)
-
-        return G_new, B_new
-        # end of update ################################
-
     if not f:
         return []
 
@@ -194,6 +139,7 @@ def lcm_divides(ip):
             break
 
     I = {}            # ip = I[p]; p = f[ip]
+    M = [p.LM for p in f]  # leading monomials
     F = set()         # set of indices of polynomials
     G = set()         # set of indices of intermediate would-be Gröbner basis
     CP = set()        # set of pairs of indices of critical pairs
@@ -210,7 +156,7 @@ def lcm_divides(ip):
         h = min((f[x] for x in F), key=lambda f: order(f.LM))
         ih = I[h]
         F.remove(ih)
-        G, CP = update(G, CP, ih)
+        G, CP = _update_pairs(M, G, CP, ih)
 
     # count the number of critical pairs which reduce to zero
     reductions_to_zero = 0
@@ -225,7 +171,7 @@ def lcm_divides(ip):
         ht = normal(h, G1)
 
         if ht:
-            G, CP = update(G, CP, ht[1])
+            G, CP = _update_pairs(M, G, CP, ht[1])
         else:
             reductions_to_zero += 1
 
@@ -247,6 +193,82 @@ def lcm_divides(ip):
     return Gr
 
 
+def _update_pairs(M, G, B, ih):
+    """
+    Update the basis ``G`` and the set of critical pairs ``B`` by ``ih``.
+
+    Polynomials are given by indices, ``M`` is the list of their
+    leading monomials.
+
+    This is the Gebauer-Möller installation of criteria, see
+    :cite:`BeckerWeispfenning93`, page 230.
+
+    """
+    mh = M[ih]
+
+    # filter new pairs (h, g), g in G
+    C = G.copy()
+    D = set()
+
+    while C:
+        # select a pair (h, g) by popping an element from C
+        ig = C.pop()
+        mg = M[ig]
+        LCMhg = mh.lcm(mg)
+
+        def lcm_divides(ip):
+            # LCM(LM(h), LM(p)) divides LCM(LM(h), LM(g))
+            m = mh.lcm(M[ip])
+            return m.divides(LCMhg)
+
+        # HT(h) and HT(g) disjoint: mh*mg == LCMhg
+        if mh*mg == LCMhg or (
+            not any(lcm_divides(ipx) for ipx in C) and
+                not any(lcm_divides(pr[1]) for pr in D)):
+            D.add((ih, ig))
+
+    E = set()
+
+    while D:
+        # select h, g from D (h the same as above)
+        ih, ig = D.pop()
+        mg = M[ig]
+        LCMhg = mh.lcm(mg)
+
+        if not mh*mg == LCMhg:
+            E.add((ih, ig))
+
+    # filter old pairs
+    B_new = set()
+
+    while B:
+        # select g1, g2 from B (-> CP)
+        ig1, ig2 = B.pop()
+        mg1 = M[ig1]
+        mg2 = M[ig2]
+        LCM12 = mg1.lcm(mg2)
+
+        # if HT(h) does not divide lcm(HT(g1), HT(g2))
+        if not mh.divides(LCM12) or mg1.lcm(mh) == LCM12 or mg2.lcm(mh) == LCM12:
+            B_new.add((ig1, ig2))
+
+    B_new |= E
+
+    # filter polynomials
+    G_new = set()
+
+    while G:
+        ig = G.pop()
+        mg = M[ig]
+
+        if not mh.divides(mg):
+            G_new.add(ig)
+
+    G_new.add(ih)
+
+    return G_new, B_new
+
+
 def spoly(p1, p2):
     """
     Compute LCM(LM(p1), LM(p2))/LM(p1)*p1 - LCM(LM(p1), LM(p2))/LM(p2)*p2.
@@ -264,9 +286,376 @@ def spoly(p1, p2):
     s = s1 - s2
     return s
 
-# F5B
 
-# convenience functions
+# F4
+
+
+def f4(F, ring):
+    """
+    Computes Gröbner basis for a set of polynomials in `K[X]`.
+
+    Faugère's F4 algorithm: all critical pairs of minimal degree
+    are reduced simultaneously as rows of a Macaulay-type matrix
+    (after the symbolic preprocessing, which adds rows of reducers),
+    using sparse Gaussian elimination.  Critical pairs are filtered
+    with Gebauer-Möller criteria.  For prime finite fields, coefficients
+    are represented by machine integers during the linear algebra step.
+
+    Returns the reduced Gröbner basis.
+
+    References
+    ==========
+
+    * :cite:`Faugere1999f4`
+
+    Notes
+    =====
+
+    The ``Simplify`` procedure of the original algorithm is not used.
+
+    """
+    order = ring.order
+    domain = ring.domain
+
+    if domain.is_FiniteField and domain.order == domain.characteristic:
+        p = domain.order
+    else:
+        p = None
+
+    M = []        # leading monomials of polynomials
+    terms = []    # terms of polynomials (monic), as dictionaries
+    G = set()     # set of indices of intermediate would-be Gröbner basis
+    CP = set()    # set of pairs of indices of critical pairs
+
+    def add(h):
+        M.append(max(h, key=order))
+        terms.append(list(h.items()))
+        return _update_pairs(M, G, CP, len(M) - 1)
+
+    F = {h.monic() for h in F if h}
+
+    for h in sorted(F, key=lambda h: order(h.LM)):
+        if p:
+            h = {m: int(c) for m, c in h.items()}
+        G, CP = add(h)
+
+    while CP:
+        # normal selection strategy: all pairs of minimal degree
+        degs = {pr: sum(M[pr[0]].lcm(M[pr[1]])) for pr in CP}
+        d = min(degs.values())
+        P = {pr for pr in CP if degs[pr] == d}
+        CP -= P
+
+        rows = set()
+
+        for i, j in P:
+            LCMij = M[i].lcm(M[j])
+            rows.add((LCMij/M[i], i))
+            rows.add((LCMij/M[j], j))
+
+        H = _f4_reduce(rows, M, G, terms, ring, p)
+
+        for h in sorted(H, key=lambda h: order(max(h, key=order))):
+            G, CP = add(h)
+
+    G = [i for i in G
+         if not any(M[j].divides(M[i]) for j in G if j != i)]
+    G = _f4_interreduce(M, G, terms, ring, p)
+
+    if p:
+        G = [{m: domain.dtype(c) for m, c in g.items()} for g in G]
+
+    G = [ring.dtype(g) for g in G]
+
+    return sorted(G, key=lambda g: order(g.LM), reverse=True)
+
+
+def _symbolic_preprocessing(rows, M, G, terms, ring):
+    """
+    Add reducers for rows ``(m, i)`` (i.e. polynomials ``m*f[i]``).
+
+    Polynomials ``f[i]`` are given by their terms ``terms[i]`` and
+    leading monomials ``M[i]``, reducers are chosen from ``f[i]``,
+    ``i in G``.
+
+    Returns the sparse matrix of rows (lists of pairs of column
+    index and coefficient, sorted by columns) and the list of
+    monomials for columns (in decreasing order).
+
+    """
+    order = ring.order
+
+    # prefer reducers with smaller leading monomials, like in buchberger()
+    leads = sorted(((tuple(M[i]), i) for i in G), key=lambda x: order(x[0]))
+
+    rows = [(tuple(m), i) for m, i in rows]
+    seen = set(rows)
+    products = []
+    monoms = set()
+    todo = []
+
+    def add_row(m, i):
+        row = [tuple(map(operator.add, n, m)) for n, _ in terms[i]]
+        products.append(row)
+        for n in row:
+            if n not in monoms:
+                monoms.add(n)
+                todo.append(n)
+
+    for m, i in rows:
+        add_row(m, i)
+
+    while todo:
+        n = todo.pop()
+        for LM, i in leads:
+            if all(map(operator.le, LM, n)):
+                row = tuple(map(operator.sub, n, LM)), i
+                if row not in seen:
+                    seen.add(row)
+                    rows.append(row)
+                    add_row(*row)
+                break
+
+    columns = sorted(monoms, key=order, reverse=True)
+    index = {m: k for k, m in enumerate(columns)}
+    matrix = [sorted(zip(map(index.__getitem__, row), (c for _, c in terms[i])))
+              for row, (_, i) in zip(products, rows)]
+
+    return matrix, [Monomial(m) for m in columns]
+
+
+def _f4_reduce(rows, M, G, terms, ring, p=None):
+    """
+    Reduce rows ``(m, i)`` (i.e. polynomials ``m*f[i]``) in F4.
+
+    Returns new polynomials (as dictionaries), whose leading monomials
+    are not leading monomials of the rows.  If ``p`` is not ``None``,
+    coefficients are integers modulo ``p``.
+
+    """
+    domain = ring.domain
+    matrix, columns = _symbolic_preprocessing(rows, M, G, terms, ring)
+
+    pivots = {}
+    rest = []
+
+    def monic(row):
+        lc = row[0][1]
+        if p:
+            inv = pow(lc, p - 2, p)
+            return [(k, c*inv % p) for k, c in row]
+        else:
+            return [(k, domain.quo(c, lc)) for k, c in row]
+
+    for row in sorted(matrix, key=len):
+        if row[0][0] in pivots:
+            rest.append(row)
+        else:
+            pivots[row[0][0]] = monic(row)
+
+    new = []
+
+    for row in rest:
+        # rows are dictionaries, columns are processed in increasing
+        # order (i.e. for decreasing monomials) with help of the heap
+        r = dict(row)
+        heap = list(r)
+        reduced = []
+
+        while heap:
+            j = heapq.heappop(heap)
+            c = r.pop(j)
+            if p:
+                c %= p
+            if not c:
+                continue
+            pivot = pivots.get(j)
+            if pivot is None:
+                reduced.append((j, c))
+                continue
+            for k, v in pivot[1:]:
+                if k in r:
+                    r[k] -= c*v
+                else:
+                    r[k] = -c*v
+                    heapq.heappush(heap, k)
+
+        if reduced:
+            row = monic(reduced)
+            pivots[row[0][0]] = row
+            new.append(row)
+
+    return [{columns[k]: c for k, c in row} for row in new]
+
+
+def _f4_interreduce(M, G, terms, ring, p=None):
+    """
+    Compute reduced Gröbner basis from the minimal basis ``f[i]``, ``i in G``.
+
+    Returns polynomials as dictionaries, see :func:`_f4_reduce`.
+
+    """
+    domain = ring.domain
+    rows = [(ring.zero_monom, i) for i in G]
+    matrix, columns = _symbolic_preprocessing(rows, M, G, terms, ring)
+
+    # leading monomials of rows are distinct, do back-substitution
+    zero = 0 if p else domain.zero
+    pivots = {}
+
+    for row in sorted(matrix, key=lambda r: r[0][0], reverse=True):
+        r = dict(row)
+        for k, _ in row[1:]:
+            pivot = pivots.get(k)
+            if pivot is not None:
+                c = r.pop(k)
+                for j, v in pivot[1:]:
+                    r[j] = r.get(j, zero) - c*v
+        if p:
+            r = {k: c % p for k, c in r.items()}
+        pivots[row[0][0]] = sorted((k, c) for k, c in r.items() if c)
+
+    return [{columns[k]: c for k, c in pivots[row[0][0]]}
+            for row in matrix[:len(rows)]]
+
+
+def f4_modular(F, ring):
+    r"""
+    Computes Gröbner basis for a set of polynomials in `\mathbb{Q}[X]`.
+
+    Multi-modular algorithm: reduced Gröbner bases of the input
+    are computed (with :func:`f4`) modulo several primes, combined
+    with the Chinese Remainder Theorem (for primes with the same
+    set of leading monomials, the most frequent one is taken) and
+    coefficients are recovered by rational reconstruction.  Primes
+    are taken in increasing order, starting from the least prime
+    above `2^{62}`.  Once the reconstructed basis is stable, it's
+    verified that it contains the input polynomials and that all its
+    S-polynomials reduce to zero, i.e. it is a Gröbner basis of an
+    ideal, containing the input ideal.
+
+    Notes
+    =====
+
+    The inclusion of the computed ideal into the input ideal is not
+    verified, i.e. the result is correct with high probability (it's
+    correct, if at least one used prime was lucky).
+
+    References
+    ==========
+
+    * :cite:`Arnold2003modular`
+
+    """
+    domain = ring.domain
+    order = ring.order
+
+    F = [f.clear_denoms()[1] for f in F if f]
+
+    if not F:
+        return []
+
+    LCs = [int(f.LC.numerator) for f in F]
+    groups = {}
+
+    for p in _f4_primes():
+        if any(not c % p for c in LCs):
+            continue
+
+        ring_p = ring.clone(domain=FF(p))
+        Gp = f4([f.set_ring(ring_p) for f in F], ring_p)
+
+        LMs = tuple(g.LM for g in Gp)
+        Gp = [{m: int(c) for m, c in g.items()} for g in Gp]
+
+        if LMs in groups:
+            Gm, m, count, last = groups[LMs]
+            inv = pow(m % p, p - 2, p)
+            for gm, gp in zip(Gm, Gp):
+                for monom in gm.keys() | gp.keys():
+                    a = gm.get(monom, 0)
+                    gm[monom] = a + m*((gp.get(monom, 0) - a)*inv % p)
+        else:
+            Gm, m, count, last = Gp, 1, 0, None
+
+        m *= p
+        groups[LMs] = Gm, m, count + 1, last
+
+        if max(groups.values(), key=lambda g: g[2]) is not groups[LMs]:
+            continue
+
+        G = []
+
+        for gm in Gm:
+            g = {}
+            for monom, c in gm.items():
+                c = _rational_reconstruction(c, m, domain)
+                if c is None:
+                    break
+                if c:
+                    g[monom] = c
+            else:
+                G.append(ring.from_dict(g))
+                continue
+            break
+        else:
+            if G == last:
+                if _is_groebner_basis(G, F, ring):
+                    return sorted(G, key=lambda g: order(g.LM), reverse=True)
+            groups[LMs] = Gm, m, count + 1, G
+
+
+def _f4_primes():
+    """Generate primes above `2^{62}` in increasing order."""
+    p = 2**62
+    while True:
+        p = nextprime(p)
+        yield p
+
+
+def _rational_reconstruction(c, m, domain):
+    """Reconstruct ``a/b`` in ``domain``, equal to ``c`` modulo ``m``."""
+    r0, s0 = m, 0
+    r1, s1 = c % m, 1
+
+    while 2*r1**2 > m:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q*r1
+        s0, s1 = s1, s0 - q*s1
+
+    if 2*s1**2 > m:
+        return
+
+    return domain(r1, s1)
+
+
+def _is_groebner_basis(G, F, ring):
+    """
+    Check that ``G`` is a Gröbner basis, containing polynomials ``F``.
+
+    All polynomials of ``F`` must reduce to zero, modulo ``G``.  Then
+    S-polynomials of all pairs of ``G`` (except ones with coprime leading
+    monomials, by Buchberger's first criterion) are reduced at once, with
+    help of :func:`_f4_reduce`, and must all vanish.
+
+    """
+    if any(f.div(G)[1] for f in F):
+        return False
+
+    rows = set()
+
+    for i, g in enumerate(G):
+        for j, h in enumerate(G[:i]):
+            LCMgh = g.LM.lcm(h.LM)
+            if g.LM*h.LM != LCMgh:
+                rows.add((LCMgh/g.LM, i))
+                rows.add((LCMgh/h.LM, j))
+
+    terms = [list(g.items()) for g in G]
+
+    M = [g.LM for g in G]
+
+    return not _f4_reduce(rows, M, range(len(G)), terms, ring)
 
 
 def Sign(f):
@@ -365,6 +754,48 @@ def lbp_mul_term(f, cx):
     return lbp(sig_mult(Sign(f), cx[0]), Polyn(f).mul_term(cx), Num(f))
 
 
+def lbp_sub_mul_term(f, g, cx):
+    """
+    Subtract from labeled polynomial f the product of g with a term.
+
+    Same as ``lbp_sub(f, lbp_mul_term(g, cx))``, but the product is
+    not computed separately.  Over prime fields of word-size order,
+    coefficients of the difference are computed with raw integers and
+    reduced once.
+
+    """
+    gm = lbp(sig_mult(Sign(g), cx[0]), Polyn(g), Num(g))
+
+    if lbp_cmp(f, gm) < 0:
+        max_poly = gm
+    else:
+        max_poly = f
+
+    ret = Polyn(f)
+    ring = ret.ring
+    p = gf_modulus(ring.domain)
+
+    if p is None:
+        ret -= Polyn(g).mul_term(cx)
+    else:
+        dtype = ring.domain.dtype
+        monom, coeff = cx
+        coeff = int(coeff)
+        ret = ret.copy()
+        get = ret.get
+
+        for m, c in Polyn(g).items():
+            m *= monom
+            c = (int(get(m, 0)) - coeff*int(c)) % p
+
+            if c:
+                ret[m] = dtype(c)
+            else:
+                ret.pop(m, None)
+
+    return lbp(Sign(max_poly), ret, Num(max_poly))
+
+
 def lbp_cmp(f, g):
     """
     Compare two labeled polynomials.
@@ -438,7 +869,7 @@ def s_poly(cp):
     The S-polynomial of a critical pair cp is cp[1] * cp[2] - cp[4] * cp[5].
 
     """
-    return lbp_sub(lbp_mul_term(cp[2], cp[1]), lbp_mul_term(cp[5], cp[4]))
+    return lbp_sub_mul_term(lbp_mul_term(cp[2], cp[1]), cp[5], cp[4])
 
 
 def is_rewritable_or_comparable(sign, num, B):
@@ -507,8 +938,7 @@ def f5_reduce(f, B):
                 if sig_cmp(sig_mult(Sign(h), t[0]), Sign(f), order) < 0:
                     # The following check need not be done and is in general slower than without.
                     # if not is_rewritable_or_comparable(Sign(gp), Num(gp), B):
-                    hp = lbp_mul_term(h, t)
-                    f = lbp_sub(f, hp)
+                    f = lbp_sub_mul_term(f, h, t)
                     break
 
         if g == f or not Polyn(f):
@@ -766,6 +1196,10 @@ def matrix_fglm(F, ring, O_to):
     ideal w.r.t. ``O_from`` to a reduced Gröbner basis
     w.r.t. ``O_to``.
 
+    Normal forms are represented by sparse vectors (dictionaries),
+    the linear independence is tested by the incremental Gaussian
+    elimination.
+
     References
     ==========
 
@@ -777,108 +1211,111 @@ def matrix_fglm(F, ring, O_to):
 
     ring_to = ring.clone(order=O_to)
 
+    if any(g.LM == ring.zero_monom for g in F):
+        return [ring_to.one]
+
     old_basis = _basis(F, ring)
+
     M = _representing_matrices(old_basis, F, ring)
 
-    # V contains the normalforms (wrt O_from) of S
-    S = [ring.zero_monom]
-    V = [[domain.one] + [domain.zero] * (len(old_basis) - 1)]
+    S = []        # new basis (monomials, irreducible w.r.t. G)
+    V = []        # normal forms (wrt O_from) of S, as sparse vectors
+    rows = {}     # pivot -> (reduced vector, its combination of S)
     G = []
+    seen = set()
 
-    L = [(i, 0) for i in range(ngens)]  # (i, j) corresponds to x_i * S[j]
-    L.sort(key=lambda k_l: O_to(_incr_k(S[k_l[1]], k_l[0])), reverse=True)
-    t = L.pop()
+    one = ring.zero_monom
+    L = [(O_to(one), one, None, None)]
 
-    P = _identity_matrix(len(old_basis), domain)
+    while L:
+        _, t, k, l = heapq.heappop(L)
 
-    while True:
-        s = len(S)
-        v = _matrix_mul(M[t[0]], V[t[1]])
-        _lambda = _matrix_mul(P, v)
+        if t in seen or any(g.LM.divides(t) for g in G):
+            continue
+        seen.add(t)
 
-        if all(_lambda[i] == domain.zero for i in range(s, len(old_basis))):
+        if k is None:
+            v = {old_basis.index(one): domain.one}
+        else:
+            v = {}
+            for j, c in V[l].items():
+                for i, a in M[k][j].items():
+                    v[i] = v.get(i, domain.zero) + a*c
+            v = {i: c for i, c in v.items() if c}
+
+        nf, comb = dict(v), {}
+
+        while nf:
+            j = max(nf)
+            if j not in rows:
+                break
+            c = nf[j]
+            row, row_comb = rows[j]
+            for i, a in row.items():
+                nf[i] = nf.get(i, domain.zero) - c*a
+                if not nf[i]:
+                    del nf[i]
+            for i, a in row_comb.items():
+                comb[i] = comb.get(i, domain.zero) + c*a
+
+        if not nf:
             # there is a linear combination of v by V
-            lt = ring.term_new(_incr_k(S[t[1]], t[0]), domain.one)
-            rest = ring.from_dict({S[i]: _lambda[i] for i in range(s)})
-
-            g = (lt - rest).set_ring(ring_to)
-            if g:
-                G.append(g)
+            g = {t: domain.one}
+            for i, c in comb.items():
+                if c:
+                    g[S[i]] = -c
+            G.append(ring_to.from_dict(g))
         else:
             # v is linearly independant from V
-            P = _update(s, _lambda, P)
-            S.append(_incr_k(S[t[1]], t[0]))
+            s = len(S)
+            S.append(t)
             V.append(v)
 
-            L.extend([(i, s) for i in range(ngens)])
-            L = list(set(L))
-            L.sort(key=lambda k_l: O_to(_incr_k(S[k_l[1]], k_l[0])), reverse=True)
-
-        L = [(k, l) for (k, l) in L if all(not g.LM.divides(_incr_k(S[l], k)) for g in G)]
+            row_comb = {i: -c for i, c in comb.items() if c}
+            row_comb[s] = domain.one
+            lc = nf[max(nf)]
+            rows[max(nf)] = ({i: c/lc for i, c in nf.items()},
+                             {i: c/lc for i, c in row_comb.items()})
 
-        if not L:
-            G = [g.monic() for g in G]
-            return sorted(G, key=lambda g: O_to(g.LM), reverse=True)
+            for i in range(ngens):
+                u = Monomial(_incr_k(t, i))
+                if u not in seen:
+                    heapq.heappush(L, (O_to(u), u, i, s))
 
-        t = L.pop()
+    return sorted(G, key=lambda g: O_to(g.LM), reverse=True)
 
 
 def _incr_k(m, k):
     return tuple(list(m[:k]) + [m[k] + 1] + list(m[k + 1:]))
 
 
-def _identity_matrix(n, domain):
-    M = [[domain.zero]*n for _ in range(n)]
-
-    for i in range(n):
-        M[i][i] = domain.one
-
-    return M
-
-
-def _matrix_mul(M, v):
-    return [sum(row[i] * v[i] for i in range(len(v))) for row in M]
-
-
-def _update(s, _lambda, P):
-    """Update ``P`` such that for the updated `P'` `P' v = e_{s}`."""
-    k = min(j for j in range(s, len(_lambda)) if _lambda[j] != 0)
-
-    for r in range(len(_lambda)):
-        if r != k:
-            P[r] = [P[r][j] - (P[k][j] * _lambda[r]) / _lambda[k] for j in range(len(P[r]))]
-
-    P[k] = [P[k][j] / _lambda[k] for j in range(len(P[k]))]
-    P[k], P[s] = P[s], P[k]
-
-    return P
-
-
 def _representing_matrices(basis, G, ring):
     r"""
     Compute the matrices corresponding to the linear maps `m \mapsto
     x_i m` for all variables `x_i`.
 
+    Matrices are sparse: lists of columns (normal forms of `x_i m`
+    for ``m`` in ``basis``) as dictionaries.
+
     """
     domain = ring.domain
-    u = ring.ngens-1
-
-    def var(i):
-        return ring._monomial_basis(i)
-
-    def representing_matrix(m):
-        M = [[domain.zero] * len(basis) for _ in range(len(basis))]
+    index = {m: i for i, m in enumerate(basis)}
+    leads = {g.LM: g for g in G}
 
-        for i, v in enumerate(basis):
-            r = ring.term_new(m*v, domain.one).div(G)[1]
+    def normal_form(m):
+        if m in index:
+            return {index[m]: domain.one}
 
-            for monom, coeff in r.items():
-                j = basis.index(monom)
-                M[j][i] = coeff
+        if m in leads:
+            g = leads[m]
+            r = ring.term_new(m, domain.one) - g.quo_ground(g.LC)
+        else:
+            r = ring.term_new(m, domain.one).div(G)[1]
 
-        return M
+        return {index[n]: c for n, c in r.items()}
 
-    return [representing_matrix(var(i)) for i in range(u + 1)]
+    return [[normal_form(Monomial(_incr_k(m, i))) for m in basis]
+            for i in range(ring.ngens)]
 
 
 def _basis(G, ring):
@@ -907,3 +1344,95 @@ def _basis(G, ring):
     basis = list(set(basis))
 
     return sorted(basis, key=lambda m: order(m))
+
+
+def _order_weight(order, ngens):
+    """Return weight vector of the first row for the matrix of ``order``."""
+    if isinstance(order, WeightedOrder):
+        return order.weight
+    elif order == lex:
+        return (1,) + (0,)*(ngens - 1)
+    elif order in (grlex, grevlex):
+        return (1,)*ngens
+    else:
+        raise NotImplementedError(f"Gröbner walk doesn't support {order} order")
+
+
+def _weight(w, m):
+    return sum(a*b for a, b in zip(w, m))
+
+
+def groebner_walk(G, ring, O_to):
+    """
+    Converts the reduced Gröbner basis ``G`` w.r.t. ``O_from`` to a
+    reduced Gröbner basis w.r.t. ``O_to``, using the Gröbner walk.
+
+    Unlike :func:`matrix_fglm`, works for ideals of positive dimension.
+    The weight vector is moved along the segment, that connects weight
+    vectors of ``O_from`` and ``O_to``.  At each crossing of a Gröbner
+    cone boundary - the Gröbner basis is computed for initial forms
+    (which are usually much simpler) and then lifted back.  If the
+    lifting fails (i.e. ``G`` isn't a Gröbner basis), ``ValueError``
+    is raised.
+
+    Examples
+    ========
+
+    >>> _, x, y = ring('x y', QQ, grlex)
+    >>> groebner_walk([x**3 - y**3], _, lex)
+    [x**3 - y**3]
+
+    References
+    ==========
+
+    * :cite:`Cox2005using`, section 8.5
+
+    """
+    ngens = ring.ngens
+
+    t = _order_weight(O_to, ngens)
+    w = _order_weight(ring.order, ngens)
+
+    old_ring = ring
+
+    while True:
+        new_ring = ring.clone(order=WeightedOrder(w, O_to))
+
+        In = []
+        for g in G:
+            top = max(_weight(w, m) for m in g)
+            In.append(old_ring.from_dict({m: c for m, c in g.items()
+                                          if _weight(w, m) == top}))
+        H = groebner([f.set_ring(new_ring) for f in In], new_ring)
+
+        lifted = []
+        for h in H:
+            qs, r = h.set_ring(old_ring).div(In)
+            if r:
+                raise ValueError('input should be a Gröbner basis')
+            lifted.append(sum((q*g for q, g in zip(qs, G)),
+                              old_ring.zero).set_ring(new_ring))
+        G = red_groebner(lifted, new_ring)
+        old_ring = new_ring
+
+        if w == t:
+            break
+
+        u = QQ.one
+        for g in G:
+            a = g.LM
+            for b in g.keys():
+                d = [i - j for i, j in zip(a, b)]
+                td = _weight(t, d)
+                if td < 0:
+                    wd = _weight(w, d)
+                    u = min(u, QQ(wd, wd - td))
+
+        w = [(1 - u)*i + u*j for i, j in zip(w, t)]
+        denom = functools.reduce(ilcm, (_.denominator for _ in w), 1)
+        w = [int(_*denom) for _ in w]
+        numer = functools.reduce(igcd, w)
+        w = tuple(_//numer for _ in w)
+
+    return sorted([g.set_ring(ring.clone(order=O_to)) for g in G],
+                  key=lambda g: O_to(g.LM), reverse=True)
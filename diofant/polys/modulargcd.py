@@ -5,6 +5,8 @@
 from ..ntheory import nextprime
 from ..ntheory.modular import crt, integer_rational_reconstruction
 from . import rings
+from .galoistools import gf_gcd, gf_modulus
+from .polyconfig import process_pool, query
 from .polyerrors import ModularGCDFailed
 
 
@@ -233,6 +235,19 @@ def _modgcd_p(f, g, p, degbound, contbound):
     pdomain = domain.finite_field(p)
     pring = ring.clone(domain=pdomain)
 
+    if ring.is_univariate and gf_modulus(pdomain) is not None:
+        h = gf_gcd([int(c) % p for c in f._to_dense()],
+                   [int(c) % p for c in g._to_dense()], p)
+        degh = len(h) - 1
+
+        if degh > degbound[0]:
+            return
+        if degh < degbound[0]:
+            degbound[0] = degh
+            raise ModularGCDFailed
+
+        return ring._from_dense(list(map(domain.dtype, h)))
+
     f, g = map(operator.methodcaller('set_domain', pdomain), (f, g))
 
     if ring.is_univariate:
@@ -418,47 +433,95 @@ def modgcd(f, g):
     contbound = list(degbound)
 
     m = 1
-    p = 1
 
-    while True:
-        p = nextprime(p)
-        while badprimes % p == 0:
-            p = nextprime(p)
+    with process_pool() as pool:
+        for p, (hp, failed, bounds) in _modgcd_images(f, g, badprimes,
+                                                      degbound, contbound,
+                                                      pool):
+            lowered = any(b < c for b, c in zip(bounds, degbound + contbound))
+            degbound[:] = map(min, degbound, bounds[:k])
+            contbound[:] = map(min, contbound, bounds[k:])
+
+            if failed:
+                if lowered:
+                    m = 1
+                continue
 
-        fp = f.trunc_ground(p)
-        gp = g.trunc_ground(p)
+            # the image was computed with outdated bounds
+            if hp is None or bounds != degbound + contbound:
+                continue
 
-        try:
-            # monic GCD of fp, gp in Z_p[x_0, ..., x_{k-2}, y]
-            hp = _modgcd_p(fp, gp, p, degbound, contbound)
-        except ModularGCDFailed:
-            m = 1
-            continue
+            hp = (hp*gamma).trunc_ground(p)
+            if m == 1:
+                m = p
+                hlastm = hp
+                continue
 
-        if hp is None:
-            continue
+            hm = _chinese_remainder_reconstruction(hp, hlastm, p, m)
+            m *= p
 
-        hp = (hp*gamma).trunc_ground(p)
-        if m == 1:
-            m = p
-            hlastm = hp
-            continue
+            if not hm == hlastm:
+                hlastm = hm
+                continue
 
-        hm = _chinese_remainder_reconstruction(hp, hlastm, p, m)
-        m *= p
+            h = hm.primitive()[1]
+            fquo, frem = divmod(f, h)
+            gquo, grem = divmod(g, h)
+            if not frem and not grem:
+                h *= ch
+                cff = fquo*(cf // ch)
+                cfg = gquo*(cg // ch)
+                return h, cff, cfg
 
-        if not hm == hlastm:
-            hlastm = hm
-            continue
 
-        h = hm.primitive()[1]
-        fquo, frem = divmod(f, h)
-        gquo, grem = divmod(g, h)
-        if not frem and not grem:
-            h *= ch
-            cff = fquo*(cf // ch)
-            cfg = gquo*(cg // ch)
-            return h, cff, cfg
+def _modgcd_image(f, g, p, degbound, contbound):
+    """Compute monic GCD of ``f`` and ``g`` modulo ``p``, see :func:`_modgcd_p`.
+
+    Returns a tuple of the GCD (or ``None``), failure flag and the
+    updated bounds.
+
+    """
+    fp = f.trunc_ground(p)
+    gp = g.trunc_ground(p)
+
+    try:
+        # monic GCD of fp, gp in Z_p[x_0, ..., x_{k-2}, y]
+        hp, failed = _modgcd_p(fp, gp, p, degbound, contbound), False
+    except ModularGCDFailed:
+        hp, failed = None, True
+
+    return hp, failed, degbound + contbound
+
+
+def _modgcd_images(f, g, badprimes, degbound, contbound, pool=None):
+    """Generate modular images of the GCD for consecutive good primes.
+
+    If ``pool`` is given, images are computed by batches, using
+    current values of bounds.  Images are generated in the order of
+    primes, thus the result of :func:`modgcd` doesn't depend on the
+    number of workers.
+
+    """
+    p = 1
+
+    def next_prime():
+        nonlocal p
+        p = nextprime(p)
+        while badprimes % p == 0:
+            p = nextprime(p)
+        return p
+
+    while True:
+        if pool is None:
+            q = next_prime()
+            yield q, _modgcd_image(f, g, q, list(degbound), list(contbound))
+        else:
+            primes = [next_prime() for _ in range(query('MODULAR_WORKERS'))]
+            images = [pool.submit(_modgcd_image, f, g, q,
+                                  list(degbound), list(contbound))
+                      for q in primes]
+            for q, image in zip(primes, images):
+                yield q, image.result()
 
 
 def _rational_function_reconstruction(c, p, m):
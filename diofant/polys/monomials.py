@@ -112,3 +112,91 @@ def lcm(self, other):
             return self.__class__((max(a, b) for a, b in zip(self, other)), self.gens)
         else:
             raise TypeError(f'An instance of {self.__class__.__name__} expected, got {orig}')
+
+
+class MonomialPacker:
+    """Packing of monomials into integers.
+
+    Exponents are stored in bit fields of equal width, with one extra
+    (guard) bit per field.  The width is chosen to hold exponents up to
+    given bounds, so multiplication of packed monomials is an integer
+    addition, while division - a subtraction, if the result fits in
+    the bounds.
+
+    Examples
+    ========
+
+    >>> P = MonomialPacker([4, 4])
+    >>> a, b = P.pack((1, 2)), P.pack((2, 2))
+    >>> P.unpack(a + b)
+    (3, 4)
+    >>> P.divides(a, b), P.divides(b, a)
+    (True, False)
+    >>> P.unpack(b - a)
+    (1, 0)
+
+    Packed monomials could be also encoded to integers, that preserve
+    some monomial orders:
+
+    >>> k = P.key((0, 2), grevlex)
+    >>> k > P.key((1, 1), grevlex)
+    False
+    >>> k + P.key((1, 0), grevlex) == P.key((1, 2), grevlex) + P.key((0, 0), grevlex)
+    True
+
+    References
+    ==========
+
+    * :cite:`Monagan2007heaps`
+
+    """
+
+    def __init__(self, bounds):
+        self.ngens = len(bounds)
+        self.bits = bits = max(bounds, default=0).bit_length() + 1
+        self.mask = (1 << bits) - 1
+        guard = 1 << (bits - 1)
+        self.guard = sum(guard << bits*i for i in range(self.ngens))
+
+    def pack(self, monom):
+        """Pack exponent vector into integer."""
+        bits = self.bits
+        r = 0
+        for e in monom:
+            r = (r << bits) | e
+        return r
+
+    def unpack(self, packed):
+        """Unpack integer into exponent vector."""
+        bits, mask = self.bits, self.mask
+        monom = [0]*self.ngens
+        for i in range(self.ngens - 1, -1, -1):
+            monom[i] = packed & mask
+            packed >>= bits
+        return Monomial(monom)
+
+    def divides(self, a, b):
+        """Check if packed monomial ``a`` divides packed ``b``."""
+        return not (b - a) & self.guard and b >= a
+
+    def key(self, monom, order):
+        """Encode monomial to integer, preserving given order.
+
+        Supported orders are ``lex``, ``grlex`` and ``grevlex``.  The
+        encoding is an affine function of exponents, i.e. the key of
+        the product is ``key(a) + key(b) - key(1)``.
+
+        """
+        alias = getattr(order, 'alias', None)
+        if alias == 'lex':
+            return self.pack(monom)
+        elif alias == 'grlex':
+            return (sum(monom) << self.bits*self.ngens) + self.pack(monom)
+        elif alias == 'grevlex':
+            bits, top = self.bits, self.mask >> 1
+            r = sum(monom)
+            for e in reversed(monom):
+                r = (r << bits) + top - e
+            return r
+        else:
+            raise NotImplementedError(f'unsupported monomial order: {order}')
@@ -716,6 +716,8 @@ def primitive_element(extension, **args):
 
 def field_isomorphism_pslq(a, b):
     """Construct field isomorphism using PSLQ algorithm."""
+    from ..matrices.lll import integer_relation
+
     if not all(_.domain.is_RationalField and _.ext.is_real for _ in (a, b)):
         raise NotImplementedError("PSLQ doesn't support complex coefficients")
 
@@ -731,7 +733,10 @@ def field_isomorphism_pslq(a, b):
         with mpmath.workdps(n):
             A, B = lambdify((), [a, b], 'mpmath')()
             basis = [A] + [B**i for i in reversed(range(m))]
-            coeffs = mpmath.pslq(basis, maxcoeff=10**10, maxsteps=10**3)
+            if query('INTEGER_RELATION_METHOD') == 'lll':
+                coeffs = integer_relation(basis, maxcoeff=10**10)
+            else:
+                coeffs = mpmath.pslq(basis, maxcoeff=10**10, maxsteps=10**3)
 
         if coeffs:
             assert coeffs[0]  # basis[1:] elements are linearly independent
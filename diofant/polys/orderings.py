@@ -178,6 +178,44 @@ def __hash__(self):
         return hash((self.__class__, self.O))
 
 
+class WeightedOrder(MonomialOrder):
+    """
+    Order of monomials by weight, ties are broken by another order.
+
+    Examples
+    ========
+
+    >>> W = WeightedOrder((1, 2), lex)
+    >>> W((3, 0)) < W((0, 2))
+    True
+    >>> W((2, 1)) > W((0, 2))
+    True
+
+    """
+
+    def __init__(self, weight, order):
+        self.weight = tuple(weight)
+        self.order = order
+
+    def __call__(self, monomial):
+        return sum(w*e for w, e in zip(self.weight, monomial)), self.order(monomial)
+
+    def __str__(self):
+        return f'{self.__class__.__name__}({self.weight}, {self.order})'
+
+    def __eq__(self, other):
+        return (isinstance(other, WeightedOrder) and
+                self.weight == other.weight and self.order == other.order)
+
+    def __hash__(self):
+        return hash((self.__class__, self.weight, self.order))
+
+    @property
+    def is_global(self):
+        if all(w >= 0 for w in self.weight):
+            return self.order.is_global
+
+
 lex = LexOrder()
 grlex = GradedLexOrder()
 grevlex = ReversedGradedLexOrder()
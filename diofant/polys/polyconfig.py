@@ -1,6 +1,7 @@
 """Configuration utilities for polynomial manipulation algorithms."""
 
 import ast
+import concurrent.futures
 import contextlib
 import os
 
@@ -10,6 +11,7 @@
 
 _default_config = {
     'USE_COLLINS_RESULTANT':      False,
+    'USE_HALF_GCD_RESULTANT':     True,
     'USE_HEU_GCD':                True,
     'HEU_GCD_MAX':                6,
 
@@ -26,13 +28,39 @@
 
     'GF_IRRED_METHOD':            'rabin',
     'GF_FACTOR_METHOD':           'zassenhaus',
+    'ZZ_FACTOR_METHOD':           'van_hoeij',
+    'VAN_HOEIJ_CUTOFF':           8,
 
     'AA_FACTOR_METHOD':           'modular',
 
     'GROEBNER':                   'buchberger',
     'MINPOLY_METHOD':             'compose',
+    'INTEGER_RELATION_METHOD':    'lll',
 
     'KARATSUBA_CUTOFF':           100,
+    'NEWTON_DIVISION_CUTOFF':     200,
+    'HALF_GCD_CUTOFF':            200,
+    'USE_PACKED_MONOMIALS':       True,
+    'USE_HEAP_MULTIPLICATION':    False,
+    'USE_HEAP_DIVISION':          True,
+    'USE_KRONECKER':              True,
+    'USE_GF_KERNEL':              True,
+    'GF_NEWTON_DIVISION_CUTOFF':  32,
+    'GF_USE_NUMPY':               True,
+    'KRONECKER_CUTOFF':           500,
+    'GF_KRONECKER_CUTOFF':        64,
+    'TAYLOR_SHIFT_CUTOFF':        32,
+    'COMPOSE_CUTOFF':             8,
+    'ABERTH_CUTOFF':              50,
+    'MODULAR_DET_CUTOFF':         80,
+    'MODULAR_LINALG_CUTOFF':      30,
+    'WIEDEMANN_CUTOFF':           100,
+
+    'MODULAR_WORKERS':            1,
+    'MATRIX_WORKERS':             1,
+    'STRASSEN_CUTOFF':            32,
+    'MATRIX_MUL_DOMAIN_CUTOFF':   8,
+    'MATRIX_MUL_POLY_CUTOFF':     16,
 }
 
 _current_config = {}
@@ -64,6 +92,30 @@ def query(key):
     return _current_config.get(key.upper(), None)
 
 
+def _init_worker(config):
+    _current_config.update(config)
+
+
+def process_pool(workers=None):
+    """Return a pool of ``workers`` processes.
+
+    By default, the ``MODULAR_WORKERS`` processes for modular algorithms
+    are used.  Workers inherit current configuration.  If only one
+    worker is requested, returns a dummy context manager, that gives
+    ``None``.
+
+    """
+    if workers is None:
+        workers = query('MODULAR_WORKERS')
+
+    if workers > 1:
+        return concurrent.futures.ProcessPoolExecutor(workers,
+                                                      initializer=_init_worker,
+                                                      initargs=(dict(_current_config),))
+    else:
+        return contextlib.nullcontext()
+
+
 def configure():
     """Initialized configuration of polys module."""
     for key, default in _default_config.items():
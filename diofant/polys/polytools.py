@@ -17,9 +17,10 @@
 from ..utilities import default_sort_key, group, sift
 from .constructor import construct_domain
 from .groebnertools import groebner as _groebner
-from .groebnertools import matrix_fglm
+from .groebnertools import groebner_walk, matrix_fglm
 from .monomials import Monomial
 from .orderings import monomial_key
+from .polyconfig import query
 from .polyerrors import (CoercionFailed, ComputationFailed, DomainError,
                          ExactQuotientFailed, GeneratorsError,
                          GeneratorsNeeded, MultivariatePolynomialError,
@@ -1942,6 +1943,12 @@ def nroots(self, n=15, maxsteps=50, cleanup=True):
         If the accuracy `n` cannot be reached in `maxsteps`, it will raise an
         exception. You need to rerun with higher maxsteps.
 
+        For polynomials with rational coefficients of degree at least
+        ``ABERTH_CUTOFF`` config value, roots of square-free factors
+        are approximated first with the Aberth's method and certified
+        (then ``maxsteps`` is ignored).  If the certification fails,
+        the mpmath's ``polyroots()`` is used.
+
         Examples
         ========
 
@@ -1958,6 +1965,11 @@ def nroots(self, n=15, maxsteps=50, cleanup=True):
         if self.degree() <= 0:
             return []
 
+        if self.domain in (ZZ, QQ) and self.degree() >= query('ABERTH_CUTOFF'):
+            roots = self._nroots_certified(n)
+            if roots is not None:
+                return roots
+
         # For integer and rational coefficients, convert them to integers only
         # (for accuracy). Otherwise just try to convert the coefficients to
         # mpmath.mpc and raise an exception if the conversion fails.
@@ -1998,6 +2010,21 @@ def nroots(self, n=15, maxsteps=50, cleanup=True):
 
         return roots
 
+    def _nroots_certified(self, n):
+        """Compute roots with ``n`` correct digits, using certified Aberth's method."""
+        ring = self.rep.ring
+        prec = mpmath.libmp.dps_to_prec(n)
+        roots = []
+
+        for f, k in self.rep.sqf_list()[1]:
+            approx = ring._nroots_sqf(f, prec)
+            if approx is None:
+                return
+            roots.extend([z.real if not z.imag else z for z, _ in approx]*k)
+
+        with mpmath.workdps(n):
+            return [sympify(+r) for r in sorted(roots, key=lambda r: (1 if r.imag else 0, r.real, r.imag))]
+
     def cancel(self, other, include=False):
         """
         Cancel common factors in a rational function ``self/other``.
@@ -4199,7 +4226,8 @@ def set_order(self, order):
         The FGLM algorithm :cite:`Faugere1993groebner` used to convert reduced Gröbner bases
         of zero-dimensional ideals from one ordering to another.  Sometimes it
         is infeasible to compute a Gröbner basis with respect to a particular
-        ordering directly.
+        ordering directly.  For ideals of positive dimension, the Gröbner
+        walk :cite:`Cox2005using` is used instead.
 
         Examples
         ========
@@ -4210,6 +4238,10 @@ def set_order(self, order):
         >>> G.set_order('lex') == groebner(F, order='lex')
         True
 
+        >>> G = groebner([x**3 - y**3], order='grlex')
+        >>> G.set_order('lex')
+        GroebnerBasis([x**3 - y**3], x, y, domain='ZZ', order='lex')
+
         """
         src_order = self.order
         dst_order = monomial_key(order)
@@ -4217,10 +4249,6 @@ def set_order(self, order):
         if src_order == dst_order:
             return self
 
-        if self.dimension != 0:
-            raise NotImplementedError("can't convert Gröbner bases of "
-                                      'ideals with positive dimension')
-
         polys = self.polys
         domain = self.domain
 
@@ -4233,7 +4261,10 @@ def set_order(self, order):
             poly = dict(poly.set_domain(opt.domain).rep)
             polys[i] = _ring.from_dict(poly)
 
-        G = matrix_fglm(polys, _ring, dst_order)
+        if self.dimension == 0:
+            G = matrix_fglm(polys, _ring, dst_order)
+        else:
+            G = groebner_walk(polys, _ring, dst_order)
         G = [Poly._from_dict(dict(g), opt) for g in G]
 
         if not domain.is_Field:
@@ -1,6 +1,8 @@
 """Sparse polynomial rings."""
 
 import functools
+import heapq
+import itertools
 import math
 import operator
 import typing
@@ -15,9 +17,10 @@
 from ..domains.ring import Ring
 from ..ntheory import multinomial_coefficients
 from ..ntheory.modular import symmetric_residue
+from .densearith import dense_compose, is_kronecker_domain, kronecker_mul
 from .euclidtools import _GCD
 from .factortools import _Factor
-from .monomials import Monomial
+from .monomials import Monomial, MonomialPacker
 from .orderings import ilex, lex
 from .polyconfig import query
 from .polyerrors import (CoercionFailed, ExactQuotientFailed, GeneratorsError,
@@ -392,6 +395,9 @@ def lcm(self, a, b):
 
 _ring_cache: typing.Dict[tuple, PolynomialRing] = {}
 
+# monomial orders, supported by heap-based multiplication and division
+_heap_orders = {'lex', 'grlex', 'grevlex'}
+
 
 class PolyElement(DomainElement, CantSympify, dict):
     """Element of multivariate distributed polynomial ring.
@@ -791,6 +797,12 @@ def __mul__(self, other):
             other = ring.convert(other)
         except CoercionFailed:
             return NotImplemented
+        if self._use_kronecker(other):
+            return self._mul_kronecker(other)
+        if query('USE_PACKED_MONOMIALS') and self and other:
+            if query('USE_HEAP_MULTIPLICATION') and getattr(ring.order, 'alias', None) in _heap_orders:
+                return self._mul_heap(other)
+            return self._mul_packed(other)
         result = ring.zero
         get = result.get
         zero = domain.zero
@@ -801,6 +813,71 @@ def __mul__(self, other):
         result._strip_zero()
         return result
 
+    def _packer(self, other=None):
+        """Return packer for monomials of the product of self and other."""
+        bounds = map(max, zip(*self))
+        if other is None:
+            bounds = [2*b for b in bounds]
+        else:
+            bounds = [a + b for a, b in zip(bounds, map(max, zip(*other)))]
+        return MonomialPacker(bounds)
+
+    def _mul_packed(self, other):
+        """Multiply two polynomials, using packed monomials."""
+        packer = self._packer(other)
+        pack = packer.pack
+        terms = [(pack(m), c) for m, c in other.items()]
+        zero = self.ring.domain.zero
+        result = {}
+        get = result.get
+        for exp1, coeff1 in self.items():
+            exp1 = pack(exp1)
+            for exp2, coeff2 in terms:
+                exp = exp1 + exp2
+                result[exp] = get(exp, zero) + coeff1*coeff2
+        unpack = packer.unpack
+        return self.__class__({unpack(exp): coeff
+                               for exp, coeff in result.items() if coeff})
+
+    def _use_kronecker(self, other):
+        """Test if Kronecker substitution should be used for self*other."""
+        ring = self.ring
+        if not (query('USE_KRONECKER') and ring.ngens and self and other and
+                is_kronecker_domain(ring.domain)):
+            return False
+        n = len(self)*len(other)
+        if n < query('KRONECKER_CUTOFF'):
+            return False
+        size = 1
+        for a, b in zip(map(max, zip(*self)), map(max, zip(*other))):
+            size *= a + b + 1
+        return size <= n
+
+    def _mul_kronecker(self, other):
+        """Multiply two polynomials, using Kronecker substitution."""
+        dtype = self.ring.domain.dtype
+        bounds = [a + b + 1 for a, b in zip(map(max, zip(*self)),
+                                            map(max, zip(*other)))]
+        strides = list(itertools.accumulate([1] + bounds[:-1], operator.mul))
+
+        def to_dense(f):
+            index = [sum(map(operator.mul, m, strides)) for m in f]
+            coeffs = [0]*(max(index) + 1)
+            for i, c in zip(index, f.values()):
+                coeffs[i] = int(c)
+            return coeffs
+
+        result = {}
+        for i, c in enumerate(kronecker_mul(to_dense(self), to_dense(other))):
+            c = dtype(c)
+            if c:
+                monom = []
+                for b in bounds:
+                    i, e = divmod(i, b)
+                    monom.append(e)
+                result[Monomial(monom)] = c
+        return self.__class__(result)
+
     def __rmul__(self, other):
         """Multiply other to self with other in the coefficient domain of self."""
         return self.__mul__(other)
@@ -883,6 +960,8 @@ def _pow_multinomial(self, n):
 
     def _square(self):
         """Square of a polynomial."""
+        if query('USE_PACKED_MONOMIALS') and self:
+            return self._square_packed()
         ring = self.ring
         p = ring.zero
         get = p.get
@@ -903,6 +982,134 @@ def _square(self):
         p._strip_zero()
         return p
 
+    def _packed_terms(self, packer):
+        """Return list of terms with packed monomials, in descending order."""
+        order = self.ring.order
+        terms = [(packer.key(m, order), packer.pack(m), c)
+                 for m, c in self.items()]
+        terms.sort(key=operator.itemgetter(0), reverse=True)
+        return terms
+
+    def _mul_heap(self, other):
+        """Multiply two polynomials, using heap of partial products.
+
+        Terms of the product are generated in descending order, the
+        heap holds at most one partial product per term of self.
+
+        References
+        ==========
+
+        * :cite:`Monagan2007heaps`
+
+        """
+        ring = self.ring
+        packer = self._packer(other)
+        one = packer.key(ring.zero_monom, ring.order)
+        f, g = self._packed_terms(packer), other._packed_terms(packer)
+        n, m = len(f), len(g)
+        zero = ring.domain.zero
+        unpack = packer.unpack
+        heappush, heappop = heapq.heappush, heapq.heappop
+        result = self.__class__()
+        heap = [(-f[0][0] - g[0][0] + one, 0, 0)]
+
+        while heap:
+            key = heap[0][0]
+            coeff = zero
+            while heap and heap[0][0] == key:
+                _, i, j = heappop(heap)
+                fk, fp, fc = f[i]
+                coeff += fc*g[j][2]
+                if j + 1 < m:
+                    heappush(heap, (-fk - g[j + 1][0] + one, i, j + 1))
+                if not j and i + 1 < n:
+                    heappush(heap, (-f[i + 1][0] - g[0][0] + one, i + 1, 0))
+            if coeff:
+                dict.__setitem__(result, unpack(fp + g[j][1]), coeff)
+
+        return result
+
+    def _div_heap(self, other, exact=False):
+        """Divide polynomials, using heap of quotient terms.
+
+        Terms of ``self - q*other`` are generated in descending order,
+        without computing intermediate remainders.  Returns ``None``, if
+        exponents overflow the packing.  If ``exact`` is set - raise
+        :exc:`~diofant.polys.polyerrors.ExactQuotientFailed` on the
+        first term of the remainder.
+
+        References
+        ==========
+
+        * :cite:`Monagan2007heaps`
+
+        """
+        ring = self.ring
+        domain = ring.domain
+        packer = self._packer(other)
+        one = packer.key(ring.zero_monom, ring.order)
+        f, g = self._packed_terms(packer), other._packed_terms(packer)
+        n, m = len(f), len(g)
+        gk, gp, gc = g[0]
+        zero = domain.zero
+        unpack, divides, guard = packer.unpack, packer.divides, packer.guard
+        heappush, heappop = heapq.heappush, heapq.heappop
+        q, r = [], self.__class__()
+        heap = [(-f[0][0], -1, 0)]
+
+        while heap:
+            key = heap[0][0]
+            coeff = zero
+            while heap and heap[0][0] == key:
+                _, k, j = heappop(heap)
+                if k < 0:
+                    _, exp, c = f[j]
+                    coeff += c
+                    if j + 1 < n:
+                        heappush(heap, (-f[j + 1][0], -1, j + 1))
+                else:
+                    qk, qp, qc = q[k]
+                    exp = qp + g[j][1]
+                    coeff -= qc*g[j][2]
+                    if j + 1 < m:
+                        if (qp + g[j + 1][1]) & guard:
+                            return
+                        heappush(heap, (-qk - g[j + 1][0] + one, k, j + 1))
+            if not coeff:
+                continue
+            if divides(gp, exp) and (domain.is_Field or not coeff % gc):
+                q.append((-key - gk + one, exp - gp, domain.quo(coeff, gc)))
+                if m > 1:
+                    if (exp - gp + g[1][1]) & guard:
+                        return
+                    heappush(heap, (-q[-1][0] - g[1][0] + one, len(q) - 1, 1))
+            elif exact:
+                raise ExactQuotientFailed(self, other)
+            else:
+                dict.__setitem__(r, unpack(exp), coeff)
+
+        q = self.__class__({unpack(exp): c for _, exp, c in q})
+        return q, r
+
+    def _square_packed(self):
+        """Square of a polynomial, using packed monomials."""
+        packer = self._packer()
+        pack = packer.pack
+        terms = [(pack(m), c) for m, c in self.items()]
+        zero = self.ring.domain.zero
+        result = {}
+        get = result.get
+        for i, (exp1, coeff1) in enumerate(terms):
+            coeff2 = coeff1 + coeff1
+            for exp2, coeff in terms[:i]:
+                exp = exp1 + exp2
+                result[exp] = get(exp, zero) + coeff2*coeff
+            exp = exp1 + exp1
+            result[exp] = get(exp, zero) + coeff1**2
+        unpack = packer.unpack
+        return self.__class__({unpack(exp): coeff
+                               for exp, coeff in result.items() if coeff})
+
     def __divmod__(self, other):
         ring = self.ring
 
@@ -995,6 +1202,12 @@ def div(self, fv):
             raise ValueError('self and f must have the same ring')
         if not self:
             return [ring.zero], ring.zero
+        if (len(fv) == 1 and query('USE_HEAP_DIVISION') and
+                ring.domain.is_Exact and getattr(order, 'alias', None) in _heap_orders):
+            qr = self._div_heap(fv[0])
+            if qr is not None:
+                (q, r) = qr
+                return [q], r
         s = len(fv)
         qv = [ring.zero for i in range(s)]
         p = self.copy()
@@ -1023,6 +1236,13 @@ def div(self, fv):
         return qv, r
 
     def exquo(self, other):
+        ring = self.ring
+        if (isinstance(other, ring.dtype) and other and self and
+                query('USE_HEAP_DIVISION') and ring.domain.is_Exact and
+                getattr(ring.order, 'alias', None) in _heap_orders):
+            qr = self._div_heap(other, exact=True)
+            if qr is not None:
+                return qr[0]
         q, r = divmod(self, other)
 
         if not r:
@@ -1620,7 +1840,28 @@ def eval(self, x=0, a=0):
             else:
                 return f
 
-        return self.compose(x, a).drop(x)
+        ring = self.ring
+        a = ring(a)
+
+        if not a.is_ground:
+            return self.compose(x, a).drop(x)
+
+        domain = ring.domain
+        i = ring.index(x)
+        a = a.coeff(1)
+        powers, terms = {0: domain.one}, {}
+
+        for monom, coeff in self.items():
+            k = monom[i]
+            if k not in powers:
+                powers[k] = a**k
+            monom = monom[:i] + monom[i + 1:]
+            terms[monom] = terms.get(monom, domain.zero) + coeff*powers[k]
+
+        if ring.is_univariate:
+            return terms.get((), domain.zero)
+
+        return ring.drop(i).from_dict({m: c for m, c in terms.items() if c})
 
     def compose(self, x, a=None):
         """Computes the functional composition."""
@@ -1643,6 +1884,10 @@ def compose(self, x, a=None):
 
         if ring.is_univariate:
             [(i, g)] = replacements
+            if self._is_dense():
+                return ring._from_dense(dense_compose(self._to_dense(),
+                                                      g._to_dense(),
+                                                      ring.domain))
             acc, d = ring.one, 0
             for monom, coeff in self.terms(ilex):
                 n = monom[i]
@@ -1781,6 +2026,9 @@ def resultant(self, other, includePRS=False):
         if (not includePRS and query('USE_COLLINS_RESULTANT') and
                 (domain.is_IntegerRing or domain.is_RationalField)):
             return ring._collins_resultant(self, other)
+        if (not includePRS and query('USE_HALF_GCD_RESULTANT') and
+                ring.is_univariate and domain.is_FiniteField):
+            return ring._gf_resultant(self, other)
 
         res = ring._primitive_prs(self, other)
 
@@ -4,7 +4,11 @@
 import math
 import operator
 
-from ..core import Dummy, I
+import mpmath
+
+from ..core import Dummy, I, cacheit
+from ..external import import_module
+from .densearith import dense_reverse, dense_shift
 from .orderings import ilex
 from .polyerrors import DomainError, RefinementFailed
 
@@ -51,6 +55,99 @@ def _disjoint_p(M, N, strict=False):
         return a2*d1 > c2*b1 or b2*c1 < d2*a1
 
 
+def _to_dense(f):
+    """Return dense coefficients of ``f`` and their domain, integers are preferred."""
+    domain = f.ring.domain
+    f = f._to_dense()
+
+    if domain.is_RationalField and all(c.denominator == 1 for c in f):
+        return [c.numerator for c in f], domain.ring
+
+    return f, domain
+
+
+def _from_dense(ring, f, K):
+    """Convert dense polynomial in ``K[x]`` (see :func:`_to_dense`) to ``ring``."""
+    domain = ring.domain
+
+    if K != domain:
+        f = [domain.convert(c, K) for c in f]
+
+    return ring._from_dense(f)
+
+
+def _dense_sign_variations(f):
+    """Compute the number of sign variations of dense ``f``."""
+    prev, k = 0, 0
+
+    for coeff in f:
+        if coeff*prev < 0:
+            k += 1
+
+        if coeff:
+            prev = coeff
+
+    return k
+
+
+def _dense_root_upper_bound(f):
+    """Return ``k``, such that ``2**k`` is the LMQ bound for positive roots of ``f``."""
+    n, P = len(f), []
+    t = n * [1]
+    if f and f[-1] < 0:
+        f = [-c for c in f]
+
+    def ilog2(a):
+        return int(math.log(a, 2))
+
+    for i in range(n):
+        b = int(-f[i])
+        if b <= 0:
+            continue
+
+        a, QL = ilog2(b), []
+
+        for j in range(i + 1, n):
+            b = int(f[j])
+
+            if b <= 0:
+                continue
+
+            q = t[j] + a - ilog2(b)
+            QL.append([q // (j - i), j])
+
+        if not QL:
+            continue
+
+        q = min(QL)
+
+        t[q[1]] = t[q[1]] + 1
+
+        P.append(q[0])
+
+    if P:
+        return int(max(P) + 1)
+
+
+def _dense_shift_to_bound(f, M, k, domain, K):
+    """Shift positive roots of dense ``f`` by the lower bound ``2**k``."""
+    a, b, c, d = M
+    A = domain(2)**k
+
+    if k > 4:
+        s, p, g = K(2)**k, K.one, []
+
+        for coeff in f:
+            g.append(coeff*p)
+            p *= s
+
+        f, a, c, A = g, A*a, A*c, domain.one
+
+    f = dense_shift(f, K(2)**k if A != 1 else K.one, K)
+
+    return f, (a, A*a + b, c, A*c + d)
+
+
 OO = 'OO'  # Origin of (re, im) coordinate system
 
 Q1 = 'Q1'  # Quadrant #1 (++): re > 0 and im > 0
@@ -1019,10 +1116,306 @@ def refine(self, vertical=False):
         return ComplexInterval(a, b, I, Q, F1, F2, f1, f2, self.conj)
 
 
+def _horner(f, z):
+    """Evaluate dense ``f`` (ascending order) and its derivative at ``z``."""
+    p = dp = 0*z
+    for c in reversed(f):
+        dp = dp*z + p
+        p = p*z + c
+    return p, dp
+
+
+def _aberth_initial(f):
+    """Initial approximations for the Aberth's method.
+
+    Points are placed on circles with radii, given by the upper convex
+    hull of points ``(k, log|f[k]|)``, see :cite:`Bini1996numerical`.
+
+    """
+    n = len(f) - 1
+    hull = []
+
+    for k, c in enumerate(f):
+        if c:
+            p = k, float(mpmath.log(abs(c)))
+            while len(hull) > 1 and ((hull[-1][0] - hull[-2][0])*(p[1] - hull[-2][1]) >=
+                                     (hull[-1][1] - hull[-2][1])*(p[0] - hull[-2][0])):
+                hull.pop()
+            hull.append(p)
+
+    roots = []
+
+    for (i, li), (j, lj) in zip(hull, hull[1:]):
+        u = mpmath.exp((li - lj)/(j - i))
+        for m in range(j - i):
+            roots.append(u*mpmath.expj(2*mpmath.pi*(m/(j - i) + i/n) + 0.7))
+
+    return roots
+
+
+def _aberth_float(f, roots, np, maxsteps=200):
+    """Aberth's iterations in machine floats, vectorized with NumPy."""
+    n = len(f) - 1
+    scale = mpmath.ldexp(1, -max(mpmath.mag(c) for c in f))
+    a = np.array([complex(c*scale) for c in f])
+    z = np.array([complex(r) for r in roots])
+    eps = np.finfo(float).eps
+
+    if not np.isfinite(z).all():
+        return
+
+    active = np.ones(n, dtype=bool)
+
+    with np.errstate(all='ignore'):
+        for _ in range(maxsteps):
+            # Use reversed polynomial outside of the unit disc to avoid overflows.
+            outer = abs(z) > 1
+            w = np.where(outer, 1/z, z)
+            p, dp = _horner(a, w)
+            q, dq = _horner(a[::-1], w)
+            newton = np.where(outer, 1/(w*(n - w*dq/q)), p/dp)
+
+            d = z[:, np.newaxis] - z
+            np.fill_diagonal(d, 1)
+            d = 1/d
+            np.fill_diagonal(d, 0)
+
+            delta = newton/(1 - newton*d.sum(axis=1))
+            delta = np.where(np.isfinite(delta) & active, delta, 0)
+            z -= delta
+            active &= abs(delta) > 4*eps*abs(z)
+
+            if not active.any():
+                break
+
+    if np.isfinite(z).all():
+        return [mpmath.mpc(c) for c in z.tolist()]
+
+
+def _aberth_float_sums(roots, np):
+    """Compute sums of ``1/(z_i - z_j)`` and of ``log|z_i - z_j|`` in machine floats.
+
+    Returns None, if some roots are not separated well enough
+    (relative distance below ``2**-30``) for the machine precision.
+
+    """
+    z = [complex(r) for r in roots]
+
+    if np is not None:
+        z = np.array(z)
+        with np.errstate(all='ignore'):
+            d = z[:, np.newaxis] - z
+            m = abs(z)[:, np.newaxis] + abs(z)
+            np.fill_diagonal(d, 1)
+            np.fill_diagonal(m, 0)
+            if not (np.isfinite(d).all() and (abs(d) > m*2.0**-30).all()):
+                return
+            logs = np.log(abs(d)).sum(axis=1)
+            d = 1/d
+            np.fill_diagonal(d, 0)
+            return d.sum(axis=1).tolist(), logs.tolist()
+
+    sums, logs = [], []
+
+    for i, u in enumerate(z):
+        s = l = 0
+        for j, v in enumerate(z):
+            if i != j:
+                d = u - v
+                if not (math.isfinite(abs(d)) and abs(d) > (abs(u) + abs(v))*2.0**-30):
+                    return
+                s += 1/d
+                l += math.log(abs(d))
+        sums.append(s)
+        logs.append(l)
+
+    return sums, logs
+
+
+def _aberth_eval(f, z, wp, derivative=True):
+    """Evaluate integer ``f`` and its derivative at ``z`` in fixed-point arithmetic.
+
+    Outside of the unit disc, the reversed polynomial is evaluated at
+    ``w = 1/z`` instead.  The point (``z`` or ``w``) is rounded to the
+    grid with step ``2**-wp`` and absolute errors of values are below
+    ``2*n*2**-wp``, as the point lies in the unit disc.
+
+    Returns a flag for the reversed polynomial, the point and the
+    values.
+
+    """
+    outer = abs(z) > 1
+    t = 1/z if outer else z
+    x, y = int(mpmath.ldexp(t.real, wp)), int(mpmath.ldexp(t.imag, wp))
+    px = py = dx = dy = 0
+
+    for c in (f if outer else reversed(f)):
+        if derivative:
+            dx, dy = ((dx*x - dy*y) >> wp) + px, ((dx*y + dy*x) >> wp) + py
+        px, py = ((px*x - py*y) >> wp) + (c << wp), (px*y + py*x) >> wp
+
+    def mpc(x, y):
+        return mpmath.mpc(mpmath.ldexp(x, -wp), mpmath.ldexp(y, -wp))
+
+    return outer, mpc(x, y), mpc(px, py), mpc(dx, dy)
+
+
+def _aberth_polish(f, roots, prec, np, maxsteps=100):
+    """Aberth's iterations with current precision of mpmath.
+
+    Iterations for a root are stopped, when relative correction is
+    below ``2**-prec``.  Sums of ``1/(z_i - z_j)`` are computed in
+    machine floats, if possible.
+
+    """
+    n = len(f) - 1
+    wp = mpmath.mp.prec
+    tol = mpmath.ldexp(1, -prec)
+    roots = list(roots)
+    active = [True]*n
+
+    for _ in range(maxsteps):
+        sums = _aberth_float_sums(roots, np)
+
+        if sums is not None:
+            sums = sums[0]
+        else:
+            sums = [mpmath.fsum(1/(z - w) for j, w in enumerate(roots) if i != j)
+                    for i, z in enumerate(roots)]
+
+        for i, z in enumerate(roots):
+            if active[i]:
+                outer, t, p, dp = _aberth_eval(f, z, wp)
+                if outer:
+                    z = 1/t
+                    newton = 1/(t*(n - t*dp/p)) if p else p
+                else:
+                    z = t
+                    newton = p/dp if p else p
+                delta = newton/(1 - newton*sums[i])
+                roots[i] = z - delta
+                active[i] = abs(delta) > tol*abs(z)
+
+        if not any(active):
+            break
+
+    return roots
+
+
+def _aberth_certify(f, roots, np):
+    """Compute inclusion radii for approximations of roots of ``f``.
+
+    If discs ``|x - roots[i]| <= radii[i]`` are pairwise disjoint, then
+    each of them contains exactly one root of ``f``.  Radii are ``n``
+    times the Weierstrass corrections (with a safety factor) plus
+    bounds for rounding errors.  Approximations of roots, which discs
+    intersect the real line, are replaced by real numbers and then
+    discs, if isolated, contain real roots.
+
+    Returns pair of the new approximations and their radii, the latter
+    is None if discs are not disjoint.
+
+    """
+    n = len(f) - 1
+    wp = mpmath.mp.prec
+    lc = mpmath.log(abs(f[-1]))
+    err = mpmath.ldexp(n + 1, 2 - wp)
+
+    def evaluate(z):
+        # Returns the point and logarithm of the bound for |f| at it.
+        outer, t, p, _ = _aberth_eval(f, z, wp, derivative=False)
+        if outer:
+            z = 1/t
+            return z, mpmath.log(abs(p) + err) + n*mpmath.log(abs(z))
+        else:
+            return t, mpmath.log(abs(p) + err)
+
+    def radii(roots, values):
+        sums = _aberth_float_sums(roots, np)
+        radii = []
+        for i, z in enumerate(roots):
+            if sums is not None:
+                d = sums[1][i]
+            else:
+                d = mpmath.log(abs(mpmath.fprod(z - w for j, w in enumerate(roots) if i != j)))
+            radii.append(4*n*mpmath.exp(values[i] - lc - d) + mpmath.ldexp(abs(z), 2 - wp))
+        return radii, sums is not None
+
+    roots, values = map(list, zip(*map(evaluate, roots)))
+    rs, _ = radii(roots, values)
+
+    for i, (z, r) in enumerate(zip(roots, rs)):
+        if z.imag and abs(z.imag) <= r:
+            roots[i], values[i] = evaluate(mpmath.mpc(z.real))
+
+    rs, separated = radii(roots, values)
+
+    # Well separated roots have disjoint discs, if radii are small.
+    if separated and all(r <= mpmath.ldexp(abs(z), -32) for z, r in zip(roots, rs)):
+        return roots, rs
+
+    for i, (z, r) in enumerate(zip(roots, rs)):
+        for w, s in zip(roots[i + 1:], rs[i + 1:]):
+            if abs(z - w) <= r + s:
+                return roots, None
+
+    return roots, rs
+
+
+def _aberth_roots(f, prec):
+    """Approximate all roots of square-free ``f`` with certified error bounds.
+
+    The Aberth's method (see :cite:`Aberth1973iteration` and
+    :cite:`Bini1996numerical`) is used for all roots simultaneously,
+    first in machine floats (if NumPy is available) and then with
+    increasing precision, until approximations are certified by
+    inclusion discs, see :cite:`Bini2000design`.
+
+    Parameters
+    ==========
+
+    f : list
+        dense polynomial (ascending order) with integer coefficients
+        and nonzero constant term.
+    prec : int
+        number of correct bits.
+
+    Returns list of pairs ``(z, r)``, such that discs ``|x - z| <= r``
+    are pairwise disjoint, each contains exactly one root of ``f`` and
+    ``r <= 2**-prec*|z|``.  Real roots are approximated by real
+    numbers (imaginary part is zero).  Returns None, if approximations
+    can't be certified (e.g. ``f`` has multiple roots).
+
+    """
+    n = len(f) - 1
+    np = import_module('numpy')
+    wp = prec + 2*n.bit_length() + 20
+
+    with mpmath.workprec(53):
+        roots = _aberth_initial(f)
+
+    if np is not None:
+        roots = _aberth_float(f, roots, np) or roots
+
+    for _ in range(4):
+        with mpmath.workprec(wp):
+            try:
+                roots = _aberth_polish(f, roots, prec + 8, np)
+                roots, radii = _aberth_certify(f, roots, np)
+            except ZeroDivisionError:
+                return
+            if radii is not None and all(r <= mpmath.ldexp(abs(z), -prec)
+                                         for z, r in zip(roots, radii)):
+                return list(zip(roots, radii))
+        wp *= 2
+
+
 class _FindRoot:
     """Mixin class for computing polynomial roots."""
 
+    @cacheit
     def _sturm(self, f):
+        """Compute the Sturm sequence of ``f`` (cached, as a tuple)."""
         domain = self.domain
 
         if not domain.is_Field:
@@ -1036,7 +1429,7 @@ def _sturm(self, f):
             s = sturm[-2] % sturm[-1]
             sturm.append(-s)
 
-        return sturm[:-1]
+        return tuple(sturm[:-1])
 
     def _sign_variations(self, f):
         """
@@ -1075,124 +1468,95 @@ def _root_upper_bound(self, f):
         Akritas-Strzebonski-Vigklas :cite:`Alkiviadis2009bounds`.
 
         """
-        domain = self.domain
-
-        n, P = len(f.all_coeffs()), []
-        t = n * [1]
-        if f.LC < 0:
-            f = -f
-        f = self._reverse(f)
+        k = _dense_root_upper_bound(f._to_dense())
 
-        def ilog2(a):
-            return int(math.log(a, 2))
+        if k is not None:
+            return self.domain(2)**k
 
-        for i in range(n):
-            b = int(-f.coeff((n - 1 - i,)))
-            if b <= 0:
-                continue
-
-            a, QL = ilog2(b), []
-
-            for j in range(i + 1, n):
-                b = int(f.coeff((n - 1 - j,)))
-
-                if b <= 0:
-                    continue
-
-                q = t[j] + a - ilog2(b)
-                QL.append([q // (j - i), j])
-
-            if not QL:
-                continue
-
-            q = min(QL)
-
-            t[q[1]] = t[q[1]] + 1
-
-            P.append(q[0])
-
-        if P:
-            return domain(2)**int(max(P) + 1)
-
-    def _step_refine_real_root(self, f, M):
-        """One step of positive real root refinement algorithm."""
+    def _dense_step_refine_real_root(self, f, M, K):
+        """One step of positive real root refinement for dense ``f`` in ``K[x]``."""
         domain = self.domain
-        x = self.gens[0]
 
         a, b, c, d = M
 
         if a == b and c == d:
             return f, (a, b, c, d)
 
-        A = self._root_upper_bound(self._reverse(f))
-
-        if A is not None:
-            A = 1/domain.convert(A)
-        else:
-            A = domain.zero
+        k = _dense_root_upper_bound(dense_reverse(f, len(f) - 1))
 
-        if A > 16:
-            f = f.compose(x, A*x)
-            a, c, A = A*a, A*c, domain.one
+        if k is not None and k <= 0:
+            f, (a, b, c, d) = _dense_shift_to_bound(f, (a, b, c, d), -k,
+                                                    domain, K)
 
-        if A >= 1:
-            f = f.compose(x, x + A)
-            b, d = A*a + b, A*c + d
+            assert f[0]
 
-            assert f.coeff(1)
-
-        f, g = f.compose(x, x + 1), f
+        f, g = dense_shift(f, K.one, K), f
 
         a1, b1, c1, d1 = a, a + b, c, c + d
 
-        if not f.eval(x, 0):
+        if not f[0]:
             return f, (b1, b1, d1, d1)
 
-        k = self._sign_variations(f)
+        k = _dense_sign_variations(f)
 
         if k == 1:
             a, b, c, d = a1, b1, c1, d1
         else:
-            f = self._reverse(g).compose(x, x + 1)
+            f = dense_shift(dense_reverse(g, len(g) - 1), K.one, K)
 
-            assert f.coeff(1)
+            assert f[0]
 
             a, b, c, d = b, a + b, d, c + d
 
         return f, (a, b, c, d)
 
-    def _inner_refine_real_root(self, f, M, eps=None, steps=None, disjoint=None, mobius=False):
-        """Refine a positive root of `f` given a Mobius transform or an interval."""
+    def _step_refine_real_root(self, f, M):
+        """One step of positive real root refinement algorithm."""
+        f, K = _to_dense(f)
+        f, M = self._dense_step_refine_real_root(f, M, K)
+        return _from_dense(self, f, K), M
+
+    def _dense_inner_refine_real_root(self, f, M, K, eps=None, steps=None, disjoint=None):
+        """Refine a positive root of dense ``f`` in ``K[x]`` given a Mobius transform."""
+        step = self._dense_step_refine_real_root
         a, b, c, d = M
 
         while not c:
-            f, (a, b, c, d) = self._step_refine_real_root(f, (a, b, c, d))
+            f, (a, b, c, d) = step(f, (a, b, c, d), K)
 
         if eps is not None and steps is not None:
             for i in range(steps):
                 if abs(a/c - b/d) >= eps:
-                    f, (a, b, c, d) = self._step_refine_real_root(f, (a, b, c, d))
+                    f, (a, b, c, d) = step(f, (a, b, c, d), K)
                 else:
                     break
         else:
             if eps is not None:
                 while abs(a/c - b/d) >= eps:
-                    f, (a, b, c, d) = self._step_refine_real_root(f, (a, b, c, d))
+                    f, (a, b, c, d) = step(f, (a, b, c, d), K)
 
             if steps is not None:
                 for i in range(steps):
-                    f, (a, b, c, d) = self._step_refine_real_root(f, (a, b, c, d))
+                    f, (a, b, c, d) = step(f, (a, b, c, d), K)
 
         if disjoint is not None:
             while True:
                 u, v = _mobius_to_interval((a, b, c, d))
 
                 if u < disjoint < v:
-                    f, (a, b, c, d) = self._step_refine_real_root(f, (a, b, c, d))
+                    f, (a, b, c, d) = step(f, (a, b, c, d), K)
                 else:
                     break
 
-        return (f, (a, b, c, d)) if mobius else _mobius_to_interval((a, b, c, d))
+        return f, (a, b, c, d)
+
+    def _inner_refine_real_root(self, f, M, eps=None, steps=None, disjoint=None, mobius=False):
+        """Refine a positive root of `f` given a Mobius transform or an interval."""
+        f, K = _to_dense(f)
+        f, M = self._dense_inner_refine_real_root(f, M, K, eps=eps, steps=steps,
+                                                  disjoint=disjoint)
+
+        return (_from_dense(self, f, K), M) if mobius else _mobius_to_interval(M)
 
     def _outer_refine_real_root(self, f, s, t, eps=None, steps=None, disjoint=None):
         """Refine a positive root of `f` given an interval `(s, t)`."""
@@ -1243,63 +1607,62 @@ def _refine_real_root(self, f, s, t, eps=None, steps=None, disjoint=None):
         return (-t, -s) if negative else (s, t)
 
     def _inner_isolate_real_roots(self, f, eps=None):
-        """Internal function for isolation positive roots up to given precision."""
+        """Internal function for isolation positive roots up to given precision.
+
+        Polynomials are transformed in the dense representation, with
+        integer coefficients if possible, see :func:`~diofant.polys.densearith.dense_shift`.
+
+        """
         domain = self.domain
-        x = self.gens[0]
+        f, K = _to_dense(f)
         a, b, c, d = domain.one, domain.zero, domain.zero, domain.one
-        k = self._sign_variations(f)
+        k = _dense_sign_variations(f)
 
         roots, stack = [], [(a, b, c, d, f, k)]
 
-        while stack:
-            a, b, c, d, f, k = stack.pop()
+        def refine(f, M):
+            f, M = self._dense_inner_refine_real_root(f, M, K, eps=eps)
+            roots.append((_from_dense(self, f, K), M))
 
-            A = self._root_upper_bound(self._reverse(f))
+        def shift_reverse(f):
+            f = dense_shift(dense_reverse(f, len(f) - 1), K.one, K)
+            return f if f[0] else f[1:]
 
-            if A is not None:
-                A = 1/domain.convert(A)
-            else:
-                A = domain.zero
+        while stack:
+            a, b, c, d, f, k = stack.pop()
 
-            if A > 16:
-                f = f.compose(x, A*x)
-                a, c, A = A*a, A*c, domain.one
+            A = _dense_root_upper_bound(dense_reverse(f, len(f) - 1))
 
-            if A >= 1:
-                f = f.compose(x, x + A)
-                b, d = A*a + b, A*c + d
+            if A is not None and A <= 0:
+                f, (a, b, c, d) = _dense_shift_to_bound(f, (a, b, c, d), -A,
+                                                        domain, K)
 
-                assert f.coeff(1)
+                assert f[0]
 
-                k = self._sign_variations(f)
+                k = _dense_sign_variations(f)
 
                 if k == 0:
                     continue
                 if k == 1:
-                    roots.append(self._inner_refine_real_root(f, (a, b, c, d),
-                                                              eps=eps, mobius=True))
+                    refine(f, (a, b, c, d))
                     continue
 
-            f1 = f.compose(x, x + 1)
+            f1 = dense_shift(f, K.one, K)
 
             a1, b1, c1, d1, r = a, a + b, c, c + d, 0
 
-            if not f1.coeff(1):
-                roots.append((f1, (b1, b1, d1, d1)))
-                f1, r = f1 // x, 1
+            if not f1[0]:
+                roots.append((_from_dense(self, f1, K), (b1, b1, d1, d1)))
+                f1, r = f1[1:], 1
 
-            k1 = self._sign_variations(f1)
+            k1 = _dense_sign_variations(f1)
             k2 = k - k1 - r
 
             a2, b2, c2, d2 = b, a + b, d, c + d
 
             if k2 > 1:
-                f2 = self._reverse(f).compose(x, x + 1)
-
-                if not f2.coeff(1):
-                    f2 //= x
-
-                k2 = self._sign_variations(f2)
+                f2 = shift_reverse(f)
+                k2 = _dense_sign_variations(f2)
             else:
                 f2 = None
 
@@ -1312,14 +1675,10 @@ def _inner_isolate_real_roots(self, f, eps=None):
                 continue
 
             if f1 is None:
-                f1 = self._reverse(f).compose(x, x + 1)
-
-                if not f1.coeff(1):
-                    f1 //= x
+                f1 = shift_reverse(f)
 
             if k1 == 1:
-                roots.append(self._inner_refine_real_root(f1, (a1, b1, c1, d1),
-                                                          eps=eps, mobius=True))
+                refine(f1, (a1, b1, c1, d1))
             else:
                 stack.append((a1, b1, c1, d1, f1, k1))
 
@@ -1327,14 +1686,10 @@ def _inner_isolate_real_roots(self, f, eps=None):
                 continue
 
             if f2 is None:
-                f2 = self._reverse(f).compose(x, x + 1)
-
-                if not f2.coeff(1):
-                    f2 //= x
+                f2 = shift_reverse(f)
 
             if k2 == 1:
-                roots.append(self._inner_refine_real_root(f2, (a2, b2, c2, d2),
-                                                          eps=eps, mobius=True))
+                refine(f2, (a2, b2, c2, d2))
             else:
                 stack.append((a2, b2, c2, d2, f2, k2))
 
@@ -1486,13 +1841,25 @@ def _isolate_real_roots_sqf(self, f, eps=None, inf=None, sup=None, blackbox=Fals
         if f.degree() <= 0:
             return []
 
-        I_zero, f = new_ring._isolate_zero(f, inf, sup, sqf=True)
+        f, roots = new_ring._cached_isolate_real_roots_sqf(f, eps, inf, sup)
 
-        I_neg = new_ring._inner_isolate_negative_roots(f, eps=eps, inf=inf, sup=sup)
-        I_pos = new_ring._inner_isolate_positive_roots(f, eps=eps, inf=inf, sup=sup)
+        return [RealInterval((a, b), f) for (a, b) in roots] if blackbox else list(roots)
 
-        roots = sorted(I_neg + I_zero + I_pos)
-        return [RealInterval((a, b), f) for (a, b) in roots] if blackbox else roots
+    @cacheit
+    def _cached_isolate_real_roots_sqf(self, f, eps, inf, sup):
+        """Isolate real roots of a square-free polynomial with rational coefficients.
+
+        Returns ``f`` without the zero root and the tuple of isolating
+        intervals.  Results are cached, so repeated isolation of roots
+        of the same polynomial is free.
+
+        """
+        I_zero, f = self._isolate_zero(f, inf, sup, sqf=True)
+
+        I_neg = self._inner_isolate_negative_roots(f, eps=eps, inf=inf, sup=sup)
+        I_pos = self._inner_isolate_positive_roots(f, eps=eps, inf=inf, sup=sup)
+
+        return f, tuple(sorted(I_neg + I_zero + I_pos))
 
     def _isolate_real_roots(self, f, eps=None, inf=None, sup=None):
         """Isolate real roots.
@@ -1678,6 +2045,41 @@ def _isolate_all_roots(self, f, eps=None, inf=None, sup=None):
         else:
             raise NotImplementedError('only trivial square-free polynomials are supported')
 
+    @cacheit
+    def _nroots_sqf(self, f, prec):
+        """Approximate roots of square-free ``f`` with certified error bounds.
+
+        Returns tuple of pairs ``(z, r)`` (see :func:`_aberth_roots`)
+        or None, if the certification fails.
+
+        Examples
+        ========
+
+        >>> R, x = ring('x', ZZ)
+
+        >>> roots = R._nroots_sqf(x**3 - x, 53)
+        >>> sorted(z.real for z, _ in roots)
+        [-1.0, 0.0, 1.0]
+        >>> all(r < 2**-53 for _, r in roots)
+        True
+
+        """
+        domain = self.domain
+
+        if not domain.is_IntegerRing and not domain.is_RationalField:
+            raise DomainError(f'numerical approximation of roots is not supported over {domain}')
+
+        (j,), f = f.clear_denoms()[1].terms_gcd()
+        roots = [(mpmath.mpc(0), mpmath.mpf(0))]*j
+
+        if f.degree() > 0:
+            approx = _aberth_roots([int(c) for c in f._to_dense()], prec)
+            if approx is None:
+                return
+            roots.extend(approx)
+
+        return tuple(roots)
+
     def _real_imag(self, f, _y=Dummy('y')):
         """
         Return bivariate polynomials ``f1`` and ``f2``, such that ``f = f1 + f2*I``.
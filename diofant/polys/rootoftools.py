@@ -1,19 +1,22 @@
 """Implementation of RootOf class and related tools."""
 
-import typing
+import collections
+import threading
 
-from mpmath import findroot, mpc, mpf, workprec
+from mpmath import findroot, hypot, ldexp, mpc, mpf, workprec
 from mpmath.libmp.libmpf import prec_to_dps
 
 from ..core import (Add, Dummy, Expr, Float, I, Integer, Lambda, Rational,
                     cacheit, symbols, sympify)
+from ..core.cache import _CacheInfo
 from ..core.evaluate import global_evaluate
 from ..core.function import AppliedUndef
-from ..domains import QQ
+from ..domains import QQ, ZZ
 from ..functions import root as _root
 from ..functions import sign
 from ..logic import false
 from ..utilities import lambdify, ordered, sift
+from .polyconfig import query
 from .polyerrors import (DomainError, GeneratorsNeeded,
                          MultivariatePolynomialError, PolynomialError)
 from .polyfuncs import symmetrize, viete
@@ -21,11 +24,94 @@
                         roots_linear, roots_quadratic, roots_quartic)
 from .polytools import Poly, PurePoly, factor
 from .rationaltools import together
-from .rootisolation import ComplexInterval, RealInterval
+from .rootisolation import RealInterval
 
 
-_reals_cache: typing.Dict[Poly, RealInterval] = {}
-_complexes_cache: typing.Dict[Poly, ComplexInterval] = {}
+class _IntervalCache:
+    """LRU cache of isolating intervals for roots of irreducible polynomials.
+
+    Maps polynomials to lists of intervals (in the order of roots), at
+    most ``maxsize`` polynomials are kept.  Access is protected by a
+    lock and an interval of a root is replaced only by a tighter one
+    (see :meth:`update`), so refinements are never lost.  Like for
+    :func:`~diofant.core.cache.cacheit`, there are ``cache_info()``,
+    ``cache_clear()`` and ``cache_resize()`` methods, the
+    ``cache_stats()`` method also counts evicted entries.
+
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, poly):
+        with self.lock:
+            return poly in self.entries
+
+    def __getitem__(self, poly):
+        with self.lock:
+            try:
+                roots = self.entries[poly]
+            except KeyError:
+                self.misses += 1
+                raise
+            self.entries.move_to_end(poly)
+            self.hits += 1
+            return roots
+
+    def __setitem__(self, poly, roots):
+        with self.lock:
+            old = self.entries.get(poly)
+            if old is not None and len(old) == len(roots):
+                roots = [u if _is_tighter(u, v) else v
+                         for u, v in zip(roots, old)]
+            self.entries[poly] = list(roots)
+            self.entries.move_to_end(poly)
+            self._evict()
+
+    def update(self, poly, index, interval):
+        """Set an interval for the ``index``-th root, if it's tighter."""
+        with self.lock:
+            roots = self.entries.get(poly)
+            if roots is not None and _is_tighter(interval, roots[index]):
+                roots[index] = interval
+
+    def _evict(self):
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def cache_info(self):
+        return _CacheInfo(self.hits, self.misses, self.maxsize,
+                          len(self.entries))
+
+    def cache_clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def cache_resize(self, maxsize):
+        with self.lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def cache_stats(self):
+        return {**self.cache_info()._asdict(), 'evictions': self.evictions}
+
+
+def _is_tighter(u, v):
+    """Test if interval ``u`` is strictly inside of ``v``."""
+    if isinstance(u, RealInterval):
+        return v.a <= u.a and u.b <= v.b and u.b - u.a < v.b - v.a
+    return (v.ax <= u.ax and u.bx <= v.bx and v.ay <= u.ay and u.by <= v.by and
+            (u.bx - u.ax, u.by - u.ay) != (v.bx - v.ax, v.by - v.ay))
+
+
+_reals_cache = _IntervalCache()
+_complexes_cache = _IntervalCache()
 _x = Dummy('x')
 
 
@@ -234,7 +320,9 @@ def all_roots(cls, poly, radicals=True):
     @classmethod
     def _get_reals_sqf(cls, factor):
         """Compute real root isolating intervals for a square-free polynomial."""
-        if factor not in _reals_cache:
+        try:
+            return _reals_cache[factor]
+        except KeyError:
             ring = factor.domain.inject(_x)
             rep = factor.rep
             rep = ring.from_dict(dict(rep))
@@ -242,12 +330,13 @@ def _get_reals_sqf(cls, factor):
             if not reals:
                 _reals_cache[factor] = []
             return reals
-        return _reals_cache[factor]
 
     @classmethod
     def _get_complexes_sqf(cls, factor):
         """Compute complex root isolating intervals for a square-free polynomial."""
-        if factor not in _complexes_cache:
+        try:
+            return _complexes_cache[factor]
+        except KeyError:
             ring = factor.domain.inject(_x)
             rep = factor.rep
             rep = ring.from_dict(dict(rep))
@@ -255,7 +344,6 @@ def _get_complexes_sqf(cls, factor):
             if not complexes:
                 _complexes_cache[factor] = []
             return complexes
-        return _complexes_cache[factor]
 
     @classmethod
     def _get_reals(cls, factors):
@@ -524,24 +612,28 @@ def _get_roots(cls, method, poly, radicals):
 
         return roots
 
+    def _cache_index(self):
+        """Return the interval cache and the index of the root there."""
+        if self.is_real:
+            return _reals_cache, self.index
+        else:
+            return _complexes_cache, self.index - self.poly.count_roots()
+
     @property
     def interval(self):
         """Return isolation interval for the root."""
-        if self.is_real:
-            return _reals_cache[self.poly][self.index]
-        else:
-            reals_count = self.poly.count_roots()
-            return _complexes_cache[self.poly][self.index - reals_count]
+        cache, index = self._cache_index()
+        try:
+            return cache[self.poly][index]
+        except KeyError:
+            # intervals were evicted, isolate roots again
+            self._indexed_root(self.poly, self.index)
+            return cache[self.poly][index]
 
     def refine(self):
         """Refine isolation interval for the root."""
-        if self.is_real:
-            root = _reals_cache[self.poly][self.index]
-            _reals_cache[self.poly][self.index] = root.refine()
-        else:
-            reals_count = self.poly.count_roots()
-            root = _complexes_cache[self.poly][self.index - reals_count]
-            _complexes_cache[self.poly][self.index - reals_count] = root.refine()
+        cache, index = self._cache_index()
+        cache.update(self.poly, index, self.interval.refine())
 
     def _eval_subs(self, old, new):
         if old in self.free_symbols:
@@ -550,6 +642,50 @@ def _eval_subs(self, old, new):
             # don't allow subs to change anything
             return self
 
+    def _certified_root(self, prec):
+        """Approximate the root with the Aberth's method.
+
+        For polynomials of degree at least ``ABERTH_CUTOFF`` config
+        value, all roots are approximated with certified inclusion
+        discs.  The isolating interval is refined, until it intersects
+        only one disc.  Returns None, if this fails.
+
+        """
+        poly = self.poly
+
+        if poly.domain not in (ZZ, QQ) or poly.degree() < query('ABERTH_CUTOFF'):
+            return
+
+        ring = poly.domain.inject(_x)
+        roots = ring._nroots_sqf(ring.from_dict(dict(poly.rep)), prec)
+
+        if roots is None:
+            return
+
+        def to_mpf(c):
+            return mpf(c.numerator)/c.denominator
+
+        for _ in range(10):
+            interval = self.interval
+            if self.is_extended_real:
+                ax, bx, ay, by = map(to_mpf, (interval.a, interval.b, 0, 0))
+            else:
+                ax, bx, ay, by = map(to_mpf, (interval.ax, interval.bx,
+                                              interval.ay, interval.by))
+            slack = ldexp(max(map(abs, (ax, bx, ay, by))) + 1, 4 - prec)
+
+            discs = []
+            for z, r in roots:
+                dx = max(ax - z.real, z.real - bx, 0)
+                dy = max(ay - z.imag, z.imag - by, 0)
+                if hypot(dx, dy) <= r + slack:
+                    discs.append(z)
+
+            if len(discs) == 1:
+                return discs[0]
+
+            self.refine()
+
     def _eval_evalf(self, prec):
         """Evaluate this complex root to the given precision."""
         with workprec(prec):
@@ -565,7 +701,9 @@ def _eval_evalf(self, prec):
             except DomainError:
                 return super()._eval_evalf(prec)
 
-            while True:
+            root = self._certified_root(prec)
+
+            while root is None:
                 if self.is_extended_real:
                     a = mpf(str(interval.a))
                     b = mpf(str(interval.b))
@@ -602,6 +740,7 @@ def _eval_evalf(self, prec):
                         break
                 except (ValueError, UnboundLocalError):
                     pass
+                root = None
                 self.refine()
                 interval = self.interval
 
@@ -1,6 +1,11 @@
 """Low-level linear systems solver."""
 
-from ..matrices import Matrix, zeros
+import collections
+import random
+
+from ..matrices import DomainMatrix, Matrix, zeros
+from .galoistools import gf_modulus, gf_wiedemann
+from .polyconfig import query
 
 
 class RawMatrix(Matrix):
@@ -21,8 +26,160 @@ def eqs_to_matrix(eqs, ring):
     return m
 
 
+def eqs_to_rows(eqs, ring):
+    """Transform from equations to sparse rows of the augmented matrix.
+
+    Rows are dictionaries, mapping column indices to nonzero coefficients.
+
+    Examples
+    ========
+
+    >>> R, x, y = ring('x y', QQ)
+    >>> eqs_to_rows([x + 2*y - 1, 3*y], R)
+    [{0: 1, 1: 2, 2: 1}, {1: 3}]
+
+    """
+    n = len(ring.gens)
+    rows = []
+
+    for e in eqs:
+        row = {}
+        for monom, coeff in e.items():
+            if not any(monom):
+                row[n] = -coeff
+            elif sum(monom) == 1:
+                row[monom.index(1)] = coeff
+        rows.append(row)
+
+    return rows
+
+
+def sparse_rref(rows, domain):
+    """Return reduced row echelon form of a sparse matrix over a field.
+
+    Rows are dictionaries, mapping column indices to nonzero elements
+    of ``domain``.  Returns the list of nonzero rows of the echelon
+    form and the list of pivots.
+
+    The Gauss-Jordan elimination processes columns in the increasing
+    order, but the pivot row is chosen among candidates by the least
+    number of nonzero entries (the Markowitz count), to reduce the
+    fill-in.  Only rows with a nonzero entry in the pivot column are
+    visited.
+
+    Examples
+    ========
+
+    >>> sparse_rref([{0: QQ(1), 1: QQ(2)}, {0: QQ(2), 1: QQ(4), 2: QQ(1)}], QQ)
+    ([{0: 1, 1: 2}, {2: 1}], [0, 2])
+
+    """
+    rows = [dict(row) for row in rows]
+    cols = collections.defaultdict(set)
+
+    for i, row in enumerate(rows):
+        for j in row:
+            cols[j].add(i)
+
+    pivots, prows, done = [], [], set()
+
+    for j in sorted(cols):
+        candidates = [i for i in cols[j] if i not in done]
+        if not candidates:
+            continue
+
+        r = min(candidates, key=lambda i: (len(rows[i]), i))
+        inv = domain.one/rows[r][j]
+        prow = rows[r] = {k: a*inv for k, a in rows[r].items()}
+
+        for i in list(cols[j]):
+            if i == r:
+                continue
+            row, a = rows[i], rows[i][j]
+            for k, b in prow.items():
+                c = row.get(k, domain.zero) - a*b
+                if c:
+                    row[k] = c
+                    cols[k].add(i)
+                else:
+                    del row[k]
+                    cols[k].discard(i)
+
+        done.add(r)
+        pivots.append(j)
+        prows.append(r)
+
+    return [rows[i] for i in prows], pivots
+
+
 def solve_lin_sys(eqs, ring):
-    """Solve a system of linear equations."""
+    """Solve a system of linear equations.
+
+    Large enough square systems with rational coefficients are solved
+    with :meth:`~diofant.matrices.domainmatrix.DomainMatrix.solve`
+    and over prime finite fields of large enough order with
+    :func:`~diofant.polys.galoistools.gf_wiedemann`, if the solution
+    is unique (with the error probability below ``2**-64``).  Else, the augmented matrix is
+    row-reduced, see :func:`sparse_rref`.
+
+    """
+    domain = ring.domain
+    gens = ring.gens
+    n = len(gens)
+
+    if (len(eqs) == n >= query('MODULAR_LINALG_CUTOFF') and
+            domain.is_RationalField):
+        A = DomainMatrix([[e.coeff(x) for x in gens] for e in eqs],
+                         (n, n), domain)
+        b = DomainMatrix([[-e.coeff(1)] for e in eqs], (n, 1), domain)
+        try:
+            x = A.solve(b)
+        except ValueError:
+            pass
+        else:
+            return {x_i: ring(row[0]) for x_i, row in zip(gens, x.rows)}
+
+    if not domain.is_Field:
+        return _solve_lin_sys_dense(eqs, ring)
+
+    rows = eqs_to_rows(eqs, ring)
+    mod = gf_modulus(domain)
+
+    if (mod and mod > 2**16 and
+            len(eqs) == n >= query('WIEDEMANN_CUTOFF')):
+        A = [{j: int(c) for j, c in row.items() if j < n} for row in rows]
+        x = gf_wiedemann(A, [int(row.get(n, 0)) for row in rows], mod)
+        if x is not None and _is_nonsingular(A, mod):
+            return {x_i: ring(domain.convert(c)) for x_i, c in zip(gens, x)}
+
+    echelon, pivots = sparse_rref(rows, domain)
+
+    if not pivots:
+        return {}
+    elif pivots[-1] == n:
+        return
+
+    sols = {}
+    for row, p in zip(echelon, pivots):
+        terms = (gens[j]*c for j, c in row.items() if p < j < n)
+        sols[gens[p]] = ring(row.get(n, domain.zero)) - sum(terms, ring.zero)
+
+    return sols
+
+
+def _is_nonsingular(rows, p, tries=4):
+    # if A is singular, the Wiedemann's algorithm finds a random vector
+    # r from the solution of A*x = A*r with probability at most 1/p
+    n = len(rows)
+    for _ in range(tries):
+        r = [random.randrange(p) for _ in range(n)]
+        b = [sum(c*r[j] for j, c in row.items()) % p for row in rows]
+        if gf_wiedemann(rows, b, p) != r:
+            return False
+    return True
+
+
+def _solve_lin_sys_dense(eqs, ring):
     # transform from equations to matrix form
     matrix = eqs_to_matrix(eqs, ring)
 
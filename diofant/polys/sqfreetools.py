@@ -1,5 +1,7 @@
 """Square-free decomposition algorithms and related tools."""
 
+from .densearith import dense_divmod, dense_gcd, dense_strip
+from .galoistools import gf_gcd, gf_modulus, gf_quo
 from .polyerrors import DomainError
 
 
@@ -61,6 +63,9 @@ def _gf_sqf_list(self, f):
     def _gf_musser_sqf_list(self, f):
         """Compute square-free decomposition of the monic ``f`` in ``GF(q)[x]``.
 
+        Computations are done with dense lists of coefficients (of
+        machine integers, for prime fields of word-size order).
+
         References
         ==========
 
@@ -72,32 +77,56 @@ def _gf_musser_sqf_list(self, f):
         n, factors, p = 1, [], domain.characteristic
         m = int(domain.order // p)
 
-        while not f.is_ground:
-            df = f.diff()
+        q = gf_modulus(domain)
+        if q is not None:
+            f = [int(c) for c in f._to_dense()]
+
+            def gcd(f, g):
+                return gf_gcd(f, g, q)
+
+            def quo(f, g):
+                return gf_quo(f, g, q)
+
+            def diff(f):
+                return dense_strip([i*c % q for i, c in enumerate(f)][1:])
+
+            def convert(f):
+                return self._from_dense(list(map(domain.dtype, f)))
+        else:
+            f = f._to_dense()
+
+            def gcd(f, g):
+                return dense_gcd(f, g, domain)
+
+            def quo(f, g):
+                return dense_divmod(f, g, domain)[0]
+
+            def diff(f):
+                return dense_strip([c*i for i, c in enumerate(f)][1:])
+
+            convert = self._from_dense
+
+        while len(f) > 1:
+            df = diff(f)
 
-            if not df.is_zero:
-                g = self.gcd(f, df)
-                h, f, i = f // g, g, 1
+            if df:
+                g = gcd(f, df)
+                h, f, i = quo(f, g), g, 1
 
-                while not h.is_one:
-                    g = self.gcd(f, h)
-                    h //= g
+                while len(h) > 1:
+                    g = gcd(f, h)
+                    h = quo(h, g)
 
-                    if not h.is_ground:
-                        factors.append((h, i*n))
+                    if len(h) > 1:
+                        factors.append((convert(h), i*n))
 
-                    f //= g
+                    f = quo(f, g)
                     h = g
                     i += 1
 
             n *= p
 
-            g = self.zero
-            for i in range(f.degree()//p + 1):
-                k = (i*p,)
-                if k in f:
-                    g[(i,)] = f[k]**m
-            f = g
+            f = [c**m for c in f[::p]]
 
         return factors
 
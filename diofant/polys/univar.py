@@ -1,8 +1,11 @@
 import random
 
 from ..domains import ZZ
+from .densearith import dense_composer, dense_divmod, dense_mul, dense_shift
+from .galoistools import gf_composer, gf_modulus
+from .monomials import Monomial
 from .polyconfig import query
-from .polyerrors import CoercionFailed, DomainError
+from .polyerrors import CoercionFailed, DomainError, ExactQuotientFailed
 from .rings import PolyElement, PolynomialRing
 from .rootisolation import _FindRoot
 
@@ -21,6 +24,43 @@ def __call__(self, element):
     def from_list(self, element):
         return self.from_dict({(i,): c for i, c in enumerate(element)})
 
+    def _from_dense(self, coeffs):
+        """Create polynomial from dense list of ground domain elements."""
+        return self.dtype({Monomial((i,)): c
+                           for i, c in enumerate(coeffs) if c})
+
+    def _composer(self, h, f):
+        """Return a function, that computes ``g(h)`` modulo ``f``.
+
+        Over prime fields of word-size order uses
+        :func:`~diofant.polys.galoistools.gf_composer`, else
+        :func:`~diofant.polys.densearith.dense_composer`.
+
+        Examples
+        ========
+
+        >>> R, x = ring('x', FF(3))
+        >>> compose = R._composer(x + 1, x**2 + 1)
+        >>> compose(x**2)
+        2*x mod 3
+
+        """
+        domain = self.domain
+        p = gf_modulus(domain)
+
+        if p is not None:
+            h, f = ([int(c) for c in _._to_dense()] for _ in (h, f))
+            compose = gf_composer(h, f, p)
+
+            def wrapper(g):
+                g = compose([int(c) for c in g._to_dense()])
+                return self._from_dense(list(map(domain.dtype, g)))
+
+            return wrapper
+
+        compose = dense_composer(h._to_dense(), f._to_dense(), domain)
+        return lambda g: self._from_dense(compose(g._to_dense()))
+
     def _random(self, n, a, b, percent=None):
         domain = self.domain
 
@@ -173,8 +213,37 @@ def all_coeffs(self):
         else:
             return [self.coeff((i,)) for i in range(self.degree() + 1)]
 
+    def _to_dense(self):
+        """Return dense list of coefficients in ascending order."""
+        if not self:
+            return []
+        coeffs = [self.ring.domain.zero]*(self.degree() + 1)
+        for (i,), c in self.items():
+            coeffs[i] = c
+        return coeffs
+
+    def _is_dense(self):
+        """Test if dense representation is preferable for self."""
+        return 4*len(self) > self.degree()
+
     def shift(self, a):
-        return self.compose(0, self.ring.gens[0] + a)
+        ring = self.ring
+        domain = ring.domain
+        return ring._from_dense(dense_shift(self._to_dense(),
+                                            domain.convert(a), domain))
+
+    def compose_mod(self, g, f):
+        """Compute ``self(g)`` modulo ``f`` over a field.
+
+        Examples
+        ========
+
+        >>> R, x = ring('x', QQ)
+        >>> (x**2).compose_mod(x + 1, x**2 + 1)
+        2*x
+
+        """
+        return self.ring._composer(g, f)(self)
 
     def half_gcdex(self, other):
         """
@@ -350,7 +419,7 @@ def sturm(self):
         [x**3 - 2*x**2 + x - 3, 3*x**2 - 4*x + 1, 2/9*x + 25/9, -2079/4]
 
         """
-        return self.ring._sturm(self)
+        return list(self.ring._sturm(self))
 
     def __mul__(self, other):
         ring = self.ring
@@ -373,25 +442,23 @@ def _mul_karatsuba(self, other):
 
         """
         ring = self.ring
-        domain = ring.domain
+        return ring._from_dense(dense_mul(self._to_dense(), other._to_dense(),
+                                          ring.domain))
 
-        df = self.degree()
-        dg = other.degree()
-
-        n = max(df, dg) + 1
-
-        n2 = n//2
-
-        fl = self.slice(0, n2)
-        gl = other.slice(0, n2)
-
-        fh = self.slice(n2, n).quo_term(((n2,), domain.one))
-        gh = other.slice(n2, n).quo_term(((n2,), domain.one))
-
-        lo = fl*gl
-        hi = fh*gh
-
-        mid = (fl + fh)*(gl + gh)
-        mid -= (lo + hi)
+    def __divmod__(self, other):
+        ring = self.ring
+        if (isinstance(other, ring.dtype) and other and ring.domain.is_Exact and
+                self._is_dense()):
+            q, r = dense_divmod(self._to_dense(), other._to_dense(), ring.domain)
+            return ring._from_dense(q), ring._from_dense(r)
+        return super().__divmod__(other)
 
-        return lo + mid.mul_monom((n2,)) + hi.mul_monom((2*n2,))
+    def exquo(self, other):
+        ring = self.ring
+        if (isinstance(other, ring.dtype) and other and ring.domain.is_Exact and
+                self._is_dense()):
+            q, r = divmod(self, other)
+            if r:
+                raise ExactQuotientFailed(self, other)
+            return q
+        return super().exquo(other)
@@ -3,14 +3,19 @@
 """
 
 import collections
+import gc
 
 import pytest
 
-from diofant import (Atom, Basic, Function, I, Integral, Lambda, cos,
-                     default_sort_key, exp, gamma, preorder_traversal, sin)
+from diofant import (Add, Atom, Basic, Function, I, Integral, Lambda, Mul,
+                     Pow, atan2, cos, default_sort_key, exp, gamma,
+                     preorder_traversal, sin, sqrt)
 from diofant.abc import w, x, y, z
+from diofant.core import cache
+from diofant.core.cache import set_interning
 from diofant.core.singleton import S
 from diofant.core.singleton import SingletonWithManagedProperties as Singleton
+from diofant.diffgeom import CoordSystem, Manifold, Patch
 
 
 __all__ = ()
@@ -211,3 +216,39 @@ def test_literal_evalf_is_number_is_zero_is_comparable():
     n = sin(1)**2 + cos(1)**2 - 1
     assert n.is_comparable is not True
     assert n.evalf(2, strict=False).is_comparable is not True
+
+
+def test_interning():
+    try:
+        set_interning(True)
+        assert Basic(b1, b2) is Basic(b1, b2)
+        assert Basic(b1, b2) is not Basic(b2, b1)
+        assert Basic([]) is not Basic([])  # unhashable args
+        e1, e2 = Add(x, 1, evaluate=False), Add(x, 1, evaluate=False)
+        assert e1 is e2
+        assert e1.is_positive is None
+        assert Add(x, 1.0, evaluate=False) is not e1
+
+        assert Mul(x, y, evaluate=False) is Mul(x, y, evaluate=False)
+        assert Pow(x, y, evaluate=False) is Pow(x, y, evaluate=False)
+
+        # classes, that don't opt in, aren't interned
+        m = Manifold('M', 2)
+        p = Patch('P', m)
+        assert Manifold('M', 2) is not m
+        assert m.patches == [p]
+        rect = CoordSystem('rect', p)
+        polar = CoordSystem('polar', p)
+        rect.connect_to(polar, [x, y], [sqrt(x**2 + y**2), atan2(y, x)])
+        assert CoordSystem('rect', p) is not rect
+        assert polar in rect.transforms
+
+        n = len(cache.INTERNED)
+        del e1, e2
+        gc.collect()
+        assert len(cache.INTERNED) < n
+    finally:
+        set_interning(False)
+
+    assert cache.INTERNED is None
+    assert Basic(b1, b2) is not Basic(b1, b2)
@@ -1,12 +1,15 @@
 import gc
+import json
 import sys
+import threading
 import weakref
 
 import pytest
 
 from diofant import cacheit, ordered, sstr, symbols
 from diofant.abc import x
-from diofant.core.cache import clear_cache, print_cache
+from diofant.core.cache import (cache_stats, clear_cache, print_cache,
+                                set_cache_size)
 
 
 __all__ = ()
@@ -32,6 +35,127 @@ def test_cacheit():
     assert _identity(1) == 1
 
 
+def test_cache_resize():
+    @cacheit
+    def f(x):
+        return x
+
+    f.cache_resize(2)
+    for i in range(4):
+        f(i)
+    assert f.cache_info() == (0, 4, 2, 2)
+    f(3)
+    assert f.cache_info().hits == 1
+    f.cache_resize(None)
+    assert f.cache_info() == (0, 0, None, 0)
+
+    pytest.raises(ValueError, lambda: f.cache_resize(-1))
+
+
+def test_set_cache_size():
+    @cacheit
+    def f(x):
+        return x
+
+    @cacheit
+    def g(x):
+        return x
+
+    try:
+        set_cache_size(3)
+        f(1)
+        g(1)
+        f(2)
+        f(1)
+        assert f.cache_info() == (1, 2, None, 2)
+        g(2)
+        g(3)
+        assert f.cache_info().currsize + g.cache_info().currsize == 3
+        f(1)
+        assert f.cache_info().hits == 2
+        f(2)
+        assert f.cache_info().misses == 3
+
+        f.cache_resize(1)
+        f(1)
+        f(2)
+        assert f.cache_info() == (0, 2, 1, 1)
+
+        _identity([])  # unhashable
+        assert _identity.cache_info().misses == 0
+
+        clear_cache()
+        assert f.cache_info().currsize == g.cache_info().currsize == 0
+        set_cache_size(0)
+        f(1)
+        assert f.cache_info().currsize == 0
+        assert ((x + 1)*x).expand() == x**2 + x
+    finally:
+        set_cache_size(None)
+
+    assert f.cache_info() == (0, 0, 1, 0)
+    pytest.raises(ValueError, lambda: set_cache_size(-1))
+
+
+def test_cache_stats():
+    @cacheit
+    def f(x, evaluate=True):
+        return x
+
+    f(1)
+    f(1)
+    f(1, evaluate=False)
+    f([])
+    stats = f.cache_stats()
+    assert stats['hits'] == stats['misses'] == 1
+    assert stats['currsize'] == 1
+    assert stats['maxsize'] is None
+    assert stats['unhashable'] == stats['bypassed'] == 1
+    assert stats['time'] >= 0
+    assert stats['time_saved'] == stats['time']
+    assert stats['bytes'] > 0
+
+    f.cache_clear()
+    assert f.cache_stats() == {'hits': 0, 'misses': 0, 'maxsize': None,
+                               'currsize': 0, 'unhashable': 0,
+                               'bypassed': 0, 'time': 0, 'bytes': 0,
+                               'time_saved': 0}
+
+    f(2)
+    f(2)
+    key = f'{f.__module__}.{f.__qualname__}'
+    stats = cache_stats()
+    assert stats[key] == f.cache_stats()
+    assert json.loads(json.dumps(stats)) == stats
+    saved = [s['time_saved'] for s in stats.values()]
+    assert saved == sorted(saved, reverse=True)
+
+    @cacheit
+    def g(x):
+        raise TypeError
+
+    pytest.raises(TypeError, lambda: g(1))
+    assert g.cache_stats()['unhashable'] == 0
+
+    @cacheit
+    def h(x):
+        return x
+
+    def run():
+        for i in range(1000):
+            h(i % 10)
+            h([])
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = h.cache_stats()
+    assert stats['unhashable'] == 4000
+    assert stats['hits'] + stats['misses'] == 4000
+
+
 def test_print_cache(capfd):
     clear_cache()
     _identity(x)
@@ -11,9 +11,9 @@
 import pytest
 
 import diofant
-from diofant import (Float, Integer, Matrix, MatrixSymbol, Rational, Symbol,
-                     lambdify, list2numpy, matrix2numpy, sin, symarray,
-                     symbols, sympify)
+from diofant import (Float, I, Integer, Matrix, MatrixSymbol, Rational, Symbol,
+                     cos, exp, lambdify, lambdify_matrix, list2numpy,
+                     matrix2numpy, sin, symarray, symbols, sympify)
 from diofant.abc import x, y, z
 from diofant.matrices.expressions.matexpr import MatrixElement
 from diofant.utilities.decorator import conserve_mpmath_dps
@@ -247,6 +247,25 @@ def test_lambdify_transl():
         assert mat in dir(numpy)
 
 
+def test_lambdify_matrix():
+    M = Matrix([[sin(x)**2 + cos(x), x*y, 0], [exp(sin(x)), 3, y/2]])
+    f = lambdify_matrix((x, y), M)
+
+    r = f(0.5, 2)
+    assert r.shape == (2, 3) and r.dtype == numpy.float64
+    assert numpy.allclose(r, matrix2numpy(M.subs({x: 0.5, y: 2}), float))
+
+    xs, ys = numpy.linspace(0, 1, 5), numpy.array([[1], [2]])
+    r = f(xs, ys)
+    assert r.shape == (2, 5, 2, 3)
+    for i, j in numpy.ndindex(2, 5):
+        assert numpy.allclose(r[i, j], f(xs[j], ys[i, 0]))
+
+    f = lambdify_matrix(x, Matrix([I*x, 1]), dtype=complex)
+    assert f(2).tolist() == [[2j], [1]]
+    assert lambdify_matrix([], Matrix([[1, 2]]))().tolist() == [[1, 2]]
+
+
 def test_symarray():
     """Test creation of numpy arrays of diofant symbols."""
     syms = symbols('_0,_1,_2')
@@ -0,0 +1,237 @@
+"""Tests for dense matrices over domains."""
+
+import random
+
+import pytest
+
+from diofant import (FF, QQ, ZZ, Matrix, NonSquareMatrixError, PurePoly,
+                     Rational, ShapeError, symbols)
+from diofant.matrices.domainmatrix import DomainMatrix, _primes
+from diofant.polys.polyconfig import using
+
+
+__all__ = ()
+
+x, y = symbols('x y')
+
+
+def test_DomainMatrix():
+    A = DomainMatrix([[ZZ(1), ZZ(2)], [ZZ(3), ZZ(4)]], (2, 2), ZZ)
+
+    assert A.shape == (2, 2)
+    assert A[1, 0] == 3
+    assert A.is_square
+    assert repr(A) == 'DomainMatrix([[1, 2], [3, 4]], (2, 2), ZZ)'
+    assert DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]])) == A
+    assert A.to_Matrix() == Matrix([[1, 2], [3, 4]])
+    assert A != A.to_Matrix()
+    assert A.T == DomainMatrix.from_Matrix(Matrix([[1, 3], [2, 4]]))
+    assert A.to_field().domain == QQ
+
+    assert A + A == A*2 == 2*A
+    assert A - A == -A + A == DomainMatrix.zeros((2, 2), ZZ)
+    assert A*DomainMatrix.eye(2, ZZ) == A**1 == A
+    assert A**0 == DomainMatrix.eye(2, ZZ)
+    assert A**3 == A*A*A
+    assert A**-1 == A.inv()
+    assert (A*A.to_field()).domain == QQ
+
+    B = DomainMatrix.from_Matrix(Matrix([[1, x]]))
+
+    assert B.domain == ZZ.inject(x)
+    assert B.hstack(B).shape == (1, 4)
+
+    pytest.raises(ShapeError, lambda: DomainMatrix([[ZZ(1)]], (1, 2), ZZ))
+    pytest.raises(ShapeError, lambda: A + B)
+    pytest.raises(ShapeError, lambda: A*B)
+    pytest.raises(ShapeError, lambda: A.hstack(B))
+    pytest.raises(NonSquareMatrixError, lambda: B**2)
+    pytest.raises(NonSquareMatrixError, lambda: B.det())
+    pytest.raises(NonSquareMatrixError, lambda: B.charpoly())
+    pytest.raises(NonSquareMatrixError, lambda: B.inv())
+
+
+@pytest.mark.parametrize('domain', [ZZ, QQ, ZZ.inject(x), FF(7)])
+def test_DomainMatrix_det_charpoly(domain):
+    M = Matrix([[1, 3, 0, 2], [2, 0, 1, 1], [0, 2, 4, 1], [5, 0, 1, 3]])
+    A = DomainMatrix.from_Matrix(M, domain)
+
+    assert A.det() == domain.convert(M.berkowitz_det())
+    assert A.charpoly() == list(map(domain.convert, M.berkowitz()[-1]))
+    assert A.rank() == 4
+    assert A*A.inv() == DomainMatrix.eye(4, domain.field)
+
+    B = DomainMatrix.from_Matrix(Matrix([[1, 2], [2, 4]]), domain)
+
+    assert B.det() == 0
+    assert B.rank() == 1
+    pytest.raises(ValueError, lambda: B.inv())
+
+    assert DomainMatrix([], (0, 0), domain).det() == 1
+    assert DomainMatrix([], (0, 0), domain).charpoly() == [1]
+
+
+def test_DomainMatrix_det_symbolic():
+    A = DomainMatrix.from_Matrix(Matrix([[x, 1, y], [1, x, 1], [y, 0, x]]))
+
+    assert A.domain.to_expr(A.det()) == \
+        Matrix([[x, 1, y], [1, x, 1], [y, 0, x]]).berkowitz_det().expand()
+    A = DomainMatrix.from_Matrix(Matrix([[0, x], [x, 0]]))
+
+    assert A.det() == A.domain.convert(-x**2)
+
+
+def test_DomainMatrix_rref_nullspace_solve():
+    M = Matrix([[1, 2, 3, 4], [2, 4, 7, 1], [3, 6, 10, 5]])
+    A = DomainMatrix.from_Matrix(M)
+    R, pivots = A.rref()
+
+    assert R.to_Matrix() == M.rref(iszerofunc=lambda e: e.is_zero)[0]
+    assert pivots == [0, 2]
+    assert A.rank() == 2
+
+    N = A.nullspace()
+
+    assert N.shape == (2, 4)
+    assert A*N.T == DomainMatrix.zeros((3, 2), QQ)
+
+    A = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    b = DomainMatrix.from_Matrix(Matrix([[5, 1], [6, 0]]))
+
+    assert A*A.solve(b) == b.to_field()
+
+    C = DomainMatrix.from_Matrix(M)
+
+    pytest.raises(ValueError,
+                  lambda: C.solve(DomainMatrix.from_Matrix(Matrix([1, 2, 4]))))
+    pytest.raises(ValueError,
+                  lambda: C.solve(DomainMatrix.from_Matrix(Matrix([1, 2, 3]))))
+    pytest.raises(ShapeError, lambda: A.solve(C))
+
+    A = DomainMatrix.from_Matrix(Matrix([[x, 1], [0, x]]))
+
+    assert A.rref() == (DomainMatrix.eye(2, A.domain.field), [0, 1])
+    assert A.rank() == 2
+
+
+def test_DomainMatrix_random():
+    random.seed(0)
+    for n in [1, 2, 5, 12]:
+        M = Matrix(n, n, lambda i, j: Rational(random.randint(-9, 9),
+                                               random.randint(1, 4)))
+        A = DomainMatrix.from_Matrix(M)
+
+        assert A.domain == QQ
+        assert A.det() == QQ.convert(M.det_LU_decomposition())
+        assert A.charpoly() == list(map(QQ.convert, M.berkowitz()[-1]))
+        if A.det():
+            assert A.inv()*A == DomainMatrix.eye(n, QQ)
+
+
+def test_Matrix_fast_path():
+    M = Matrix([[1, Rational(1, 2), 3], [2, 0, 1], [Rational(-3, 4), 5, 1]])
+
+    assert M.det() == M.det_LU_decomposition() == Rational(189, 8)
+    assert M.inv()*M == Matrix.eye(3)
+    assert M.charpoly(x) == PurePoly(x**3 - 2*x**2 - Rational(11, 4)*x -
+                                     Rational(189, 8), x)
+    assert M.rref() == (Matrix.eye(3), [0, 1, 2])
+    assert Matrix([[1, 2], [2, 4]]).rref() == (Matrix([[1, 2], [0, 0]]), [0])
+
+
+def test_DomainMatrix_modular():
+    random.seed(1)
+    for n in [1, 2, 7, 15]:
+        for singular in [False, True]:
+            M = Matrix(n, n, lambda i, j: random.randint(-30, 30))
+            if singular:
+                M[n - 1, :] = 2*M[0, :]
+            b = Matrix(n, 2, lambda i, j: Rational(random.randint(-9, 9),
+                                                   random.randint(1, 5)))
+            A, B = DomainMatrix.from_Matrix(M), DomainMatrix.from_Matrix(b)
+
+            det, rank = A.det(), A.rank()
+            if det:
+                x = A.solve(B)
+
+            with using(modular_det_cutoff=1, modular_linalg_cutoff=1):
+                assert A.det() == det
+                assert A.rank() == rank == (n if det else n - 1)
+                assert (A.to_field()*QQ(1, 3)).det() == det*QQ(1, 3)**n
+                if det:
+                    assert A.solve(B) == x
+                    assert A.to_field().solve(B) == x
+                    assert M.LUsolve(b) == x.to_Matrix()
+                else:
+                    pytest.raises(ValueError, lambda: A.solve(B))
+
+    # the first prime divides the determinant
+    p = next(_primes())
+    A = DomainMatrix([[ZZ(p), ZZ(1)], [ZZ(0), ZZ(1)]], (2, 2), ZZ)
+
+    with using(modular_det_cutoff=1):
+        for _ in range(5):
+            assert A.det() == p
+
+    A = DomainMatrix.from_Matrix(Matrix([[1, 2, 3], [2, 4, 6]]))
+
+    with using(modular_linalg_cutoff=1):
+        assert A.rank() == 1
+        assert A.T.rank() == 1
+        assert DomainMatrix.zeros((2, 3), ZZ).rank() == 0
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_DomainMatrix_mul(workers):
+    random.seed(3)
+    for m, k, n in [(1, 1, 1), (5, 4, 3), (9, 12, 7), (0, 3, 2), (2, 0, 3)]:
+        for domain in [ZZ, QQ, ZZ.inject(x)]:
+            A = Matrix(m, k, lambda i, j: random.randint(-9, 9) + x*(i - j))
+            B = Matrix(k, n, lambda i, j: random.randint(-9, 9))
+            if domain.is_Field:
+                A, B = A.subs({x: Rational(1, 2)}), B/3
+            elif domain == ZZ:
+                A = A.subs({x: 2})
+            C = DomainMatrix.from_Matrix(A*B, domain)
+            A, B = (DomainMatrix.from_Matrix(_, domain) for _ in (A, B))
+
+            for cutoff in [0, 1, 2]:
+                with using(strassen_cutoff=cutoff, matrix_workers=workers):
+                    assert A*B == C
+
+    # Strassen's algorithm is used for integers, wider than a word
+    A = DomainMatrix([[ZZ(2**70 + i - j) for j in range(5)]
+                      for i in range(6)], (6, 5), ZZ)
+    B = DomainMatrix([[ZZ(i*j - 2**65) for j in range(7)]
+                      for i in range(5)], (5, 7), ZZ)
+    with using(strassen_cutoff=10**9):
+        C = A*B
+    with using(strassen_cutoff=2, matrix_workers=workers):
+        assert A*B == C
+
+    A = Matrix(9, 9, lambda i, j: Rational(i - j, i + j + 1))
+
+    with using(matrix_mul_domain_cutoff=100):
+        B = A*A
+
+    with using(matrix_mul_domain_cutoff=1):
+        assert A*A == B
+        assert A**3 == A*B
+
+    A = Matrix(5, 5, lambda i, j: (x - i)**j + y*(i - j))
+    B = Matrix(5, 3, lambda i, j: x**i - j)
+
+    with using(matrix_mul_poly_cutoff=100):
+        C = A*B
+
+    with using(matrix_mul_poly_cutoff=1):
+        assert A*B == C.expand()
+
+    # not a polynomial
+    A[0, 0] = 1/x
+
+    with using(matrix_mul_poly_cutoff=100):
+        C = A*B
+
+    with using(matrix_mul_poly_cutoff=1):
+        assert A*B == C
@@ -0,0 +1,81 @@
+import mpmath
+import pytest
+
+from diofant import QQ, ImmutableMatrix, Matrix
+from diofant.matrices import bkz, lll
+from diofant.matrices.lll import _lll, integer_relation
+
+
+__all__ = ()
+
+
+def test_lll():
+    assert lll([]) == []
+    assert lll([[1, 2, 3]]) == [[1, 2, 3]]
+
+    B = [[1, 1, 1], [-1, 0, 2], [3, 5, 6]]
+
+    assert lll(B) == [[0, 1, 0], [1, 0, 1], [-1, 0, 2]]
+    assert lll(ImmutableMatrix(B)) == ImmutableMatrix([[0, 1, 0], [1, 0, 1],
+                                                       [-1, 0, 2]])
+
+    B = [[1, 0, 0, 0, 0, 0, 319684],
+         [0, 1, 0, 0, 0, 0, 212050],
+         [0, 0, 1, 0, 0, 0, 1291],
+         [0, 0, 0, 1, 0, 0, 15208],
+         [0, 0, 0, 0, 1, 0, 119221],
+         [0, 0, 0, 0, 0, 1, 3]]
+    R, d, _ = _lll(B, delta=QQ(99, 100))
+
+    assert (Matrix(B)*Matrix(B).T).det() == d[-1]
+    assert (Matrix(R)*Matrix(R).T).det() == d[-1]
+    assert max(sum(c**2 for c in v) for v in R) < 10**3
+
+    for k in range(1, len(R)):
+        assert 100*d[k + 1]*d[k - 1] >= 99*d[k]**2 - 100*d[k]**2
+
+    # exact pass only
+    B = [[2**600, 0], [2**600 + 1, 1]]
+
+    assert lll(B) == [[1, 1], [2**599, -2**599]]
+
+    pytest.raises(ValueError, lambda: lll([[1, 2], [2, 4]]))
+    pytest.raises(ValueError, lambda: lll([[0, 0], [1, 2]]))
+
+
+def test_bkz():
+    B = [[-2, 1, 0, 0, 1], [-2, 0, 1, 0, 0],
+         [0, 1, 1, 1, 1], [1, 1, 1, 0, 1], [3, 1, 1, 1, -2]]
+
+    assert bkz(B, block_size=2) == lll(B, delta=QQ(99, 100))
+
+    R = bkz(B, block_size=5)
+
+    assert (Matrix(B)*Matrix(B).T).det() == (Matrix(R)*Matrix(R).T).det()
+    assert min(sum(c**2 for c in v) for v in R) == 2
+
+    B = Matrix([[1, 0, 0, 0, 0, 0, 319684],
+                [0, 1, 0, 0, 0, 0, 212050],
+                [0, 0, 1, 0, 0, 0, 1291],
+                [0, 0, 0, 1, 0, 0, 15208],
+                [0, 0, 0, 0, 1, 0, 119221],
+                [0, 0, 0, 0, 0, 1, 3]])
+    R = bkz(B, block_size=6)
+
+    assert isinstance(R, Matrix)
+    assert (B*B.T).det() == (R*R.T).det()
+    assert sum(c**2 for c in R[0, :]) <= sum(c**2 for c in lll(B)[0, :])
+
+
+def test_integer_relation():
+    with mpmath.workdps(50):
+        phi = (1 + mpmath.sqrt(5))/2
+
+        assert integer_relation([1, phi, phi**2]) == [1, 1, -1]
+        assert integer_relation([mpmath.pi, mpmath.e, 1]) is None
+
+        a = mpmath.sqrt(2) + mpmath.sqrt(3)
+
+        assert integer_relation([a**i for i in range(5)]) == [1, 0, -10, 0, 1]
+        assert integer_relation([a**i for i in range(5)], maxcoeff=9) is None
+        assert integer_relation([1, mpmath.sqrt(2)], tol=1e-100) is None
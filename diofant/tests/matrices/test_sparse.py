@@ -1,8 +1,8 @@
 import pytest
 
-from diofant import (I, Matrix, MutableDenseMatrix, MutableSparseMatrix,
-                     PurePoly, Rational, ShapeError, SparseMatrix, eye, ones,
-                     zeros)
+from diofant import (I, ImmutableSparseMatrix, Matrix, MutableDenseMatrix,
+                     MutableSparseMatrix, PurePoly, Rational, ShapeError,
+                     SparseMatrix, eye, ones, zeros)
 from diofant.abc import x, y, z
 
 
@@ -617,6 +617,41 @@ def test_sparse_solve():
     pytest.raises(ValueError, lambda: SparseMatrix([[1, 0], [0, 0],
                                                     [2, 1]]).solve([1, 1, 1]))
 
+    A = SparseMatrix([[0, 2, 0, 0], [1, 0, 0, x], [0, 0, 3, 0], [0, 1, 0, 1]])
+    b = Matrix([1, 2, 3, y])
+    s = A.solve(b, 'LU')
+    assert (A*s - b).expand() == zeros(4, 1)
+    assert (A.inv(method='LU')*A).applyfunc(lambda e: e.cancel()) == eye(4)
+    assert A.subs({x: 0}).solve(b, 'LU') == Matrix([2, Rational(1, 2),
+                                                    1, y - Rational(1, 2)])
+
+    pytest.raises(ValueError, lambda: SparseMatrix([[1, 1],
+                                                    [1, 1]]).solve(Matrix([1, 2]),
+                                                                   'LU'))
+    pytest.raises(ShapeError, lambda: SparseMatrix([[1, 1],
+                                                    [0, 1]]).solve(Matrix([1, 2, 3]),
+                                                                   'LU'))
+    pytest.raises(NotImplementedError, lambda: A.inv(method='spam'))
+
+
+def test_compressed():
+    A = SparseMatrix([[1, 0, 2], [0, 0, 0], [0, x, 0], [4, 0, 0]])
+
+    assert A._csr() == ([0, 2, 2, 3, 4], [0, 2, 1, 0], [1, 2, x, 4])
+    assert A._csc() == ([0, 2, 3, 4], [0, 3, 2, 0], [1, 4, x, 2])
+    assert A.T._csr() == A._csc()
+    assert SparseMatrix(0, 2, {})._csr() == ([0], [], [])
+
+    A[1, 1] = y
+    assert A._csr() == ([0, 2, 3, 4, 5], [0, 2, 1, 1, 0], [1, 2, y, x, 4])
+    assert A.RL == [(0, 0, 1), (0, 2, 2), (1, 1, y), (2, 1, x), (3, 0, 4)]
+    assert A.CL == [(0, 0, 1), (3, 0, 4), (1, 1, y), (2, 1, x), (0, 2, 2)]
+
+    B = ImmutableSparseMatrix(A)
+    assert B._csr() is B._csr()
+    assert B._csc() == A._csc()
+    assert (B*B.T).as_mutable() == A*A.T == Matrix(A)*Matrix(A).T
+
 
 def test_hermitian():
     a = SparseMatrix([[0, I], [-I, 0]])
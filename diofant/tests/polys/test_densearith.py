@@ -0,0 +1,217 @@
+"""Tests for arithmetics of dense univariate polynomials."""
+
+import random
+
+import pytest
+
+from diofant import FF, QQ, ZZ, ring
+from diofant.polys.densearith import (_compose_horner, _divmod_classical,
+                                      _mul_classical, _shift_classical,
+                                      _use_kronecker,
+                                      dense_add, dense_compose,
+                                      dense_compose_mod, dense_composer,
+                                      dense_divmod, dense_gcd,
+                                      dense_interpolate, dense_inv_series,
+                                      dense_monic, dense_mul, dense_resultant,
+                                      dense_shift, dense_strip, dense_trunc,
+                                      kronecker_mul)
+from diofant.polys.polyconfig import using
+from diofant.polys.polyerrors import ExactQuotientFailed
+
+
+__all__ = ()
+
+
+def _random(n, domain):
+    return dense_strip([domain(random.randint(-5, 5)) for _ in range(n)] +
+                       [domain(random.randint(1, 5))])
+
+
+@pytest.mark.parametrize('domain', [ZZ, QQ, FF(7), FF(101)])
+def test_dense_mul_divmod(domain):
+    random.seed(1)
+    with using(karatsuba_cutoff=4, newton_division_cutoff=3):
+        for n, m in [(0, 0), (5, 3), (40, 30), (120, 7), (31, 64)]:
+            f, g = _random(n, domain), _random(m, domain)
+            h = dense_mul(f, g, domain)
+
+            assert h == dense_strip(_mul_classical(f, g, domain))
+            assert dense_divmod(h, g, domain) == (f, [])
+
+            if domain.is_Field:
+                h = dense_add(h, [domain.one])
+                q, r = dense_divmod(h, g, domain)
+
+                assert dense_add(dense_mul(q, g, domain), r) == h
+                assert len(r) < len(g)
+
+    assert dense_mul([], [ZZ(1)], ZZ) == []
+    assert dense_divmod([ZZ(1)], [ZZ(1), ZZ(2)], ZZ) == ([], [ZZ(1)])
+    assert dense_divmod([ZZ(1), ZZ(3), ZZ(4)], [ZZ(1), ZZ(2)],
+                        ZZ) == ([ZZ(0), ZZ(2)], [ZZ(1), ZZ(1)])
+
+    pytest.raises(ZeroDivisionError, lambda: dense_divmod([ZZ(1)], [], ZZ))
+
+
+@pytest.mark.parametrize('domain', [ZZ, QQ, FF(7), FF(101), FF(2**31 - 1)])
+def test_dense_shift(domain):
+    random.seed(1)
+    R, x = ring('x', domain)
+    for n in [0, 1, 5, 40, 100]:
+        f = _random(n, domain)
+        for a in [domain(0), domain(1), domain(-3)]:
+            g = R._from_dense(f).compose(x, x + a)
+            with using(taylor_shift_cutoff=4):
+                assert R._from_dense(dense_shift(f, a, domain)) == g
+
+    assert dense_shift([], ZZ(1), ZZ) == []
+
+    f = [QQ(1, 3), QQ(0), QQ(-5, 2), QQ(7, 4)]
+    for a in [QQ(1, 2), QQ(-2, 3), QQ(5)]:
+        assert dense_shift(f, a, QQ) == _shift_classical(f, a)
+
+
+@pytest.mark.parametrize('domain', [ZZ, QQ, FF(7), FF(101)])
+def test_dense_compose(domain):
+    random.seed(4)
+    R, x = ring('x', domain)
+    for n, m in [(0, 3), (5, 0), (5, 2), (40, 3), (100, 7)]:
+        f, g = _random(n, domain), _random(m, domain)
+        h = _compose_horner(f, g, domain)
+        with using(compose_cutoff=2):
+            assert dense_compose(f, g, domain) == h
+        assert R._from_dense(f).compose(x, R._from_dense(g)) == R._from_dense(h)
+
+    assert dense_compose([], [ZZ(1)], ZZ) == []
+
+
+@pytest.mark.parametrize('domain', [QQ, FF(7), FF(101)])
+def test_dense_composer(domain):
+    random.seed(5)
+    sizes = [(0, 3, 4), (5, 2, 1), (12, 5, 6)]
+    if domain.is_FiniteField:
+        sizes += [(40, 30, 20), (100, 7, 50)]
+    for n, m, k in sizes:
+        f, h, r = (_random(_, domain) for _ in (n, m, k))
+        compose = dense_composer(h, r, domain)
+        g = dense_divmod(dense_compose(f, h, domain), r, domain)[1]
+        assert compose(f) == g
+        assert dense_compose_mod(f, h, r, domain) == g
+
+    assert dense_composer([QQ(1)], [QQ(1), QQ(1)], QQ)([]) == []
+
+
+def test_kronecker_mul():
+    assert kronecker_mul([], [1, 2]) == kronecker_mul([1], []) == []
+    assert kronecker_mul([1], [1]) == [1]
+    assert kronecker_mul([0, 1, 0], [3]) == [0, 3, 0]
+    assert kronecker_mul([-1, 0, 2], [2**70, -1]) == [-2**70, 1,
+                                                      2**71, -2]
+
+    random.seed(3)
+    for n, m, b in [(5, 3, 10), (40, 30, 2**100), (120, 7, 1)]:
+        f = [random.randint(-b, b) for _ in range(n)]
+        g = [random.randint(-b, b) for _ in range(m)]
+
+        assert kronecker_mul(f, g) == _mul_classical(f, g, ZZ)
+
+    F = FF(7)
+    f, g = [F(3), F(5), F(6)], [F(4), F(1)]
+    for flag in (True, False):
+        with using(use_kronecker=flag, kronecker_cutoff=0):
+            assert dense_mul(f, g, F) == [F(5), F(2), F(1), F(6)]
+            assert dense_mul(f, [], F) == dense_mul([], g, F) == []
+
+    f = [ZZ(1)] + [ZZ(0)]*999 + [ZZ(1)]
+    g = [ZZ(c) for c in range(1, 21)]
+    with using(kronecker_cutoff=0):
+        assert not _use_kronecker(f, f)
+        assert _use_kronecker(g, g)
+    assert not _use_kronecker(g, g)
+    assert dense_mul(f, f, ZZ) == [ZZ(1)] + [ZZ(0)]*999 + [ZZ(2)] + [ZZ(0)]*999 + [ZZ(1)]
+
+
+def test_dense_inv_series():
+    f = [QQ(1), QQ(-1)]
+
+    assert dense_inv_series(f, 5, QQ) == [QQ(1)]*5
+    assert dense_trunc(dense_mul(f, dense_inv_series(f, 7, QQ), QQ),
+                       7) == [QQ(1)]
+
+
+@pytest.mark.parametrize('p', [7, 101])
+def test_dense_gcd(p):
+    domain = FF(p)
+    random.seed(2)
+
+    def euclid(f, g):
+        while g:
+            f, g = g, _divmod_classical(f, g, domain)[1]
+        return dense_monic(f, domain)
+
+    with using(karatsuba_cutoff=4, newton_division_cutoff=3,
+               half_gcd_cutoff=3):
+        for n, m in [(0, 0), (5, 3), (40, 30), (120, 7), (31, 64)]:
+            c = _random(7, domain)
+            f = dense_mul(_random(n, domain), c, domain)
+            g = dense_mul(_random(m, domain), c, domain)
+
+            assert dense_gcd(f, g, domain) == euclid(f, g)
+
+    assert dense_gcd([], [], domain) == []
+
+
+@pytest.mark.parametrize('domain', [QQ, FF(7), FF(101)])
+def test_dense_resultant(domain):
+    random.seed(6)
+    R, x = ring('x', domain)
+
+    with using(half_gcd_cutoff=3):
+        for n, m in [(0, 0), (3, 0), (0, 4), (5, 3), (3, 5), (4, 4), (40, 37)]:
+            f, g = _random(n, domain), _random(m, domain)
+            r = R._primitive_prs(R._from_dense(f), R._from_dense(g))[0]
+
+            assert dense_resultant(f, g, domain) == r
+
+            h = dense_mul(f, [domain(2), domain.one], domain)
+            g = dense_mul(g, [domain(2), domain.one], domain)
+
+            assert dense_resultant(h, g, domain) == 0
+
+    assert dense_resultant([], [domain.one], domain) == 0
+
+
+def test_dense_interpolate():
+    random.seed(7)
+    for domain in [QQ, FF(101)]:
+        R, x = ring('x', domain)
+        for n in [0, 1, 5, 30]:
+            f = _random(n, domain)
+            xs = [domain(3*i + 1) for i in range(n + 1)]
+            ys = [R._from_dense(f)(a) for a in xs]
+
+            assert dense_interpolate(xs, ys, domain) == f
+
+    assert dense_interpolate([], [], QQ) == []
+    assert dense_interpolate([QQ(1), QQ(2)], [QQ(0), QQ(0)], QQ) == []
+
+
+def test_univar_dense():
+    R, x = ring('x', FF(7))
+
+    f = (x + 1)**5*(x**3 + 2)
+    g = (x + 1)**2*(x**4 + 3)
+
+    with using(karatsuba_cutoff=2, newton_division_cutoff=1,
+               half_gcd_cutoff=2):
+        h = (x + 1)**2
+        assert R.cofactors(f, g) == (h, f // h, g // h)
+        assert f.exquo(x + 1) == (x + 1)**4*(x**3 + 2)
+        q, r = divmod(f, g)
+        assert q*g + r == f
+        assert r.degree() < g.degree()
+        assert f*g == R.from_list(dense_mul(f._to_dense(), g._to_dense(),
+                                            R.domain))
+        pytest.raises(ExactQuotientFailed, lambda: f.exquo(x + 2))
+        assert f.shift(3) == f.compose(x, x + 3)
+        assert f.compose_mod(x**2 + 3, g) == f.compose(x, x**2 + 3) % g
@@ -326,6 +326,41 @@ def test_PolyElement_subresultants():
             assert f.resultant(g) == r.drop(x)
 
 
+def test_PolyElement_resultant_modular():
+    R, x = ring('x', FF(7))
+
+    f = x**8 + x**6 + 4*x**4 + 4*x**3 + x**2 + 2*x + 2
+    g = 3*x**6 + 5*x**4 + 3*x**2 + 5*x + 3
+
+    for cutoff in (2, 200):
+        with using(half_gcd_cutoff=cutoff):
+            for check in (True, False):
+                with using(use_half_gcd_resultant=check):
+                    assert f.resultant(g) == g.resultant(f) == 2
+                    assert (f*(x + 1)).resultant(g*(x + 1)) == 0
+                    assert f.resultant(R(3)) == 3**8
+                    assert R._gf_resultant(f, g) == R._primitive_prs(f, g)[0]
+
+    R, x = ring('x', QQ)
+
+    f = x**3/2 + QQ(1, 3)
+    g = x/5 + 7
+
+    for check in (True, False):
+        with using(use_collins_resultant=check):
+            assert f.resultant(g) == QQ(128623, 750)
+
+    for p in (17, 2**31 - 1):
+        R, x, y, z = ring('x y z', FF(p))
+
+        f = 3*x**2*y - y**3 - 4*z
+        g = x**2 + x*y**3*z - 9
+
+        assert (R.drop(z)._modular_resultant(f.eval(z, 2), g.eval(z, 2)) ==
+                f.eval(z, 2).resultant(g.eval(z, 2)))
+        assert R._modular_resultant(f, g) == f.resultant(g)
+
+
 def test_PolyElement_discriminant():
     R, x = ring('x', ZZ)
 
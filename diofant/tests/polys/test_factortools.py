@@ -2,6 +2,7 @@
 
 import functools
 import operator
+import sys
 
 import pytest
 
@@ -168,6 +169,9 @@ def test_dup_zz_factor():
 
     assert f.factor_list() == (1, [(x + 1, 1), (x - 1, 2), (x**2 + x + 1, 1)])
 
+    with using(modular_workers=2):
+        assert f.factor_list() == (1, [(x + 1, 1), (x - 1, 2), (x**2 + x + 1, 1)])
+
     for test in (True, False):
         with using(use_irreducible_in_factor=test):
             assert (x**2 + 2*x + 2).factor_list() == (1, [(x**2 + 2*x + 2, 1)])
@@ -237,6 +241,37 @@ def test_dup_zz_factor():
                                            (x**8 - x**6 + x**4 - x**2 + 1, 1)])
 
 
+def test__zz_van_hoeij():
+    R, x = ring('x', ZZ)
+
+    f = x**16 - 136*x**14 + 6476*x**12 - 141912*x**10 + 1513334*x**8 - 7453176*x**6 + 13950764*x**4 - 5596840*x**2 + 46225
+
+    for method in ('zassenhaus', 'van_hoeij'):
+        with using(zz_factor_method=method, van_hoeij_cutoff=0):
+            assert f.factor_list() == (1, [(f, 1)])
+            assert (f*f.compose(x, x + 1)).factor_list() == (1, [(f, 1),
+                                                                 (f.compose(x, x + 1), 1)])
+
+            f1, f2, f3 = 3*x**8 - 2, 5*x**8 + 7*x**3 + 1, x**16 - x + 11
+
+            assert (f1*f2*f3).factor_list() == (1, [(f1, 1), (f2, 1), (f3, 1)])
+
+
+def test__zz_van_hoeij_fallback(monkeypatch):
+    R, x = ring('x', ZZ)
+
+    f1, f2 = x**8 - 2, x**8 + 3
+
+    # a single remaining vector, which isn't the vector of the whole
+    # polynomial, means violated bounds: fall back to the subset search
+    monkeypatch.setattr(sys.modules['diofant.matrices.lll'], '_lll',
+                        lambda basis: ([[1] + [0]*(len(basis[0]) - 1)],
+                                       [1, 1], None))
+
+    with using(zz_factor_method='van_hoeij', van_hoeij_cutoff=0):
+        assert (f1*f2).factor_list() == (1, [(f1, 1), (f2, 1)])
+
+
 def test__zz_wang():
     R, x, y, z = ring('x y z', ZZ)
     UV, _x = ring('x', ZZ)
@@ -0,0 +1,249 @@
+"""Tests for arithmetics of dense polynomials over prime finite fields."""
+
+import random
+
+import pytest
+
+from diofant import FF, Matrix, ring
+from diofant.polys.galoistools import (GFMatrix, gf_add, gf_berlekamp,
+                                       gf_berlekamp_massey, gf_compose_mod,
+                                       gf_composer, gf_ddf_shoup, gf_divmod,
+                                       gf_gcd, gf_interpolate, gf_inv_series,
+                                       gf_modulus, gf_mul, gf_powmod,
+                                       gf_Qmatrix, gf_reducer, gf_rem,
+                                       gf_resultant, gf_resultant_bivariate,
+                                       gf_trace_map, gf_wiedemann)
+from diofant.polys.polyconfig import using
+
+
+__all__ = ()
+
+
+def _random(n, p):
+    return [random.randrange(p) for _ in range(n)] + [random.randrange(1, p)]
+
+
+def test_gf_modulus():
+    assert gf_modulus(FF(7)) == 7
+    assert gf_modulus(FF(2**61 - 1)) == 2**61 - 1
+    assert gf_modulus(FF(2**64 + 13)) is None
+    assert gf_modulus(FF(9)) is None
+
+    with using(use_gf_kernel=False):
+        assert gf_modulus(FF(7)) is None
+
+
+@pytest.mark.parametrize('p', [2, 7, 32003, 2**61 - 1])
+def test_gf_mul_divmod(p):
+    random.seed(1)
+    for kronecker in (True, False):
+        with using(use_kronecker=kronecker, gf_newton_division_cutoff=4,
+                   gf_kronecker_cutoff=0):
+            for n, m in [(0, 0), (5, 3), (40, 30), (120, 7), (31, 64)]:
+                f, g = _random(n, p), _random(m, p)
+                h = gf_mul(f, g, p)
+
+                assert gf_divmod(h, g, p) == (f, [])
+                r = _random(m - 1, p) if m else []
+                h = gf_add(h, r, p)
+
+                assert gf_divmod(h, g, p) == (f, r)
+
+                if len(h) <= 2*len(g) - 1:
+                    assert gf_reducer(g, p)(h) == r
+
+    pytest.raises(ZeroDivisionError, lambda: gf_divmod([1], [], p))
+
+
+def test_gf_inv_series():
+    random.seed(2)
+    f = _random(10, 101)
+    g = gf_inv_series(f, 30, 101)
+
+    assert gf_mul(f, g, 101)[:30] == [1] + [0]*29
+
+
+@pytest.mark.parametrize('p', [3, 101])
+def test_gf_gcd_powmod_compose(p):
+    random.seed(3)
+    R, x = ring('x', FF(p))
+
+    with using(gf_newton_division_cutoff=4):
+        for n in [1, 5, 20]:
+            f, g, h = _random(n, p), _random(n + 3, p), _random(7, p)
+            F, G, H = [R._from_dense(list(map(R.domain.dtype, _)))
+                       for _ in (f, g, h)]
+
+            assert gf_gcd(gf_mul(f, h, p), gf_mul(g, h, p), p) == \
+                [int(c) for c in R.gcd(F*H, G*H)._to_dense()]
+            assert gf_resultant(f, g, p) == R._primitive_prs(F, G)[0]
+            assert gf_resultant(g, h, p) == R._primitive_prs(G, H)[0]
+            assert gf_resultant(gf_mul(f, h, p), gf_mul(g, h, p), p) == 0
+            assert gf_powmod(g, p**2 + 5, f, p) == \
+                [int(c) for c in pow(G, p**2 + 5, F)._to_dense()]
+            assert gf_compose_mod(h, g, f, p) == \
+                [int(c) for c in (H.compose(x, G) % F)._to_dense()]
+            assert gf_rem(gf_mul(g, h, p), f, p) == \
+                [int(c) for c in (G*H % F)._to_dense()]
+
+
+@pytest.mark.parametrize('p', [101, 2**31 - 1])
+def test_gf_interpolate_resultant_bivariate(p):
+    random.seed(4)
+    R, x, y = ring('x y', FF(p))
+
+    for n in [0, 3, 20]:
+        f = _random(n, p)
+        xs = random.sample(range(p), n + 1)
+
+        ys = [sum(c*a**i for i, c in enumerate(f)) % p for a in xs]
+
+        assert gf_interpolate(xs, ys, p) == f
+
+    for n, m, k in [(1, 1, 1), (3, 2, 4), (5, 4, 3)]:
+        f = [_random(k, p) for _ in range(n + 1)]
+        g = [_random(k, p) for _ in range(m + 1)]
+        F, G = [R.from_dict({(i, j): c for i, h in enumerate(_)
+                             for j, c in enumerate(h)}) for _ in (f, g)]
+
+        assert gf_resultant_bivariate(f, g, p) == \
+            [int(c) for c in R._primitive_prs(F, G)[0]._to_dense()]
+
+    assert gf_resultant_bivariate([], [[1]], p) == []
+
+
+def test_GFMatrix():
+    A = GFMatrix([[1, 2], [3, 1]], 5)
+
+    assert A.shape == (2, 2)
+    assert A.T == GFMatrix([[1, 3], [2, 1]], 5)
+    assert A != A.T
+    assert A*A == GFMatrix([[2, 4], [1, 2]], 5)
+    assert A - A == GFMatrix([[0, 0], [0, 0]], 5)
+    assert repr(A) == 'GFMatrix([[1, 2], [3, 1]], 5)'
+    assert GFMatrix.eye(2, 5)*A == A
+
+    assert A.det() == 0
+    assert A.rank() == 1
+    assert A.inv() is None
+    assert GFMatrix([[0, 1], [1, 1]], 5).det() == 4
+    assert GFMatrix([[0, 1], [1, 1]], 5).inv() == GFMatrix([[4, 1], [1, 0]], 5)
+
+    assert GFMatrix([[1, 2, 3], [0, 1, 1]], 5).nullspace() == [[4, 4, 1]]
+    assert GFMatrix([[0, 1], [0, 2]], 3).nullspace() == [[1, 0]]
+    assert GFMatrix([[1, 0], [0, 1]], 3).nullspace() == []
+    assert GFMatrix([], 3).nullspace() == []
+
+
+@pytest.mark.parametrize('p', [2, 7, 32003, 2**61 - 1])
+def test_GFMatrix_random(p):
+    random.seed(5)
+    for use_numpy in (True, False):
+        with using(gf_use_numpy=use_numpy):
+            for m, n in [(1, 1), (3, 5), (20, 20), (15, 10)]:
+                A = GFMatrix([[random.randrange(p) for _ in range(n)]
+                              for _ in range(m)], p)
+                B = GFMatrix([[random.randrange(p) for _ in range(m)]
+                              for _ in range(3)], p)
+                C = B*A
+
+                assert C.rows == [[sum(a*b for a, b in zip(row, col)) % p
+                                   for col in zip(*A.rows)] for row in B.rows]
+
+                R, pivots = C.rref()
+
+                assert len(pivots) == len(R.rows) <= 3
+                for i, j in enumerate(pivots):
+                    assert [row[j] for row in R.rows] == [int(i == k)
+                                                          for k in range(len(pivots))]
+
+                V = C.nullspace()
+
+                if m == n:
+                    assert A.det() == Matrix(A.rows).det() % p
+                    if A.det():
+                        assert A*A.inv() == GFMatrix.eye(n, p)
+
+                assert len(V) + len(pivots) == n
+                if V:
+                    assert C*GFMatrix(V, p).T == GFMatrix([[0]*len(V)]*3, p)
+
+
+def test_gf_berlekamp_massey():
+    assert gf_berlekamp_massey([], 7) == [1]
+    assert gf_berlekamp_massey([0, 0, 0], 7) == [1]
+    assert gf_berlekamp_massey([1, 2, 4, 1, 2, 4], 7) == [5, 1]
+    assert gf_berlekamp_massey([1, 1, 2, 3, 5, 1, 6, 0], 7) == [6, 6, 1]
+    assert gf_berlekamp_massey([0, 0, 1, 0], 2) == [1, 0, 0, 1]
+
+
+@pytest.mark.parametrize('p', [2, 7, 32003])
+def test_gf_wiedemann(p):
+    random.seed(2)
+    for n in [1, 5, 40]:
+        rows = [{i: 1} for i in range(n)]
+        for i, row in enumerate(rows):
+            for j in random.sample(range(n), min(n, 3)):
+                row[j] = random.randrange(p)
+            rows[i] = {j: c for j, c in row.items() if c}
+        A = GFMatrix([[row.get(j, 0) for j in range(n)] for row in rows], p)
+        b = [random.randrange(p) for _ in range(n)]
+        x = gf_wiedemann(rows, b, p, tries=10)
+        if A.det():
+            assert A*GFMatrix([[c] for c in x], p) == GFMatrix([[c] for c in b], p)
+        elif x is not None:
+            assert [sum(c*x[j] for j, c in row.items()) % p for row in rows] == b
+
+    assert gf_wiedemann([{0: 1}, {0: 2}], [1, 1], 7) is None
+
+
+def test_gf_Qmatrix_berlekamp():
+    assert gf_Qmatrix([4, 1], 5) == GFMatrix([[1]], 5)
+    assert gf_Qmatrix([1, 0, 0, 0, 1], 5).rows == [[1, 0, 0, 0], [0, 4, 0, 0],
+                                                   [0, 0, 1, 0], [0, 0, 0, 4]]
+
+    assert gf_berlekamp([1, 0, 0, 0, 1], 5) == [[2, 0, 1], [3, 0, 1]]
+    assert gf_berlekamp([1, 1, 1], 2) == [[1, 1, 1]]
+
+
+@pytest.mark.parametrize('p', [3, 101])
+def test_gf_composer_trace_map(p):
+    random.seed(6)
+    R, x = ring('x', FF(p))
+
+    def to_ring(f):
+        return R._from_dense(list(map(R.domain.dtype, f)))
+
+    for n in [1, 4, 17]:
+        f, h = _random(n, p), _random(n - 1, p)
+        F, H = to_ring(f), to_ring(h)
+        compose = gf_composer(h, f, p)
+
+        for m in [0, 1, n - 1, n + 3]:
+            g = _random(m, p)
+
+            assert to_ring(compose(g)) == to_ring(g).compose(x, H) % F
+
+        a, c = _random(n - 1, p), [0, 1]
+        b = gf_powmod(c, p, f, p)
+
+        assert [to_ring(_) for _ in gf_trace_map(a, b, c, 5, f, p)] == \
+            list(R._gf_trace_map(*map(to_ring, (a, b, c)), 5, F))
+        with using(use_gf_kernel=False):
+            assert [to_ring(_) for _ in gf_trace_map(a, b, c, 5, f, p)] == \
+                list(R._gf_trace_map(*map(to_ring, (a, b, c)), 5, F))
+
+
+@pytest.mark.parametrize('method', ['berlekamp', 'shoup'])
+def test_gf_factor_kernel(method):
+    random.seed(4)
+    R, x = ring('x', FF(7))
+    f = R._gf_random(30).sqf_part()
+
+    with using(gf_factor_method=method):
+        factors = R._gf_factor_sqf(f)
+        with using(use_gf_kernel=False):
+            assert R._gf_factor_sqf(f) == factors
+
+    assert gf_ddf_shoup([0, 2, 0, 1, 1, 2, 1], 3) == [([0, 1, 1], 1),
+                                                      ([2, 1, 0, 1, 1], 2)]
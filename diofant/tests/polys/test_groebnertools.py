@@ -2,22 +2,24 @@
 
 import pytest
 
-from diofant import QQ, ZZ, grlex, lex, ring
+from diofant import FF, QQ, ZZ, grevlex, grlex, ilex, lex, ring
 from diofant.polys import polyconfig as config
-from diofant.polys.groebnertools import (Num, Polyn, Sign,
-                                         _representing_matrices, cp_key,
-                                         critical_pair, f5_reduce, groebner,
-                                         groebner_gcd, groebner_lcm,
+from diofant.polys.groebnertools import (Num, Polyn, Sign, _is_groebner_basis,
+                                         _rational_reconstruction,
+                                         _representing_matrices, buchberger,
+                                         cp_key, critical_pair, f4, f4_modular,
+                                         f5_reduce, groebner, groebner_gcd,
+                                         groebner_lcm, groebner_walk,
                                          is_groebner, is_minimal,
                                          is_rewritable_or_comparable, lbp,
-                                         lbp_key, lbp_sub, s_poly, sig,
-                                         sig_key)
+                                         lbp_key, lbp_sub, matrix_fglm, s_poly,
+                                         sig, sig_key)
 
 
 __all__ = ()
 
 
-@pytest.mark.parametrize('method', ('buchberger', 'f5b'))
+@pytest.mark.parametrize('method', ('buchberger', 'f5b', 'f4'))
 def test_groebner(method):
     with config.using(groebner=method):
         R,  x, y = ring('x y', QQ, lex)
@@ -148,7 +150,7 @@ def test_groebner(method):
         assert not is_minimal(b, R)
 
 
-@pytest.mark.parametrize('method', ('buchberger', 'f5b'))
+@pytest.mark.parametrize('method', ('buchberger', 'f5b', 'f4'))
 def test_benchmark_minimal_polynomial(method):
     with config.using(groebner=method):
         R,  x, y, z = ring('x y z', QQ, lex)
@@ -196,7 +198,7 @@ def test_benchmark_coloring():
     assert groebner(I, R) == [1]
 
 
-@pytest.mark.parametrize('method', ('buchberger', 'f5b'))
+@pytest.mark.parametrize('method', ('buchberger', 'f5b', 'f4'))
 def test_benchmark_katsura_3(method):
     with config.using(groebner=method):
         R,  x0, x1, x2 = ring('x:3', ZZ, lex)
@@ -221,7 +223,7 @@ def test_benchmark_katsura_3(method):
         ]
 
 
-@pytest.mark.parametrize('method', ('buchberger', 'f5b'))
+@pytest.mark.parametrize('method', ('buchberger', 'f5b', 'f4'))
 def test_benchmark_katsura_4(method):
     with config.using(groebner=method):
         R,  x0, x1, x2, x3 = ring('x:4', ZZ, lex)
@@ -254,7 +256,7 @@ def test_benchmark_katsura_4(method):
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize('method', ('buchberger', 'f5b'))
+@pytest.mark.parametrize('method', ('buchberger', 'f5b', 'f4'))
 def test_benchmark_czichowski(method):
     # This is very slow (> 2 minutes on 3.4 GHz) without GMPY
 
@@ -327,7 +329,7 @@ def test_benchmark_czichowski(method):
         ]
 
 
-@pytest.mark.parametrize('method', ('buchberger', 'f5b'))
+@pytest.mark.parametrize('method', ('buchberger', 'f5b', 'f4'))
 def test_benchmark_cyclic_4(method):
     with config.using(groebner=method):
         R,  a, b, c, d = ring('a b c d', ZZ, lex)
@@ -359,6 +361,39 @@ def test_benchmark_cyclic_4(method):
         ]
 
 
+@pytest.mark.parametrize('domain', (QQ, FF(7), FF(32003)))
+@pytest.mark.parametrize('order', (lex, grlex, grevlex))
+def test_f4(domain, order):
+    R,  x, y, z, t = ring('x y z t', domain, order)
+
+    I = [x + y + z + t, x*y + y*z + z*t + t*x,
+         x*y*z + y*z*t + z*t*x + t*x*y, x*y*z*t - 1]
+
+    assert f4(I, R) == buchberger(I, R)
+    assert f4([], R) == f4([R.zero], R) == []
+    assert f4([x*y - 1, y - 1, R(2)], R) == [1]
+
+
+def test_f4_modular():
+    R, x, y, z = ring('x y z', QQ, lex)
+
+    F = [x**3 + x + 1, y**2 + y + 1, (x + y)*z - (x**2 + y)]
+    G = f4_modular(F, R)
+
+    assert G == buchberger(F, R)
+    assert _is_groebner_basis(G, F, R)
+    assert not _is_groebner_basis(G[1:], F, R)
+    assert not _is_groebner_basis(F, F, R)
+    assert f4_modular([], R) == []
+
+    F = [x**2 - QQ(10**20 + 1, 3), y**2 - QQ(3, 10**20 + 7)*x]
+
+    assert f4_modular(F, R) == buchberger(F, R)
+
+    assert _rational_reconstruction(29*5 % 101, 101, QQ) == QQ(5, 7)
+    assert _rational_reconstruction(10, 101, QQ) is None
+
+
 def test_sig_key():
     s1 = sig((0,) * 3, 2)
     s2 = sig((1,) * 3, 4)
@@ -472,14 +507,46 @@ def test_representing_matrices():
     F = [x**2 - x - 3*y + 1, -2*x + y**2 + y - 1]
 
     assert _representing_matrices(basis, F, R) == [
-        [[QQ(0, 1),  QQ(0, 1), -QQ(1, 1),  QQ(3, 1)],
-         [QQ(0, 1),  QQ(0, 1),  QQ(3, 1), -QQ(4, 1)],
-         [QQ(1, 1),  QQ(0, 1),  QQ(1, 1),  QQ(6, 1)],
-         [QQ(0, 1),  QQ(1, 1),  QQ(0, 1),  QQ(1, 1)]],
-        [[QQ(0, 1),  QQ(1, 1),  QQ(0, 1), -QQ(2, 1)],
-         [QQ(1, 1), -QQ(1, 1),  QQ(0, 1),  QQ(6, 1)],
-         [QQ(0, 1),  QQ(2, 1),  QQ(0, 1),  QQ(3, 1)],
-         [QQ(0, 1),  QQ(0, 1),  QQ(1, 1), -QQ(1, 1)]]]
+        [{2: QQ(1)}, {3: QQ(1)}, {0: -QQ(1), 1: QQ(3), 2: QQ(1)},
+         {0: QQ(3), 1: -QQ(4), 2: QQ(6), 3: QQ(1)}],
+        [{1: QQ(1)}, {0: QQ(1), 1: -QQ(1), 2: QQ(2)}, {3: QQ(1)},
+         {0: -QQ(2), 1: QQ(6), 2: QQ(3), 3: -QQ(1)}]]
+
+
+def test_groebner_walk():
+    R, x, y, z = ring('x y z', QQ, grevlex)
+    Rlex = R.clone(order=lex)
+
+    F = [x**2 - y*z, x*y - z**2, y**2 - x*z]
+    G = groebner(F, R)
+
+    assert groebner_walk(G, R, lex) == groebner([f.set_ring(Rlex) for f in F], Rlex)
+
+    F = [x**2*y - z**3, x*z**2 - y**2 + z, y*z - x]
+    G = groebner(F, R)
+
+    assert groebner_walk(G, R, lex) == groebner([f.set_ring(Rlex) for f in F], Rlex)
+    assert groebner_walk(G, R, grlex) == groebner([f.set_ring(R.clone(order=grlex)) for f in F],
+                                                  R.clone(order=grlex))
+
+    R, x, y = ring('x y', QQ, grlex)
+
+    G = [x**3 - y**3]
+
+    assert groebner_walk(G, R, lex) == [(x**3 - y**3).set_ring(R.clone(order=lex))]
+    pytest.raises(NotImplementedError, lambda: groebner_walk(G, R, ilex))
+
+    R, x, y, z = ring('x y z', QQ, grevlex)
+
+    G = [x**2*y - z**3, x*z**2 - y**2 + z, y*z - x]
+
+    pytest.raises(ValueError, lambda: groebner_walk(G, R, lex))
+
+
+def test_matrix_fglm():
+    R, x, y = ring('x y', QQ, grlex)
+
+    assert matrix_fglm([R.one], R, lex) == [R.clone(order=lex).one]
 
 
 def test_groebner_lcm():
@@ -1,7 +1,8 @@
 from diofant import QQ, ZZ, ring, sqrt
 from diofant.polys.modulargcd import (_chinese_remainder_reconstruction,
                                       _func_field_modgcd_m, _to_ANP_poly,
-                                      _to_ZZ_poly)
+                                      _to_ZZ_poly, modgcd)
+from diofant.polys.polyconfig import using
 
 
 __all__ = ()
@@ -31,6 +32,17 @@ def test_chinese_remainder():
     assert hpq.trunc_ground(q) == hq
 
 
+def test_modgcd_workers():
+    R, x, y, z = ring('x y z', ZZ)
+
+    h = x**2*y - 3*y*z + 7
+    f, g = h*(x - 2*z)**2*(y + 11), h*(x*z + 3)*(y + 11)
+
+    for workers in (1, 2):
+        with using(modular_workers=workers):
+            assert modgcd(f, g) == (h*(y + 11), (x - 2*z)**2, x*z + 3)
+
+
 def test_to_ZZ_ANP_poly():
     A = QQ.algebraic_field(sqrt(2))
     R, x = ring('x', A)
@@ -6,6 +6,7 @@
 
 from diofant import Monomial, itermonomials
 from diofant.abc import a, b, c, x, y, z
+from diofant.polys.monomials import MonomialPacker
 
 
 __all__ = ()
@@ -56,6 +57,32 @@ def test_monomial_ops():
     pytest.raises(TypeError, lambda: m6.divides(2*x))
 
 
+def test_MonomialPacker():
+    P = MonomialPacker([7, 0, 8])
+
+    assert P.bits == 5
+    assert P.pack((0, 0, 0)) == 0
+
+    m1, m2 = (3, 0, 4), (1, 0, 2)
+    p1, p2 = P.pack(m1), P.pack(m2)
+
+    assert P.unpack(p1) == m1
+    assert P.unpack(p1 + p2) == (4, 0, 6)
+    assert P.unpack(p1 - p2) == (2, 0, 2)
+    assert (p1 > p2) is (m1 > m2)
+
+    assert P.divides(p2, p1) is True
+    assert P.divides(p1, p2) is False
+    assert P.divides(P.pack((0, 0, 3)), p1) is True
+    assert P.divides(P.pack((0, 0, 5)), p1) is False
+    assert P.divides(P.pack((4, 0, 0)), p1) is False
+
+    P = MonomialPacker([])
+
+    assert P.pack(()) == 0
+    assert P.unpack(0) == ()
+
+
 def test_Monomial():
     m = Monomial((3, 4, 1), (x, y, z))
     l = Monomial((3, 4, 1))
@@ -22,6 +22,7 @@
                      subresultants, symbols, tanh, terms_gcd, true, trunc)
 from diofant.abc import a, b, c, d, p, q, t, w, x, y, z
 from diofant.core.mul import _keep_coeff
+from diofant.polys.polyconfig import using
 from diofant.polys.polytools import to_rational_coeffs
 
 
@@ -2531,6 +2532,24 @@ def test_nroots():
     f = Poly(x**4 - 1)
     assert f.nroots(2) == [w.evalf(2) for w in f.all_roots()]
 
+    with using(aberth_cutoff=1):
+        assert Poly(x**2 - 1, x).nroots() == [-1.0, 1.0]
+        assert Poly(x**2 + 1, x).nroots() == [-1.0*I, 1.0*I]
+        assert Poly(x**2/3 + Rational(1, 3), x).nroots() == [-1.0*I, 1.0*I]
+        assert f.nroots(2) == [w.evalf(2) for w in f.all_roots()]
+        roots = nroots((x**2 - 2)**2*(3*x - 1), n=5)
+        assert [str(_) for _ in roots] == ['-1.4142', '-1.4142', '0.33333',
+                                           '1.4142', '1.4142']
+
+    f = Poly(x**60 - 3*x + 1)
+    roots = f.nroots(n=30)
+
+    assert len(roots) == 60
+    assert sum(_.is_real for _ in roots) == 2
+
+    with using(aberth_cutoff=100):
+        assert roots[:2] == [r.evalf(30) for r in f.real_roots()]
+
 
 def test_cancel():
     assert cancel(0) == 0
@@ -2734,12 +2753,14 @@ def test_groebner():
 
     assert groebner([x**2 - 1, x**3 + 1], method='buchberger') == [x + 1]
     assert groebner([x**2 - 1, x**3 + 1], method='f5b') == [x + 1]
+    assert groebner([x**2 - 1, x**3 + 1], method='f4') == [x + 1]
 
     pytest.raises(ValueError, lambda: groebner([x, y], method='unknown'))
 
     F = [x**2 - x - 1, (2*x - 1) * y - (x**10 - (1 - x)**10)]
     assert groebner(F, x, y, method='buchberger') == [x**2 - x - 1, y - 55]
     assert groebner(F, x, y, method='f5b') == [x**2 - x - 1, y - 55]
+    assert groebner(F, x, y, method='f4') == [x**2 - x - 1, y - 55]
 
     # issue sympy/sympy#11623
     pytest.raises(ValueError,
@@ -2792,7 +2813,11 @@ def test_set_order():
     assert G.set_order(lex) == reversed(B)
 
     G = groebner([x**3 - y**3], x, y, order='grlex')
-    pytest.raises(NotImplementedError, lambda: G.set_order('lex'))
+    assert G.set_order('lex') == groebner([x**3 - y**3], x, y, order='lex')
+
+    F = [x**2 - y*z, x*y - z**2, y**2 - x*z]
+    G = groebner(F, x, y, z, order=grevlex)
+    assert G.set_order(lex) == groebner(F, x, y, z, order=lex)
 
 
 def test_dimension_and_independent_sets():
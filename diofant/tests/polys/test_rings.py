@@ -8,9 +8,10 @@
 from diofant import (EX, FF, QQ, RR, ZZ, CoercionFailed, ExactQuotientFailed,
                      GeneratorsError, GeneratorsNeeded,
                      PolynomialDivisionFailed, PolynomialRing, Rational,
-                     Symbol, field, grlex, lex, oo, pi, ring, sin, sqrt,
-                     symbols)
+                     Symbol, field, grevlex, grlex, lex, oo, pi, ring, sin,
+                     sqrt, symbols)
 from diofant.abc import t, x, y, z
+from diofant.polys.polyconfig import using
 from diofant.polys.rings import PolyElement
 from diofant.polys.specialpolys import f_polys
 
@@ -1190,6 +1191,35 @@ def test_PolyElement___mul__():
 
     assert dict(EX(pi)*x*y*z) == dict(x*y*z*EX(pi)) == {(1, 1, 1): EX(pi)}
 
+    for domain in (ZZ, QQ, FF(3), ZZ.inject('t')):
+        R, x, y, z = ring('x y z', domain)
+
+        f = x**7*y - 2*x*z**3 + 3*y**15 + 1
+        g = x**2 - y*z**8 + 2
+        h = R.from_expr((R.to_expr(f)*R.to_expr(g)).expand())
+        h2 = R.from_expr((R.to_expr(f)**2).expand())
+
+        for method in (True, False):
+            with using(use_packed_monomials=method):
+                assert f*g == g*f == h
+                assert f**2 == f*f == h2
+                assert f*R(0) == R(0)*f == 0
+                assert f*R(1) == f
+
+    for domain in (ZZ, FF(7), FF(2**61 - 1)):
+        R, x, y = ring('x y', domain)
+
+        f = (x - 2*y + 3)**6
+        g = (x*y - y - 2)**5
+        h = R.from_expr((R.to_expr(f)*R.to_expr(g)).expand())
+
+        with using(kronecker_cutoff=1):
+            assert f._use_kronecker(g)
+            assert f*g == g*f == h
+            assert f*(f - f) == 0
+        with using(use_kronecker=False):
+            assert f*g == h
+
 
 def test_PolyElement_mul_ground():
     R, x = ring('x', ZZ)
@@ -1880,6 +1910,32 @@ def test_PolyElement_div():
     assert f.div(G) == (Q, r)
 
 
+@pytest.mark.parametrize('order', [lex, grlex, grevlex])
+@pytest.mark.parametrize('domain', [ZZ, QQ, FF(5), ZZ.inject('t')])
+def test_PolyElement_div_heap(domain, order):
+    R, x, y, z = ring('x y z', domain, order)
+
+    f = (x*y**2 - 3*x*z + y + 2)**3 + z**7 - 1
+    G = [x*y**2 - 3*x*z + y + 2, x - y**5, 2*x**2 - y*z + 2, 2*z**4 + x]
+
+    for g in G:
+        with using(use_heap_division=False):
+            q, r = divmod(f, g)
+        with using(use_heap_division=True):
+            assert divmod(f, g) == (q, r)
+            assert f.div([g]) == ([q], r)
+            assert (f*g).exquo(g) == f
+            assert (f*g).exquo(f) == g
+            if r:
+                pytest.raises(ExactQuotientFailed, lambda: f.exquo(g))
+        with using(use_heap_multiplication=True):
+            assert f*g == q*g*g + r*g
+
+    R, x, y = ring('x y', domain)
+
+    assert divmod(x**2, x - y**5) == (x + y**5, y**10)  # exponent overflow
+
+
 def test_PolyElement_quo_ground():
     R, x = ring('x', ZZ)
 
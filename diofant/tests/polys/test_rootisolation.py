@@ -1,9 +1,11 @@
 """Tests for real and complex root isolation and refinement algorithms."""
 
+import mpmath
 import pytest
 
-from diofant import (EX, QQ, ZZ, DomainError, I, RefinementFailed, prod, ring,
-                     sqrt, subsets)
+from diofant import (EX, QQ, RR, ZZ, DomainError, I, RefinementFailed, prod,
+                     ring, sqrt, subsets)
+from diofant.polys import rootisolation
 from diofant.polys.rootisolation import RealInterval
 
 
@@ -469,6 +471,79 @@ def test__isolate_real_roots_sqf():
              (QQ(218, 89), QQ(49, 20)), (QQ(436, 89), QQ(485, 99))])
 
 
+def test__isolate_real_roots_sqf_cache():
+    R, x = ring('x', QQ)
+
+    f = x**5 - 7*x**3 + x**2 - 3
+    cache = R._cached_isolate_real_roots_sqf
+    cache.cache_clear()
+
+    roots = R._isolate_real_roots_sqf(f)
+
+    assert R._isolate_real_roots_sqf(f) == roots
+    assert cache.cache_info().hits == 1
+    assert R._isolate_real_roots_sqf(f, eps=QQ(1, 100)) != roots
+    assert cache.cache_info().misses == 2
+
+    R._sturm.cache_clear()
+
+    assert R._count_real_roots(f) == R._count_real_roots(f, -3, 3) == 3
+    assert R._sturm.cache_info().hits == 1
+
+
+def test__nroots_sqf(monkeypatch):
+    R, x = ring('x', ZZ)
+
+    roots = R._nroots_sqf(x**3 - x, 53)
+
+    assert sorted(z.real for z, _ in roots) == [-1, 0, 1]
+    assert all(not z.imag and r < 2**-53 for z, r in roots)
+
+    roots = R._nroots_sqf(x**4 + 1, 53)
+
+    assert all(abs(z**4 + 1) < 2**-50 and r < 2**-53 for z, r in roots)
+
+    f = x**60 - 3*x**7 + 5*x - 1
+    roots = R._nroots_sqf(f, 100)
+
+    assert len(roots) == 60
+    assert all(r <= 2**-100*abs(z) for z, r in roots)
+
+    reals = sorted(z.real for z, _ in roots if not z.imag)
+
+    assert len(reals) == R._count_real_roots(f) == 2
+
+    for (a, b), z in zip(R._isolate_real_roots_sqf(f), reals):
+        assert mpmath.mpf(a.numerator)/a.denominator <= z <= mpmath.mpf(b.numerator)/b.denominator
+
+    monkeypatch.setattr(rootisolation, 'import_module', lambda name: None)
+    R._nroots_sqf.cache_clear()
+
+    for (z, r), (w, s) in zip(roots, R._nroots_sqf(f, 100)):
+        assert abs(z - w) <= r + s
+
+    f = prod(x - i for i in range(1, 21))
+    roots = sorted(R._nroots_sqf(f, 53), key=lambda _: _[0].real)
+
+    assert all(abs(z - i) <= r for (z, r), i in zip(roots, range(1, 21)))
+
+    monkeypatch.undo()
+    R._nroots_sqf.cache_clear()
+    roots = sorted(R._nroots_sqf(f, 53), key=lambda _: _[0].real)
+
+    assert all(abs(z - i) <= r for (z, r), i in zip(roots, range(1, 21)))
+
+    assert R._nroots_sqf((x - 1)**2*(x + 2), 53) is None
+
+    R, x = ring('x', QQ)
+
+    assert sorted(z.real for z, _ in R._nroots_sqf(x**2/4 - 1, 53)) == [-2, 2]
+
+    R, x = ring('x', RR)
+
+    pytest.raises(DomainError, lambda: R._nroots_sqf(x**2 - 1, 53))
+
+
 def test__isolate_real_roots():
     R, x = ring('x', ZZ)
 
@@ -8,6 +8,8 @@
                      exp, expand_func, false, legendre_poly, log, oo, root,
                      solve, sqrt, tan, true)
 from diofant.abc import a, b, r, x, y, z
+from diofant.polys.polyconfig import using
+from diofant.polys.rootoftools import _complexes_cache, _reals_cache
 
 
 __all__ = ()
@@ -333,6 +335,55 @@ def test_RootOf_evalf_caching_bug():
     assert a == b
 
 
+def test_RootOf_evalf_aberth():
+    roots = [RootOf(x**3 - x + 1, i) for i in range(3)]
+    values = [r.evalf(30) for r in roots]
+
+    with using(aberth_cutoff=1):
+        assert [r.evalf(30) for r in roots] == values
+
+    r = RootOf(x**60 - 3*x + 1, 1)
+
+    with using(aberth_cutoff=100):
+        value = r.evalf(30)
+
+    assert r.evalf(30) == value
+
+
+def test_RootOf_interval_cache():
+    r = RootOf(x**5 - x + 3, 0)
+    a = r.interval
+
+    r.refine()
+    b = r.interval
+    assert a.a <= b.a < b.b <= a.b
+    assert b.b - b.a < a.b - a.a
+
+    _reals_cache.update(r.poly, 0, a)
+    assert r.interval.as_tuple() != a.as_tuple()
+
+    c = RootOf(x**5 - x + 3, 2)
+    c.refine()
+    c.refine()
+
+    maxsize = _reals_cache.maxsize
+    try:
+        _reals_cache.cache_resize(1)
+        _complexes_cache.cache_resize(1)
+
+        assert RootOf(x**3 - 2*x + 7, 0).interval
+        assert RootOf(x**3 - 2*x + 7, 1).interval
+        assert r.poly not in _reals_cache
+        assert r.poly not in _complexes_cache
+        assert _reals_cache.cache_stats()['evictions'] > 0
+
+        assert str(r.evalf(20)) == '-1.3412935316906992507'
+        assert c.interval
+    finally:
+        _reals_cache.cache_resize(maxsize)
+        _complexes_cache.cache_resize(maxsize)
+
+
 def test_RootOf_real_roots():
     assert Poly(x**5 + x + 1).real_roots() == [RootOf(x**3 - x**2 + 1, 0)]
     assert Poly(x**5 + x + 1).real_roots(radicals=False) == [RootOf(
@@ -1,7 +1,8 @@
 """Tests for low-level linear systems solver."""
 
-from diofant import QQ, ZZ, field, ring, sqrt
-from diofant.polys.solvers import solve_lin_sys
+from diofant import FF, QQ, ZZ, field, ring, sqrt
+from diofant.polys.polyconfig import using
+from diofant.polys.solvers import solve_lin_sys, sparse_rref
 
 
 __all__ = ()
@@ -119,3 +120,43 @@ def test_solve_lin_sys_6x6_2():
     }
 
     assert solve_lin_sys(eqs, domain) == sol
+
+
+def test_solve_lin_sys_modular():
+    domain, x1, x2, x3 = ring('x1 x2 x3', QQ)
+    eqs = [x1 + 2*x2 - x3 - 1, 3*x1 - x2 + QQ(1, 2)*x3, x2 + x3 - 7]
+    sol = solve_lin_sys(eqs, domain)
+
+    assert sol == {x1: QQ(1, 7), x2: QQ(55, 21), x3: QQ(92, 21)}
+
+    with using(modular_linalg_cutoff=1):
+        assert solve_lin_sys(eqs, domain) == sol
+        assert solve_lin_sys(eqs[:2] + [x1 + 2*x2 - x3], domain) is None
+        assert solve_lin_sys(eqs[:2] + [2*x1 + 4*x2 - 2*x3 - 2],
+                             domain) == {x1: QQ(1, 7),
+                                         x2: x3/2 + QQ(3, 7)}
+
+
+def test_sparse_rref():
+    assert sparse_rref([], QQ) == ([], [])
+    assert sparse_rref([{}, {}], QQ) == ([], [])
+
+    rows = [{0: QQ(2), 1: QQ(4), 3: QQ(1)}, {0: QQ(1), 1: QQ(2)},
+            {2: QQ(3), 3: QQ(1)}]
+    assert sparse_rref(rows, QQ) == ([{0: 1, 1: 2}, {2: 1}, {3: 1}],
+                                     [0, 2, 3])
+    assert rows[1] == {0: 1, 1: 2}
+
+
+def test_solve_lin_sys_wiedemann():
+    domain, x1, x2, x3 = ring('x1 x2 x3', FF(65537))
+    eqs = [x1 + 2*x2 - 3, 3*x2 + x3, x1 + x3 - 1]
+    sol = solve_lin_sys(eqs, domain)
+
+    assert sol == {x1: 26217, x2: 52430, x3: 39321}
+
+    with using(wiedemann_cutoff=1):
+        assert solve_lin_sys(eqs, domain) == sol
+        assert solve_lin_sys(eqs[:2] + [x1 + 2*x2 - 2], domain) is None
+        assert solve_lin_sys(eqs[:2] + [2*x1 + 4*x2 - 6],
+                             domain) == {x1: 43692*x3 + 3, x2: 43691*x3}